@@ -0,0 +1,215 @@
+#! /usr/bin/env python
+"""Compare performance benchmark results against the stored baselines.
+
+Run the benchmarks saving their measurements, then compare them to the baselines:
+
+    pytest --no-cov test/benchmarks --benchmark-json=benchmark_results.json
+    python devtools/compare_benchmarks.py benchmark_results.json
+
+A benchmark has regressed if its wall time or peak memory grew by more than the
+allowed tolerance relative to its baseline. The script exits with a non-zero status if
+the peak memory of any benchmark regressed. Wall times depend on the hardware they were
+measured on, so regressions in them are only reported, unless ``--strict`` is given.
+Before comparing wall times strictly, record baselines on the same machine with
+``--update``, which should also be used after an intentional change in performance.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import click
+import pandas as pd
+
+BASELINES_PATH = Path(__file__).parent.parent / "test" / "benchmarks" / "baselines.json"
+
+
+def load_measurements(path: Path) -> pd.DataFrame:
+    """Read a JSON list of benchmark measurements, indexed by benchmark name."""
+    return pd.DataFrame(json.loads(Path(path).read_text())).set_index("name")
+
+
+def compare_measurements(
+    results: pd.DataFrame,
+    baselines: pd.DataFrame,
+    time_tolerance: float,
+    memory_tolerance: float,
+    min_time: float,
+) -> pd.DataFrame:
+    """Compare the wall time and peak memory of each benchmark to its baseline.
+
+    Args:
+        results: new measurements, indexed by benchmark name.
+        baselines: baseline measurements, indexed by benchmark name.
+        time_tolerance: allowed fractional increase in wall time.
+        memory_tolerance: allowed fractional increase in peak memory.
+        min_time: wall times shorter than this many seconds are too noisy to compare,
+            so changes in them are never considered regressions.
+
+    Returns:
+        One row per benchmark and metric with the baseline and new values, their
+        relative change, and a status which is one of "ok", "regressed", "improved",
+        "new" (no baseline) or "missing" (no new measurement).
+    """
+    metrics = {"wall_time_s": time_tolerance, "peak_memory_mb": memory_tolerance}
+    names = results.index.union(baselines.index)
+    rows = []
+    for name in names:
+        for metric, tolerance in metrics.items():
+            baseline = (
+                baselines.loc[name, metric] if name in baselines.index else float("nan")
+            )
+            result = (
+                results.loc[name, metric] if name in results.index else float("nan")
+            )
+            change = result / baseline - 1
+            if pd.isna(baseline):
+                status = "new"
+            elif pd.isna(result):
+                status = "missing"
+            elif metric == "wall_time_s" and max(result, baseline) < min_time:
+                status = "ok"
+            elif change > tolerance:
+                status = "regressed"
+            elif change < -tolerance:
+                status = "improved"
+            else:
+                status = "ok"
+            rows.append(
+                {
+                    "name": name,
+                    "metric": metric,
+                    "baseline": baseline,
+                    "result": result,
+                    "change": change,
+                    "status": status,
+                }
+            )
+    return pd.DataFrame(rows)
+
+
+def update_baselines(results: pd.DataFrame, baselines_path: Path) -> None:
+    """Replace the baselines of the given benchmarks with their new measurements."""
+    baselines = (
+        load_measurements(baselines_path) if baselines_path.exists() else pd.DataFrame()
+    )
+    updated = pd.concat([baselines.drop(results.index, errors="ignore"), results])
+    records = updated.sort_index().reset_index(names="name").to_dict("records")
+    records = [
+        {
+            key: int(value) if key == "rows" else value
+            for key, value in record.items()
+            if pd.notna(value)
+        }
+        for record in records
+    ]
+    baselines_path.write_text(json.dumps(records, indent=2) + "\n")
+
+
+@click.command(
+    context_settings={"help_option_names": ["-h", "--help"]},
+)
+@click.argument(
+    "results_json",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+)
+@click.option(
+    "--baselines",
+    "baselines_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=BASELINES_PATH,
+    show_default=True,
+    help="JSON file containing the baseline benchmark measurements.",
+)
+@click.option(
+    "--time-tolerance",
+    type=float,
+    default=0.5,
+    show_default=True,
+    help="Allowed fractional increase in the wall time of each benchmark.",
+)
+@click.option(
+    "--memory-tolerance",
+    type=float,
+    default=0.2,
+    show_default=True,
+    help="Allowed fractional increase in the peak memory of each benchmark.",
+)
+@click.option(
+    "--min-time",
+    type=float,
+    default=0.1,
+    show_default=True,
+    help="Wall times shorter than this many seconds are never flagged as regressions.",
+)
+@click.option(
+    "--strict",
+    is_flag=True,
+    default=False,
+    help=(
+        "Also fail if wall times regressed. Only meaningful if the baselines were "
+        "recorded on the machine running the comparison."
+    ),
+)
+@click.option(
+    "--update",
+    is_flag=True,
+    default=False,
+    help="Save the results as the new baselines instead of comparing them.",
+)
+def main(
+    results_json: Path,
+    baselines_path: Path,
+    time_tolerance: float,
+    memory_tolerance: float,
+    min_time: float,
+    strict: bool,
+    update: bool,
+):
+    """Compare the benchmark measurements in RESULTS_JSON to the stored baselines."""
+    results = load_measurements(results_json)
+    if update:
+        update_baselines(results, baselines_path)
+        click.echo(f"Updated {len(results)} baselines in {baselines_path}")
+        return
+
+    comparison = compare_measurements(
+        results,
+        load_measurements(baselines_path),
+        time_tolerance=time_tolerance,
+        memory_tolerance=memory_tolerance,
+        min_time=min_time,
+    )
+    with pd.option_context("display.width", 200, "display.max_rows", None):
+        click.echo(
+            comparison.to_string(
+                index=False,
+                formatters={
+                    "baseline": "{:.3f}".format,
+                    "result": "{:.3f}".format,
+                    "change": "{:+.0%}".format,
+                },
+            )
+        )
+    regressed = comparison[comparison.status == "regressed"]
+    failed = regressed[strict | (regressed.metric != "wall_time_s")]
+    if not regressed.empty:
+        click.echo(
+            f"\n{len(regressed)} benchmark measurements regressed: "
+            f"{sorted(set(regressed.name))}",
+            err=True,
+        )
+    if not failed.empty:
+        sys.exit(1)
+    if not regressed.empty:
+        click.echo(
+            "Only wall times regressed, which depend on the hardware, so the "
+            "comparison passes. Use --strict to fail on them.",
+            err=True,
+        )
+        return
+    click.echo("\nNo benchmark regressions found.")
+
+
+if __name__ == "__main__":
+    main()
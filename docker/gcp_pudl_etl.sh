@@ -211,6 +211,7 @@ function clean_up_outputs_for_distribution() {
     gzip --verbose "$PUDL_OUTPUT"/*.sqlite && \
     # Grab the consolidated EPA CEMS outputs for distribution
     cp "$PUDL_OUTPUT/parquet/core_epacems__hourly_emissions.parquet" "$PUDL_OUTPUT" && \
+    cp "$PUDL_OUTPUT/parquet/core_epacems__hourly_emissions_row_groups.parquet" "$PUDL_OUTPUT" && \
     # Remove all other parquet output, which we are not yet distributing.
     rm -rf "$PUDL_OUTPUT/parquet" && \
     rm -f "$PUDL_OUTPUT/metadata.yml"
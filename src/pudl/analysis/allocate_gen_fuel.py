@@ -1098,107 +1098,75 @@ def prep_alloction_fraction(gen_assoc: pd.DataFrame) -> pd.DataFrame:
         ),
     )
 
-    gens_gb_pm_esc = gen_assoc.groupby(by=IDX_PM_ESC, dropna=False)
-    gens_gb_u_esc = gen_assoc.groupby(by=IDX_UNIT_ESC, dropna=False)
-    # get the total values for the merge group
-    # we would use on groupby here with agg but it is much slower
-    # so we're gb-ing twice w/ a merge
-    # gens_gb.agg({'net_generation_mwh_g_tbl': lambda x: x.sum(min_count=1),
-    #              'capacity_mw': lambda x: x.sum(min_count=1),
-    #              'in_g_tbl': 'all'},)
-    gen_pm_fuel = (
-        gen_assoc.merge(  # flag if all generators exist in the core_eia860__scd_generators tbl
-            gens_gb_pm_esc[["in_g_tbl"]].all().reset_index(),
-            on=IDX_PM_ESC,
-            suffixes=("", "_all"),
-        )
-        .merge(  # flag if some generators exist in the core_eia860__scd_generators tbl
-            gens_gb_pm_esc[["in_g_tbl", "more_mwh_in_g_than_gf_tbl"]]
-            .any()
-            .reset_index(),
-            on=IDX_PM_ESC,
-            suffixes=("", "_any"),
-        )
-        .merge(  # flag if all generators exist in the boiler fuel tbl
-            gens_gb_pm_esc[["in_bf_tbl"]].all().reset_index(),
-            on=IDX_PM_ESC,
-            suffixes=("", "_all"),
-        )
-        .merge(  # flag if some generators exist in the boiler fuel tbl
-            gens_gb_pm_esc[["in_bf_tbl"]].any().reset_index(),
-            on=IDX_PM_ESC,
-            suffixes=("", "_any"),
-        )
+    # Integer code the plant-prime-fuel and unit-fuel groups once, then broadcast the
+    # group-wise flags and totals back onto each generator with transforms on those
+    # codes, rather than aggregating each of them and merging them back in.
+    pm_esc = gen_assoc.groupby(by=IDX_PM_ESC, dropna=False, sort=False).ngroup()
+    unit_esc = gen_assoc.groupby(by=IDX_UNIT_ESC, dropna=False, sort=False).ngroup()
+    gens_gb_pm_esc = gen_assoc.groupby(pm_esc)
+    gens_gb_u_esc = gen_assoc.groupby(unit_esc)
+    gen_pm_fuel = gen_assoc.assign(
+        # flag if all/some generators exist in the core_eia860__scd_generators tbl
+        in_g_tbl_all=gens_gb_pm_esc["in_g_tbl"].transform("all"),
+        in_g_tbl_any=gens_gb_pm_esc["in_g_tbl"].transform("any"),
+        more_mwh_in_g_than_gf_tbl_any=gens_gb_pm_esc[
+            "more_mwh_in_g_than_gf_tbl"
+        ].transform("any"),
+        # flag if all/some generators exist in the boiler fuel tbl
+        in_bf_tbl_all=gens_gb_pm_esc["in_bf_tbl"].transform("all"),
+        in_bf_tbl_any=gens_gb_pm_esc["in_bf_tbl"].transform("any"),
         # Net generation and capacity are both proxies that can be used
         # to allocate the generation which only shows up in generation_fuel.
         # fuel consumption from the bf table can be used as a proxy to allocate
         # fuel consumption that only shows up in generation_fuel
         # Sum them up across the whole plant-prime-fuel group so we can tell
         # what fraction of the total capacity each generator is.
-        .merge(
-            (
-                gens_gb_pm_esc[
-                    [
-                        "net_generation_mwh_g_tbl",
-                        "fuel_consumed_mmbtu_bf_tbl",
-                        "capacity_mw",
-                    ]
-                ]
-                .sum(min_count=1)
-                .add_suffix("_pm_fuel")
-                .reset_index()
-            ),
-            on=IDX_PM_ESC,
-        )
-        .merge(
-            (
-                gens_gb_u_esc[
-                    [
-                        "fuel_consumed_mmbtu_bf_tbl",
-                        "capacity_mw",
-                    ]
-                ]
-                .sum(min_count=1)
-                .add_suffix("_unit_fuel")
-                .reset_index()
-            ),
-            on=IDX_UNIT_ESC,
-        )
-        .assign(
-            # fill in the missing generation with small numbers (this will help ensure
-            # the calculations to run the fractions in `allocate_gen_fuel_by_gen_esc`
-            # and `allocate_fuel_by_gen_esc` can be consistent)
-            # do the same with missing fuel consumption
-            fuel_consumed_mmbtu_bf_tbl=lambda x: x.fuel_consumed_mmbtu_bf_tbl.fillna(
-                MISSING_SENTINEL
-            ),
-            net_generation_mwh_g_tbl_pm_fuel=lambda x: x.net_generation_mwh_g_tbl_pm_fuel.fillna(
-                MISSING_SENTINEL
-            ),
-            fuel_consumed_mmbtu_bf_tbl_pm_fuel=lambda x: x.fuel_consumed_mmbtu_bf_tbl_pm_fuel.fillna(
-                MISSING_SENTINEL
-            ),
-            fuel_consumed_mmbtu_bf_tbl_unit_fuel=lambda x: x.fuel_consumed_mmbtu_bf_tbl_unit_fuel.fillna(
-                MISSING_SENTINEL
-            ),
-        )
+        **gens_gb_pm_esc[
+            [
+                "net_generation_mwh_g_tbl",
+                "fuel_consumed_mmbtu_bf_tbl",
+                "capacity_mw",
+            ]
+        ]
+        .transform("sum", min_count=1)
+        .add_suffix("_pm_fuel"),
+        **gens_gb_u_esc[
+            [
+                "fuel_consumed_mmbtu_bf_tbl",
+                "capacity_mw",
+            ]
+        ]
+        .transform("sum", min_count=1)
+        .add_suffix("_unit_fuel"),
+    ).assign(
+        # fill in the missing generation with small numbers (this will help ensure
+        # the calculations to run the fractions in `allocate_gen_fuel_by_gen_esc`
+        # and `allocate_fuel_by_gen_esc` can be consistent)
+        # do the same with missing fuel consumption
+        fuel_consumed_mmbtu_bf_tbl=lambda x: x.fuel_consumed_mmbtu_bf_tbl.fillna(
+            MISSING_SENTINEL
+        ),
+        net_generation_mwh_g_tbl_pm_fuel=lambda x: x.net_generation_mwh_g_tbl_pm_fuel.fillna(
+            MISSING_SENTINEL
+        ),
+        fuel_consumed_mmbtu_bf_tbl_pm_fuel=lambda x: x.fuel_consumed_mmbtu_bf_tbl_pm_fuel.fillna(
+            MISSING_SENTINEL
+        ),
+        fuel_consumed_mmbtu_bf_tbl_unit_fuel=lambda x: x.fuel_consumed_mmbtu_bf_tbl_unit_fuel.fillna(
+            MISSING_SENTINEL
+        ),
     )
     # Add a column that indicates how much capacity comes from generators that
     # report in the generation table, and how much comes only from generators
     # that show up in the generation_fuel table.
-    gen_pm_fuel = pd.merge(
-        gen_pm_fuel,
-        gen_pm_fuel.groupby(by=IDX_PM_ESC + ["in_g_tbl"], dropna=False)[["capacity_mw"]]
-        .sum(min_count=1)
-        .add_suffix("_in_g_tbl_group")
-        .reset_index(),
-        on=IDX_PM_ESC + ["in_g_tbl"],
-    )
+    gen_pm_fuel["capacity_mw_in_g_tbl_group"] = gen_pm_fuel.groupby(
+        [pm_esc, gen_pm_fuel.in_g_tbl]
+    )["capacity_mw"].transform("sum", min_count=1)
     gen_pm_fuel["capacity_mw_fuel_in_bf_tbl_group"] = gen_pm_fuel.groupby(
-        IDX_PM_ESC + ["in_bf_tbl"], dropna=False
-    )[["capacity_mw"]].transform("sum", min_count=1)
+        [pm_esc, gen_pm_fuel.in_bf_tbl]
+    )["capacity_mw"].transform("sum", min_count=1)
 
-    return gen_pm_fuel
+    return gen_pm_fuel.reset_index(drop=True)
 
 
 def allocate_gen_fuel_by_gen_esc(gen_pm_fuel: pd.DataFrame) -> pd.DataFrame:
@@ -1216,42 +1184,39 @@ def allocate_gen_fuel_by_gen_esc(gen_pm_fuel: pd.DataFrame) -> pd.DataFrame:
 
     Each different type of generator needs to be treated slightly differently,
     but all will end up with a ``frac`` column that can be used to allocate
-    the ``net_generation_mwh_gf_tbl``.
+    the ``net_generation_mwh_gf_tbl``. The fractions of all three types are
+    calculated together, and the records are returned grouped by type.
 
     Args:
         gen_pm_fuel: output of :func:``prep_alloction_fraction()``.
     """
     # break out the table into these four different generator types and assign a category
-    all_mask = gen_pm_fuel.in_g_tbl_all | gen_pm_fuel.more_mwh_in_g_than_gf_tbl_any
-    all_gen = gen_pm_fuel.loc[all_mask].assign(net_gen_alloc_cat="all_gen")
-    some_gen = gen_pm_fuel.loc[gen_pm_fuel.in_g_tbl_any & ~all_mask].assign(
-        net_gen_alloc_cat="some_gen"
-    )
-    gf_only = gen_pm_fuel.loc[~gen_pm_fuel.in_g_tbl_any].assign(
-        net_gen_alloc_cat="gf_only"
-    )
+    all_gen = gen_pm_fuel.in_g_tbl_all | gen_pm_fuel.more_mwh_in_g_than_gf_tbl_any
+    some_gen = gen_pm_fuel.in_g_tbl_any & ~all_gen
+    gf_only = ~gen_pm_fuel.in_g_tbl_any
 
     logger.info(
         "Ratio calc types: \n"
-        f"   All gens w/in generation table:  {len(all_gen)}#, {all_gen.capacity_mw.sum():.2} MW\n"
-        f"   Some gens w/in generation table: {len(some_gen)}#, {some_gen.capacity_mw.sum():.2} MW\n"
-        f"   No gens w/in generation table:   {len(gf_only)}#, {gf_only.capacity_mw.sum():.2} MW"
+        f"   All gens w/in generation table:  {all_gen.sum()}#, {gen_pm_fuel.capacity_mw[all_gen].sum():.2} MW\n"
+        f"   Some gens w/in generation table: {some_gen.sum()}#, {gen_pm_fuel.capacity_mw[some_gen].sum():.2} MW\n"
+        f"   No gens w/in generation table:   {gf_only.sum()}#, {gen_pm_fuel.capacity_mw[gf_only].sum():.2} MW"
     )
-    if len(gen_pm_fuel) != len(all_gen) + len(some_gen) + len(gf_only):
+    if len(gen_pm_fuel) != all_gen.sum() + some_gen.sum() + gf_only.sum():
         raise AssertionError(
             "Error in splitting the gens between records showing up fully, "
             "partially, or not at all in the generation table."
         )
-
-    # In the case where we have all of teh generation from the generation
-    # table, we still allocate, because the generation reported in these two
-    # tables don't always match perfectly
-    all_gen = all_gen.assign(
-        frac_net_gen=lambda x: x.net_generation_mwh_g_tbl
-        / x.net_generation_mwh_g_tbl_pm_fuel,
-        frac=lambda x: x.frac_net_gen,
+    # Calculate the fractions of all three types of generators at once, but keep the
+    # records of each type together, in the same order as if they were done separately.
+    order = np.argsort(np.select([all_gen, some_gen], [0, 1], default=2), kind="stable")
+    all_gen, some_gen, gf_only = (
+        mask.iloc[order] for mask in (all_gen, some_gen, gf_only)
+    )
+    net_gen_alloc = gen_pm_fuel.iloc[order].assign(
+        net_gen_alloc_cat=np.select(
+            [all_gen, some_gen], ["all_gen", "some_gen"], default="gf_only"
+        )
     )
-    # _ = _test_frac(all_gen)
 
     # a brief explaination of the equations below
     # input definitions:
@@ -1263,43 +1228,58 @@ def allocate_gen_fuel_by_gen_esc(gen_pm_fuel: pd.DataFrame) -> pd.DataFrame:
     # z = ng * ngt (fraction of generation from generation table by generator)
     # g = y * z  (fraction of generation reporting in generation table by generator - frac_gen)
 
-    some_gen = some_gen.assign(
+    net_gen_alloc = net_gen_alloc.assign(
+        # In the case where we have all of teh generation from the generation
+        # table, we still allocate, because the generation reported in these two
+        # tables don't always match perfectly. The generators in the "some gen"
+        # groups that do have net gen in the generation table get the same fraction.
+        frac_net_gen=lambda x: (
+            x.net_generation_mwh_g_tbl / x.net_generation_mwh_g_tbl_pm_fuel
+        ).where(~gf_only),
         # fraction of the generation that should go to the generators that
         # report in the generation table
-        frac_from_g_tbl=lambda x: np.where(
-            (x.net_generation_mwh_g_tbl_pm_fuel / x.net_generation_mwh_gf_tbl) < 1,
-            (x.net_generation_mwh_g_tbl_pm_fuel / x.net_generation_mwh_gf_tbl),
-            1,
-        ),
-        # for records within these mix groups that do have net gen in the
-        # generation table..
-        frac_net_gen=lambda x: x.net_generation_mwh_g_tbl
-        / x.net_generation_mwh_g_tbl_pm_fuel,  # generator based net gen from gen table
+        frac_from_g_tbl=lambda x: pd.Series(
+            np.where(
+                (x.net_generation_mwh_g_tbl_pm_fuel / x.net_generation_mwh_gf_tbl) < 1,
+                (x.net_generation_mwh_g_tbl_pm_fuel / x.net_generation_mwh_gf_tbl),
+                1,
+            ),
+            index=x.index,
+        ).where(some_gen),
         frac_gen=lambda x: x.frac_net_gen * x.frac_from_g_tbl,
         # fraction of generation that does not show up in the generation table
         frac_missing_from_g_tbl=lambda x: 1 - x.frac_from_g_tbl,
-        capacity_mw_missing_from_g_tbl=lambda x: np.where(x.in_g_tbl, 0, x.capacity_mw),
-        frac_cap=lambda x: x.frac_missing_from_g_tbl
-        * (x.capacity_mw_missing_from_g_tbl / x.capacity_mw_in_g_tbl_group),
+        capacity_mw_missing_from_g_tbl=lambda x: x.capacity_mw.mask(
+            x.in_g_tbl, 0
+        ).where(some_gen),
+        # For generators which don't report to the generation table at all,
+        # calculate what fraction of the total capacity is associated with each of
+        # the generators in the grouping.
+        frac_cap=lambda x: (
+            x.frac_missing_from_g_tbl
+            * (x.capacity_mw_missing_from_g_tbl / x.capacity_mw_in_g_tbl_group)
+        ).where(some_gen, (x.capacity_mw / x.capacity_mw_pm_fuel).where(gf_only)),
         # the real deal
-        # this could aslo be `x.frac_gen + x.frac_cap` because the frac_gen
-        # should be 0 for any generator that does not have net gen in the g_tbl
-        # and frac_cap should be 0 for any generator that has net gen in the
+        # for "some gen" this could aslo be `x.frac_gen + x.frac_cap` because the
+        # frac_gen should be 0 for any generator that does not have net gen in the
+        # g_tbl and frac_cap should be 0 for any generator that has net gen in the
         # g_tbl.
-        frac=lambda x: np.where(x.in_g_tbl, x.frac_gen, x.frac_cap),
-    )
-    # _ = _test_frac(some_gen)
-
-    # Calculate what fraction of the total capacity is associated with each of
-    # the generators in the grouping.
-    gf_only = gf_only.assign(
-        frac_cap=lambda x: x.capacity_mw / x.capacity_mw_pm_fuel,
-        frac=lambda x: x.frac_cap,
-    )
-    # _ = _test_frac(gf_only)
-
-    # squish all of these methods back together.
-    net_gen_alloc = pd.concat([all_gen, some_gen, gf_only])
+        frac=lambda x: x.frac_net_gen.where(
+            all_gen, x.frac_gen.where(x.in_g_tbl & some_gen, x.frac_cap)
+        ),
+    )[
+        list(gen_pm_fuel.columns)
+        + [
+            "net_gen_alloc_cat",
+            "frac_net_gen",
+            "frac",
+            "frac_from_g_tbl",
+            "frac_gen",
+            "frac_missing_from_g_tbl",
+            "capacity_mw_missing_from_g_tbl",
+            "frac_cap",
+        ]
+    ]
     _ = _test_frac(net_gen_alloc)
 
     # replace the placeholder missing values with zero before allocating
@@ -1342,74 +1322,80 @@ def allocate_fuel_by_gen_esc(gen_pm_fuel: pd.DataFrame) -> pd.DataFrame:
         gen_pm_fuel: output of :func:`prep_alloction_fraction`.
     """
     # break out the table into these four different generator types.
-    all_bf = gen_pm_fuel.loc[gen_pm_fuel.in_bf_tbl_all]
-    some_bf = gen_pm_fuel.loc[gen_pm_fuel.in_bf_tbl_any & ~gen_pm_fuel.in_bf_tbl_all]
-    gf_only = gen_pm_fuel.loc[~gen_pm_fuel.in_bf_tbl_any]
+    all_bf = gen_pm_fuel.in_bf_tbl_all
+    some_bf = gen_pm_fuel.in_bf_tbl_any & ~gen_pm_fuel.in_bf_tbl_all
+    gf_only = ~gen_pm_fuel.in_bf_tbl_any
 
     logger.info(
         "Ratio calc types: \n"
-        f"   All gens w/in boiler fuel table:  {len(all_bf)}#, {all_bf.capacity_mw.sum():.2} MW\n"
-        f"   Some gens w/in boiler fuel table: {len(some_bf)}#, {some_bf.capacity_mw.sum():.2} MW\n"
-        f"   No gens w/in boiler fuel table:   {len(gf_only)}#, {gf_only.capacity_mw.sum():.2} MW"
+        f"   All gens w/in boiler fuel table:  {all_bf.sum()}#, {gen_pm_fuel.capacity_mw[all_bf].sum():.2} MW\n"
+        f"   Some gens w/in boiler fuel table: {some_bf.sum()}#, {gen_pm_fuel.capacity_mw[some_bf].sum():.2} MW\n"
+        f"   No gens w/in boiler fuel table:   {gf_only.sum()}#, {gen_pm_fuel.capacity_mw[gf_only].sum():.2} MW"
     )
-    if len(gen_pm_fuel) != len(all_bf) + len(some_bf) + len(gf_only):
+    if len(gen_pm_fuel) != all_bf.sum() + some_bf.sum() + gf_only.sum():
         raise AssertionError(
             "Error in splitting the gens between records showing up fully, "
             "partially, or not at all in the boiler fuel table."
         )
-
-    # In the case where we have all of the fuel from the bf
-    # table, we still allocate, because the fuel reported in these two
-    # tables don't always match perfectly
-    all_bf = all_bf.assign(
-        frac_fuel=lambda x: x.fuel_consumed_mmbtu_bf_tbl
-        / x.fuel_consumed_mmbtu_bf_tbl_pm_fuel,
-        frac=lambda x: x.frac_fuel,
-    )
-    # _ = _test_frac(all_bf)
-
-    some_bf = some_bf.assign(
+    # Calculate the fractions of all three types of generators at once, but keep the
+    # records of each type together, in the same order as if they were done separately.
+    order = np.argsort(np.select([all_bf, some_bf], [0, 1], default=2), kind="stable")
+    all_bf, some_bf, gf_only = (mask.iloc[order] for mask in (all_bf, some_bf, gf_only))
+    fuel_alloc = gen_pm_fuel.iloc[order].assign(
+        # In the case where we have all of the fuel from the bf
+        # table, we still allocate, because the fuel reported in these two
+        # tables don't always match perfectly. The generators in the "some bf"
+        # groups that do have fuel consumption in the bf table get the same fraction.
+        frac_fuel=lambda x: (
+            x.fuel_consumed_mmbtu_bf_tbl / x.fuel_consumed_mmbtu_bf_tbl_pm_fuel
+        ).where(~gf_only),
         # fraction of the fuel consumption that should go to the generators that
         # report in the boiler fuel table
-        frac_from_bf_tbl=lambda x: np.where(
-            (x.fuel_consumed_mmbtu_bf_tbl_pm_fuel / x.fuel_consumed_mmbtu_gf_tbl) < 1,
-            (x.fuel_consumed_mmbtu_bf_tbl_pm_fuel / x.fuel_consumed_mmbtu_gf_tbl),
-            1,
-        ),
-        # for records within these mix groups that do have fuel consumption in the
-        # bf table..
-        frac_fuel=lambda x: x.fuel_consumed_mmbtu_bf_tbl
-        / x.fuel_consumed_mmbtu_bf_tbl_pm_fuel,  # generator based fuel from bf table
+        frac_from_bf_tbl=lambda x: pd.Series(
+            np.where(
+                (x.fuel_consumed_mmbtu_bf_tbl_pm_fuel / x.fuel_consumed_mmbtu_gf_tbl)
+                < 1,
+                (x.fuel_consumed_mmbtu_bf_tbl_pm_fuel / x.fuel_consumed_mmbtu_gf_tbl),
+                1,
+            ),
+            index=x.index,
+        ).where(some_bf),
         frac_bf=lambda x: x.frac_fuel * x.frac_from_bf_tbl,
         # fraction of fuel that does not show up in the bf table
         # set minimum fraction to zero so we don't get negative fuel
-        frac_missing_from_bf_tbl=lambda x: np.where(
-            (x.frac_from_bf_tbl < 1), (1 - x.frac_from_bf_tbl), 0
-        ),
-        capacity_mw_missing_from_bf_tbl=lambda x: np.where(
-            x.in_bf_tbl, 0, x.capacity_mw
-        ),
-        frac_cap=lambda x: x.frac_missing_from_bf_tbl
-        * (x.capacity_mw_missing_from_bf_tbl / x.capacity_mw_fuel_in_bf_tbl_group),
+        frac_missing_from_bf_tbl=lambda x: (1 - x.frac_from_bf_tbl)
+        .where(x.frac_from_bf_tbl < 1, 0)
+        .where(some_bf),
+        capacity_mw_missing_from_bf_tbl=lambda x: x.capacity_mw.mask(
+            x.in_bf_tbl, 0
+        ).where(some_bf),
+        # For generators which don't report to the bf table at all, calculate what
+        # fraction of the total capacity is associated with each of the generators
+        # in the grouping.
+        frac_cap=lambda x: (
+            x.frac_missing_from_bf_tbl
+            * (x.capacity_mw_missing_from_bf_tbl / x.capacity_mw_fuel_in_bf_tbl_group)
+        ).where(some_bf, (x.capacity_mw / x.capacity_mw_pm_fuel).where(gf_only)),
         # the real deal
-        # this could aslo be `x.frac_bf + x.frac_cap` because the frac_bf
-        # should be 0 for any generator that does not have fuel in the bf_tbl
+        # for "some bf" this could aslo be `x.frac_bf + x.frac_cap` because the
+        # frac_bf should be 0 for any generator that does not have fuel in the bf_tbl
         # and frac_cap should be 0 for any generator that has fuel in the
         # bf_tbl.
-        frac=lambda x: np.where(x.in_bf_tbl, x.frac_bf, x.frac_cap),
-    )
-    # _ = _test_frac(some_bf)
-
-    # Calculate what fraction of the total capacity is associated with each of
-    # the generators in the grouping.
-    gf_only = gf_only.assign(
-        frac_cap=lambda x: x.capacity_mw / x.capacity_mw_pm_fuel,
-        frac=lambda x: x.frac_cap,
-    )
-    # _ = _test_frac(gf_only)
-
-    # squish all of these methods back together.
-    fuel_alloc = pd.concat([all_bf, some_bf, gf_only])
+        frac=lambda x: x.frac_fuel.where(
+            all_bf, x.frac_bf.where(x.in_bf_tbl & some_bf, x.frac_cap)
+        ),
+    )[
+        list(gen_pm_fuel.columns)
+        + [
+            "frac_fuel",
+            "frac",
+            "frac_from_bf_tbl",
+            "frac_bf",
+            "frac_missing_from_bf_tbl",
+            "capacity_mw_missing_from_bf_tbl",
+            "frac_cap",
+        ]
+    ]
     # _ = _test_frac(fuel_alloc)
 
     # replace the placeholder missing values with zero before allocating
@@ -1497,7 +1483,7 @@ def distribute_annually_reported_data_to_months_if_annual(
     reporting in only one month that is not January or December, the assumption about
     January and December only reporting is almost certainly resulting in some non-annual
     data being allocated across all months, but on average the data will be more
-    accruate.
+    accruate. See :func:`pudl.helpers.distribute_annually_reported_data_to_months`.
 
     Note: We should be able to use the ``reporting_frequency_code`` column for the
     identification of annually reported data. This currently does not work because we
@@ -1518,93 +1504,8 @@ def distribute_annually_reported_data_to_months_if_annual(
         df with the annually reported values allocated to each month
     """
     if freq == "MS":
-
-        def assign_plant_year(df):
-            return df.assign(
-                plant_year=lambda x: x.report_date.dt.year.astype(str)
-                + "_"
-                + x.plant_id_eia.astype(str)
-            )
-
-        reporters = df.copy().pipe(assign_plant_year)
-        # get a count of the number of missing values in a year
-        key_columns_annual = ["plant_year"] + [
-            col for col in key_columns if col != "report_date"
-        ]
-        reporters["missing_data"] = (
-            reporters.assign(
-                missing_data=lambda x: x[data_column_name].isnull()
-                | np.isclose(reporters[data_column_name], 0)
-            )
-            .groupby(key_columns_annual, dropna=False)[["missing_data"]]
-            .transform("sum")
-        )
-
-        # seperate annual and monthly reporters
-        once_a_year_reporters = reporters[
-            (
-                reporters[data_column_name].notnull()
-                & ~np.isclose(reporters[data_column_name], 0)
-            )
-            & (reporters.missing_data == 11)
-        ]
-        annual_reporters = once_a_year_reporters[
-            once_a_year_reporters.report_date.dt.month.isin([1, 12])
-        ].set_index(["plant_year"])
-
-        # check if the plurality of the once_a_year_reporters are in Jan or Dec
-        perc_of_annual = len(annual_reporters) / len(once_a_year_reporters)
-        if perc_of_annual < 0.40:
-            logger.warning(
-                f"Less than 40% ({perc_of_annual:.0%}) of the once-a-year reporters "
-                "are in January or December. Examine assumption about annual reporters."
-            )
-
-        reporters = reporters.set_index(["plant_year"])
-        monthly_reporters = reporters.loc[
-            reporters.index.difference(annual_reporters.index)
-        ]
-
-        logger.info(
-            f"Distributing {len(annual_reporters)/len(reporters):.1%} annually reported"
-            " records to months."
-        )
-        # first convert the december month to january bc expand_timeseries expands from
-        # the start date and we want january on.
-        annual_reporters_expanded = (
-            annual_reporters.assign(
-                report_date=lambda x: pd.to_datetime(
-                    {
-                        "year": x.report_date.dt.year,
-                        "month": 1,
-                        "day": 1,
-                    },
-                )
-            )
-            .pipe(
-                pudl.helpers.expand_timeseries,
-                key_cols=[col for col in key_columns if col != "report_date"],
-                date_col="report_date",
-                fill_through_freq="year",
-            )
-            .assign(**{data_column_name: lambda x: x[data_column_name] / 12})
-            .pipe(assign_plant_year)
-            .pipe(apply_pudl_dtypes, group="eia")
-            .set_index(["plant_year"])
-        )
-        # sometimes a plant oscillates btwn annual and monthly reporting. when it does
-        # expand_timeseries will generate monthly records for years that were not
-        # included annual_reporters bc expand_timeseries expands from the most recent
-        # to the last date... so we remove any plant/year combo that didn't show up
-        # before the expansion
-        annual_reporters_expanded = annual_reporters_expanded.loc[
-            annual_reporters_expanded.index.intersection(annual_reporters.index)
-        ]
-
-        df_out = (
-            pd.concat([monthly_reporters, annual_reporters_expanded])
-            .reset_index(drop=True)
-            .drop(columns=["missing_data"])
+        df_out = pudl.helpers.distribute_annually_reported_data_to_months(
+            df, key_cols=key_columns, data_col=data_column_name
         )
     elif freq == "YS":
         df_out = df
@@ -473,12 +473,13 @@ def fuel_cost(
     # plant's overall costs).
 
     one_fuel_gb = one_fuel.groupby(by=["report_date", "plant_id_eia"])
-    one_fuel_agg = one_fuel_gb.agg(
+    one_fuel_agg = pudl.helpers.groupby_agg(
+        one_fuel_gb,
         {
             "total_fuel_cost": pudl.helpers.sum_na,
             "fuel_consumed_mmbtu": pudl.helpers.sum_na,
             "fuel_cost_from_eiaapi": "any",
-        }
+        },
     )
     one_fuel_agg["fuel_cost_per_mmbtu"] = (
         one_fuel_agg["total_fuel_cost"] / one_fuel_agg["fuel_consumed_mmbtu"]
@@ -178,6 +178,7 @@ OR make the table via objects in this module:
 """
 
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from importlib import resources
 from pathlib import Path
@@ -185,7 +186,7 @@ from typing import Literal
 
 import numpy as np
 import pandas as pd
-from dagster import asset
+from dagster import Field, asset
 
 import pudl
 from pudl.metadata.classes import Resource
@@ -384,8 +385,19 @@ def out_eia__yearly_generators_by_ownership(
     io_manager_key="pudl_io_manager",
     compute_kind="Python",
     op_tags={"memory-use": "high"},
+    config_schema={
+        "max_workers": Field(
+            int,
+            default_value=1,
+            description=(
+                "Number of threads used to build the plant parts. "
+                "Plant parts are built serially if 1."
+            ),
+        ),
+    },
 )
 def out_eia__yearly_plant_parts(
+    context,
     out_eia__yearly_generators_by_ownership: pd.DataFrame,
     out_eia__yearly_plants: pd.DataFrame,
     out_eia__yearly_utilities: pd.DataFrame,
@@ -395,6 +407,7 @@ def out_eia__yearly_plant_parts(
         gens_mega=out_eia__yearly_generators_by_ownership,
         plants_eia860=out_eia__yearly_plants,
         utils_eia860=out_eia__yearly_utilities,
+        max_workers=context.op_config["max_workers"],
     )
 
 
@@ -618,28 +631,29 @@ class MakePlantParts:
         # for all of the plant parts
         self.id_cols_list = make_id_cols_list()
 
-    def execute(self, gens_mega, plants_eia860, utils_eia860):
+    def execute(self, gens_mega, plants_eia860, utils_eia860, max_workers: int = 1):
         """Aggregate and slice data points by each plant part.
 
+        The plant parts don't depend on each other, so they can be built
+        concurrently by passing ``max_workers`` greater than 1.
+
         Returns:
             pandas.DataFrame: The complete plant parts list
         """
         # aggregate everything by each plant part
-        part_dfs = []
-        for part_name in PLANT_PARTS:
-            if part_name == "plant_match_ferc1":
-                continue
-            part_df = PlantPart(part_name).execute(gens_mega)
-            # add in the attributes!
-            part_df = self.add_attributes(part_df, gens_mega, part_name)
-            # assert that all the plant part ID columns are now in part_df
-            assert {
-                col
-                for part in PLANT_PARTS
-                if part != "plant_match_ferc1"
-                for col in PLANT_PARTS[part]["id_cols"]
-            }.issubset(part_df.columns)
-            part_dfs.append(part_df)
+        part_names = [part for part in PLANT_PARTS if part != "plant_match_ferc1"]
+        if max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                part_dfs = list(
+                    executor.map(
+                        lambda part_name: self.make_part(gens_mega, part_name),
+                        part_names,
+                    )
+                )
+        else:
+            part_dfs = [
+                self.make_part(gens_mega, part_name) for part_name in part_names
+            ]
         plant_parts_eia = pd.concat(part_dfs)
 
         # Add in 1:m matches.
@@ -664,6 +678,20 @@ class MakePlantParts:
         )
         return self.plant_parts_eia
 
+    def make_part(self, gens_mega: pd.DataFrame, part_name: str) -> pd.DataFrame:
+        """Aggregate gens_mega to one plant part and add its attributes."""
+        part_df = PlantPart(part_name).execute(gens_mega)
+        # add in the attributes!
+        part_df = self.add_attributes(part_df, gens_mega, part_name)
+        # assert that all the plant part ID columns are now in part_df
+        assert {
+            col
+            for part in PLANT_PARTS
+            if part != "plant_match_ferc1"
+            for col in PLANT_PARTS[part]["id_cols"]
+        }.issubset(part_df.columns)
+        return part_df
+
     #######################################
     # Add Entity Columns and Final Cleaning
     #######################################
@@ -704,7 +732,7 @@ class MakePlantParts:
         ]
 
         if plant_parts_eia_filt.empty:  # If 1:m matches not in plant_part subset
-            PLANT_PARTS.pop("plant_match_ferc1")  # Remove from rest of workflow
+            PLANT_PARTS.pop("plant_match_ferc1", None)  # Remove from rest of workflow
             return plant_parts_eia
 
         # Get the 'm' generator IDs 1:m
@@ -823,11 +851,15 @@ class MakePlantParts:
         ]
 
     def add_attributes(self, part_df, attribute_df, part_name):
-        """Add constant and min/max attributes to plant parts."""
-        for attribute_col in CONSISTENT_ATTRIBUTE_COLS:
-            part_df = AddConsistentAttributes(attribute_col, part_name).execute(
-                part_df, attribute_df
-            )
+        """Add constant and min/max attributes to plant parts.
+
+        All of the consistent attributes are found with a single grouped aggregation
+        of ``attribute_df`` by the base columns of the plant part, rather than one
+        aggregation per attribute.
+        """
+        part_df = AddConsistentAttributes.execute_many(
+            part_df, attribute_df, part_name, CONSISTENT_ATTRIBUTE_COLS
+        )
         for attribute_col in PRIORITY_ATTRIBUTES_DICT:
             part_df = AddPriorityAttribute(attribute_col, part_name).execute(
                 part_df, attribute_df
@@ -1213,6 +1245,20 @@ class AddAttribute:
             return gens_mega.assign(**self.assign_col_dict)
         return gens_mega
 
+    def get_attribute_df(self, gens_mega: pd.DataFrame) -> pd.DataFrame:
+        """Select the base columns and the (assigned) attribute column of gens_mega.
+
+        Unlike :meth:`assign_col` this doesn't copy all of gens_mega.
+        """
+        if (
+            self.assign_col_dict is not None
+            and self.attribute_col in self.assign_col_dict
+        ):
+            attribute = self.assign_col_dict[self.attribute_col](gens_mega)
+        else:
+            attribute = gens_mega[self.attribute_col]
+        return gens_mega[self.base_cols].assign(**{self.attribute_col: attribute})
+
 
 class AddConsistentAttributes(AddAttribute):
     """Adder of attributes records to a plant-part table."""
@@ -1255,15 +1301,48 @@ class AddConsistentAttributes(AddAttribute):
             logger.debug(f"{attribute_col} already here.. ")
             return part_df
 
-        record_df = gens_mega.copy()
-        record_df = self.assign_col(record_df)
-
-        consistent_records = self.get_consistent_qualifiers(record_df)
+        consistent_records = self.get_consistent_qualifiers(self.assign_col(gens_mega))
 
         non_nulls = consistent_records[consistent_records[attribute_col].notnull()]
         logger.debug(f"merging in consistent {attribute_col}: {len(non_nulls)}")
         return part_df.merge(consistent_records, how="left")
 
+    @classmethod
+    def execute_many(
+        cls,
+        part_df: pd.DataFrame,
+        gens_mega: pd.DataFrame,
+        part_name: str,
+        attribute_cols: list[str],
+    ) -> pd.DataFrame:
+        """Add several consistent attributes to a plant-part table at once.
+
+        This is equivalent to calling :meth:`execute` for each of the attribute columns
+        in turn, but groups ``gens_mega`` by the base columns of the plant part only
+        once and finds all of the consistent attributes in the same aggregation.
+
+        Args:
+            part_df: dataframe containing records associated with one plant part.
+            gens_mega: a table of all of the generators with identifying columns and
+                data columns, sliced by ownership which makes "total" and "owned"
+                records for each generator owner.
+            part_name: the name of the plant part of ``part_df``.
+            attribute_cols: names of the attributes to add. Attributes which are
+                already in ``part_df`` are left as they are.
+        """
+        attribute_cols = [col for col in attribute_cols if col not in part_df.columns]
+        if not attribute_cols:
+            return part_df
+        base_cols = cls(attribute_cols[0], part_name).base_cols
+        consistent_records = get_consistent_attributes(
+            gens_mega, base_cols, attribute_cols
+        )
+        logger.debug(
+            f"merging in consistent {attribute_cols}: "
+            f"{consistent_records[attribute_cols].notnull().sum().to_dict()}"
+        )
+        return part_df.merge(consistent_records, how="left", on=base_cols)
+
     def get_consistent_qualifiers(self, record_df):
         """Get fully consistent qualifier records.
 
@@ -1277,28 +1356,12 @@ class AddConsistentAttributes(AddAttribute):
             base_cols (list) : list of identifying columns.
             record_name (string) : name of qualitative record
         """
-        # TODO: determine if we can move this up the chain so we can do this
-        # once per plant-part, not once per plant-part * qualifer record
-        attribute_col = self.attribute_col
-        base_cols = self.base_cols
-        entity_count_df = pudl.helpers.count_records(
-            record_df, base_cols, "entity_occurences"
-        ).pipe(pudl.helpers.convert_cols_dtypes, "eia")
-        record_count_df = pudl.helpers.count_records(
-            record_df, base_cols + [attribute_col], "record_occurences"
-        ).pipe(pudl.helpers.convert_cols_dtypes, "eia")
-        re_count = (
-            record_df[base_cols + [attribute_col]]
-            .merge(entity_count_df, how="left", on=base_cols)
-            .merge(record_count_df, how="left", on=base_cols + [attribute_col])
-        )
-        # find all of the matching records..
-        consistent_records = (
-            re_count[re_count["entity_occurences"] == re_count["record_occurences"]]
-            .drop(columns=["entity_occurences", "record_occurences"])
-            .drop_duplicates()
+        consistent_records = get_consistent_attributes(
+            record_df, self.base_cols, [self.attribute_col]
         )
-        return consistent_records
+        return consistent_records[
+            consistent_records[self.attribute_col].notnull()
+        ].reset_index(drop=True)
 
 
 class AddPriorityAttribute(AddAttribute):
@@ -1328,10 +1391,9 @@ class AddPriorityAttribute(AddAttribute):
             logger.debug(f"{attribute_col} already here.. ")
             return part_df
 
-        gens_mega = self.assign_col(gens_mega)
         logger.debug(f"getting max {attribute_col}")
         consistent_records = pudl.helpers.dedupe_on_category(
-            gens_mega.copy()[self.base_cols + [attribute_col]],
+            self.get_attribute_df(gens_mega),
             self.base_cols,
             attribute_col,
             PRIORITY_ATTRIBUTES_DICT[attribute_col],
@@ -1374,11 +1436,9 @@ class AddMaxMinAttribute(AddAttribute):
             return part_df
 
         logger.debug(f"pre count of part DataFrame: {len(part_df)}")
-        gens_mega = self.assign_col(gens_mega)
         new_attribute_df = (
-            gens_mega.astype({attribute_col: att_dtype})[
-                self.base_cols + [attribute_col]
-            ]
+            self.get_attribute_df(gens_mega)
+            .astype({attribute_col: att_dtype})
             .sort_values(attribute_col, ascending=False)
             .drop_duplicates(subset=self.base_cols, keep=keep)
             .dropna(subset=self.base_cols)
@@ -1395,6 +1455,31 @@ class AddMaxMinAttribute(AddAttribute):
 #########################
 
 
+def get_consistent_attributes(
+    gens_mega: pd.DataFrame, base_cols: list[str], attribute_cols: list[str]
+) -> pd.DataFrame:
+    """Find the attributes which are consistent across each group of generators.
+
+    An attribute is consistent within a group of records (e.g. the generators that make
+    up one plant part) when every record in the group reports the same non-null value.
+    Groups with null values in any of their base columns are dropped.
+
+    Args:
+        gens_mega: a table of generator records.
+        base_cols: the columns that identify each group of records.
+        attribute_cols: the attribute columns to check for consistency.
+
+    Returns:
+        A table with one record per group, containing the ``base_cols`` and the
+        ``attribute_cols``. Attributes which aren't consistent within a group are null.
+    """
+    grouped = gens_mega.groupby(base_cols, observed=True, sort=False)[attribute_cols]
+    consistent = (grouped.nunique() == 1) & grouped.count().eq(  # noqa: PD101
+        grouped.size(), axis=0
+    )
+    return grouped.first().where(consistent).reset_index()
+
+
 def make_id_cols_list():
     """Get a list of the id columns (primary keys) for all of the plant parts.
 
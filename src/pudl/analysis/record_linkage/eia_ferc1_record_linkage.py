@@ -175,10 +175,10 @@ def get_input_dfs(inputs):
 def prepare_for_matching(df, transformed_df):
     """Prepare the input dataframes for matching with splink."""
 
-    def _get_metaphone(row, col_name):
-        if pd.isnull(row[col_name]):
-            return None
-        return jellyfish.metaphone(row[col_name])
+    def _get_metaphone(names: pd.Series) -> pd.Series:
+        # Names repeat across report years, so only encode each distinct name once
+        mphones = {name: jellyfish.metaphone(name) for name in names.dropna().unique()}
+        return names.map(mphones).astype(object).where(names.notna(), None)
 
     # replace old cols with transformed cols
     for col in transformed_df.columns:
@@ -186,8 +186,8 @@ def prepare_for_matching(df, transformed_df):
         df[orig_col_name] = transformed_df[col]
     df["installation_year"] = pd.to_datetime(df["installation_year"], format="%Y")
     df["construction_year"] = pd.to_datetime(df["construction_year"], format="%Y")
-    df["plant_name_mphone"] = df.apply(_get_metaphone, axis=1, args=("plant_name",))
-    df["utility_name_mphone"] = df.apply(_get_metaphone, axis=1, args=("utility_name",))
+    df["plant_name_mphone"] = _get_metaphone(df["plant_name"])
+    df["utility_name_mphone"] = _get_metaphone(df["utility_name"])
     cols = ID_COL + MATCHING_COLS + EXTRA_COLS
     df = df.loc[:, cols]
     return df
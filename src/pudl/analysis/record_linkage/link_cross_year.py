@@ -1,16 +1,14 @@
 """Define a record linkage model interface and implement common functionality."""
 
-from pathlib import Path
-from tempfile import TemporaryDirectory
-
 import mlflow
 import numpy as np
 import pandas as pd
+import scipy
 from dagster import Config, graph, op
 from numba import njit
 from numba.typed import List
 from sklearn.cluster import DBSCAN, AgglomerativeClustering
-from sklearn.metrics import pairwise_distances_chunked
+from sklearn.metrics import pairwise_distances
 from sklearn.neighbors import NearestNeighbors
 
 import pudl
@@ -29,64 +27,69 @@ class PenalizeReportYearDistanceConfig(Config):
 
     distance_penalty: float = 10000.0
     metric: str = "euclidean"
-
-
-class DistanceMatrix:
-    """Class to wrap a distance matrix saved in a np.memmap."""
+    #: Only pairs of records closer than this are stored in the sparse distance graph.
+    #: It must be at least the DBSCAN ``eps`` and twice the ``distance_threshold`` used
+    #: to match orphaned records.
+    radius: float = 1.0
+    #: Number of records whose neighbors are searched for at once.
+    block_size: int = 1000
+
+
+class DistanceGraph:
+    """Class to wrap a sparse graph of distances between records.
+
+    Only pairs of records from different report years which are within ``radius`` of
+    each other are stored, so memory use grows with the number of close neighbors
+    rather than quadratically with the number of records. Distances between any other
+    set of records, including the penalty for records from the same year, are computed
+    on demand from the feature matrix with :meth:`pairwise`.
+    """
 
     def __init__(
         self,
-        feature_matrix: np.ndarray,
+        feature_matrix: np.ndarray | scipy.sparse.csr_matrix,
         original_df: pd.DataFrame,
         config: PenalizeReportYearDistanceConfig,
     ):
-        """Compute distance matrix from feature_matrix and write to memmap."""
-        self.file_buffer = TemporaryDirectory()
-
-        filename = Path(self.file_buffer.name) / "distance_matrix.dat"
-        self.distance_matrix = np.memmap(
-            filename,
-            dtype="float32",
-            mode="w+",
-            shape=(feature_matrix.shape[0], feature_matrix.shape[0]),
-        )
-
-        # Compute distances in chunks and write to memmap
-        row_start = 0
-        for chunk in pairwise_distances_chunked(feature_matrix, metric=config.metric):
-            self.distance_matrix[row_start : row_start + len(chunk), :] = chunk[:, :]
-            self.distance_matrix.flush()
-            row_start += len(chunk)
-
-        # Apply distance penalty to records from the same year
-        year_inds = original_df.groupby("report_year").indices
-        for inds in year_inds.values():
-            matching_year_inds = np.array(np.meshgrid(inds, inds)).T.reshape(-1, 2)
-            self.distance_matrix[matching_year_inds[:, 0], matching_year_inds[:, 1]] = (
-                config.distance_penalty
+        """Search for the neighbors of each record one block at a time."""
+        self.feature_matrix = feature_matrix
+        self.report_years = original_df["report_year"].to_numpy()
+        self.metric = config.metric
+        self.distance_penalty = config.distance_penalty
+        self.radius = config.radius
+
+        neighbor_computer = NearestNeighbors(radius=config.radius, metric=config.metric)
+        neighbor_computer.fit(feature_matrix)
+
+        n_records = feature_matrix.shape[0]
+        blocks = []
+        for start in range(0, n_records, config.block_size):
+            stop = min(start + config.block_size, n_records)
+            block = neighbor_computer.radius_neighbors_graph(
+                feature_matrix[start:stop], mode="distance"
+            ).tocoo()
+            # Records from the same year are always further apart than the radius
+            different_year = (
+                self.report_years[block.row + start] != self.report_years[block.col]
             )
+            blocks.append(
+                scipy.sparse.csr_matrix(
+                    (
+                        block.data[different_year],
+                        (block.row[different_year], block.col[different_year]),
+                    ),
+                    shape=block.shape,
+                )
+            )
+        self.graph = scipy.sparse.vstack(blocks, format="csr")
 
-        np.fill_diagonal(self.distance_matrix, 0)
-        self.distance_matrix.flush()
-
-        # Convert distance matrix to read only memory map
-        self.distance_matrix = np.memmap(
-            filename,
-            dtype="float32",
-            mode="r",
-            shape=(feature_matrix.shape[0], feature_matrix.shape[0]),
-        )
-
-
-def get_cluster_distance_matrix(
-    distance_matrix: np.ndarray, cluster_inds: np.ndarray
-) -> np.ndarray:
-    """Return a distance matrix with only distances within a cluster."""
-    cluster_size = len(cluster_inds)
-    dist_inds = np.array(np.meshgrid(cluster_inds, cluster_inds)).T.reshape(-1, 2)
-    return distance_matrix[dist_inds[:, 0], dist_inds[:, 1]].reshape(
-        (cluster_size, cluster_size)
-    )
+    def pairwise(self, inds: np.ndarray) -> np.ndarray:
+        """Return a dense distance matrix between the records at ``inds``."""
+        distances = pairwise_distances(self.feature_matrix[inds], metric=self.metric)
+        years = self.report_years[inds]
+        distances[years[:, None] == years[None, :]] = self.distance_penalty
+        np.fill_diagonal(distances, 0)
+        return distances
 
 
 @njit
@@ -120,10 +123,10 @@ def compute_distance_with_year_penalty(
     config: PenalizeReportYearDistanceConfig,
     feature_matrix: FeatureMatrix,
     original_df: pd.DataFrame,
-) -> DistanceMatrix:
-    """Compute a distance matrix and penalize records from the same year."""
+) -> DistanceGraph:
+    """Compute a sparse distance graph and penalize records from the same year."""
     logger.info(f"Dist metric: {config.metric}")
-    return DistanceMatrix(feature_matrix.matrix, original_df, config)
+    return DistanceGraph(feature_matrix.matrix, original_df, config)
 
 
 class DBSCANConfig(Config):
@@ -137,14 +140,19 @@ class DBSCANConfig(Config):
 @op
 def cluster_records_dbscan(
     config: DBSCANConfig,
-    distance_matrix: DistanceMatrix,
+    distance_graph: DistanceGraph,
     original_df: pd.DataFrame,
     experiment_tracker: experiment_tracking.ExperimentTracker,
 ) -> pd.DataFrame:
     """Generate initial IDs using DBSCAN algorithm."""
+    if config.eps > distance_graph.radius:
+        raise ValueError(
+            f"DBSCAN eps ({config.eps}) is larger than the radius of the distance "
+            f"graph ({distance_graph.radius})."
+        )
     # DBSCAN is very efficient when passed a sparse radius neighbor graph
     neighbor_computer = NearestNeighbors(radius=config.eps, metric="precomputed")
-    neighbor_computer.fit(distance_matrix.distance_matrix)
+    neighbor_computer.fit(distance_graph.graph)
     neighbor_graph = neighbor_computer.radius_neighbors_graph(mode="distance")
 
     # Classify records
@@ -177,7 +185,7 @@ class SplitClustersConfig(Config):
 @op
 def split_clusters(
     config: SplitClustersConfig,
-    distance_matrix: DistanceMatrix,
+    distance_graph: DistanceGraph,
     id_year_df: pd.DataFrame,
     experiment_tracker: experiment_tracking.ExperimentTracker,
 ) -> pd.DataFrame:
@@ -218,9 +226,7 @@ def split_clusters(
         cluster_inds = id_year_df[
             id_year_df.record_label == duplicated_id
         ].index.to_numpy()
-        cluster_distances = get_cluster_distance_matrix(
-            distance_matrix.distance_matrix, cluster_inds
-        )
+        cluster_distances = distance_graph.pairwise(cluster_inds)
 
         new_labels = classifier.fit_predict(cluster_distances)
         for new_label in np.unique(new_labels):
@@ -248,7 +254,7 @@ class MatchOrphanedRecordsConfig(Config):
 @op(tags={"memory-use": "high"})
 def match_orphaned_records(
     config: MatchOrphanedRecordsConfig,
-    distance_matrix: DistanceMatrix,
+    distance_graph: DistanceGraph,
     id_year_df: pd.DataFrame,
     experiment_tracker: experiment_tracking.ExperimentTracker,
 ) -> pd.DataFrame:
@@ -259,7 +265,18 @@ def match_orphaned_records(
     distance between each cluster, and is used in a round of agglomerative clustering.
     This will match orphaned records to existing clusters, or assign them unique ID's if
     they don't appear close enough to any existing clusters.
+
+    The average distance between two clusters can only be below the distance threshold
+    if at least one pair of their records is closer than twice the threshold. Clusters
+    are grouped into connected components of such pairs using the sparse distance graph
+    and agglomerative clustering is applied to each component separately, which gives
+    the same result as clustering all of them at once without a dense distance matrix.
     """
+    if 2 * config.distance_threshold > distance_graph.radius:
+        raise ValueError(
+            f"Twice the distance threshold ({config.distance_threshold}) is larger "
+            f"than the radius of the distance graph ({distance_graph.radius})."
+        )
     classifier = AgglomerativeClustering(
         metric="precomputed",
         linkage="average",
@@ -270,20 +287,53 @@ def match_orphaned_records(
     cluster_inds = id_year_df.groupby("record_label").indices
 
     # Orphaned records are considered a cluster of a single record
-    cluster_groups = [List([ind]) for ind in cluster_inds.get(-1, [])]
+    cluster_groups = [np.array([ind]) for ind in cluster_inds.get(-1, [])]
 
     # Get list of all points in each assigned cluster
-    cluster_groups += [List(inds) for key, inds in cluster_inds.items() if key != -1]
-    cluster_groups = List(cluster_groups)
+    cluster_groups += [inds for key, inds in cluster_inds.items() if key != -1]
+    group_of_record = np.empty(len(id_year_df), dtype=int)
+    group_of_record[np.concatenate(cluster_groups)] = np.repeat(
+        np.arange(len(cluster_groups)), [len(inds) for inds in cluster_groups]
+    )
 
-    average_dist_matrix = get_average_distance_matrix(
-        distance_matrix.distance_matrix, cluster_groups
+    # Find sets of clusters which could be matched with each other
+    graph = distance_graph.graph.tocoo()
+    close = graph.data < 2 * config.distance_threshold
+    cluster_graph = scipy.sparse.coo_matrix(
+        (
+            np.ones(close.sum()),
+            (group_of_record[graph.row[close]], group_of_record[graph.col[close]]),
+        ),
+        shape=(len(cluster_groups), len(cluster_groups)),
+    )
+    _, component_labels = scipy.sparse.csgraph.connected_components(
+        cluster_graph, directed=False
     )
 
     # Assign new labels to all points
-    new_labels = classifier.fit_predict(average_dist_matrix)
-    for inds, label in zip(cluster_groups, new_labels, strict=True):
-        id_year_df.loc[inds, "record_label"] = label
+    new_labels = np.empty(len(cluster_groups), dtype=int)
+    next_label = 0
+    for groups in (
+        pd.Series(component_labels).groupby(component_labels).indices.values()
+    ):
+        if len(groups) == 1:
+            component_new_labels = np.zeros(1, dtype=int)
+        else:
+            records = np.concatenate([cluster_groups[group] for group in groups])
+            group_ends = np.cumsum([len(cluster_groups[group]) for group in groups])
+            average_dist_matrix = get_average_distance_matrix(
+                distance_graph.pairwise(records),
+                List(
+                    [
+                        List(inds)
+                        for inds in np.split(np.arange(len(records)), group_ends[:-1])
+                    ]
+                ),
+            )
+            component_new_labels = classifier.fit_predict(average_dist_matrix)
+        new_labels[groups] = component_new_labels + next_label
+        next_label += component_new_labels.max() + 1
+    id_year_df["record_label"] = new_labels[group_of_record]
 
     logger.info(
         f"{id_year_df.record_label.nunique()} unique record IDs found after match orphaned records step."
@@ -304,11 +354,11 @@ def link_ids_cross_year(
 ):
     """Apply model and return column of estimated record labels."""
     # Compute distances and apply penalty for records from same year
-    distance_matrix = compute_distance_with_year_penalty(feature_matrix, df)
+    distance_graph = compute_distance_with_year_penalty(feature_matrix, df)
 
     # Label records
-    id_year_df = cluster_records_dbscan(distance_matrix, df, experiment_tracker)
-    id_year_df = split_clusters(distance_matrix, id_year_df, experiment_tracker)
-    id_year_df = match_orphaned_records(distance_matrix, id_year_df, experiment_tracker)
+    id_year_df = cluster_records_dbscan(distance_graph, df, experiment_tracker)
+    id_year_df = split_clusters(distance_graph, id_year_df, experiment_tracker)
+    id_year_df = match_orphaned_records(distance_graph, id_year_df, experiment_tracker)
 
     return id_year_df
@@ -4,9 +4,11 @@ import enum
 import json
 import logging
 import re
+from functools import cache
 from importlib.resources import files
 from typing import Literal
 
+import numpy as np
 import pandas as pd
 from pydantic import BaseModel
 
@@ -56,6 +58,54 @@ class LegalTermLocation(enum.Enum):
     ANYWHERE = 2
 
 
+@cache
+def _compile_cleaning_rules(
+    rule_names: tuple[str, ...],
+) -> list[tuple[str, re.Pattern, str]]:
+    """Compile the named cleaning rules into (name, pattern, replacement) tuples.
+
+    A rule whose regex is the name of another rule is replaced by that rule, which
+    allows the execution of a regex rule twice.
+    """
+    compiled_rules = []
+    for rule_name in rule_names:
+        replacement, regex_rule = CLEANING_RULES_DICT[rule_name]
+        if regex_rule in rule_names:
+            replacement, regex_rule = CLEANING_RULES_DICT[regex_rule]
+        compiled_rules.append((rule_name, re.compile(regex_rule), replacement))
+    return compiled_rules
+
+
+@cache
+def _compile_legal_terms(
+    legal_terms_file: str, json_entry: str, location: LegalTermLocation
+) -> list[tuple[re.Pattern, str]]:
+    """Read the legal terms and compile them into (pattern, replacement) tuples."""
+    # The dictionary of legal terms define how to normalize the text's legal form abreviations
+    json_source = files("pudl.package_data.settings").joinpath(legal_terms_file)
+    with json_source.open() as json_file:
+        dict_legal_terms = json.load(json_file)[json_entry]["en"]
+
+    compiled_terms = []
+    # Each replacement has a list of possible terms to be searched for
+    for replacement, legal_terms in dict_legal_terms.items():
+        replacement = " " + replacement.lower() + " "
+        for legal_term in legal_terms:
+            legal_term = legal_term.lower()
+            # If the legal term has . (dots), then apply regex directly on the legal term
+            # Otherwise, if it's a legal term with only letters in sequence, make sure
+            # that regex find the legal term as a word (\\bLEGAL_TERM\\b)
+            if legal_term.find(".") > -1:
+                legal_term = legal_term.replace(".", "\\.")
+            else:
+                legal_term = "\\b" + legal_term + "\\b"
+            # Check if the legal term should be found only at the end of the string
+            if location == LegalTermLocation.AT_THE_END:
+                legal_term = legal_term + "$"
+            compiled_terms.append((re.compile(legal_term), replacement))
+    return compiled_terms
+
+
 class CompanyNameCleaner(BaseModel):
     """Class to normalize/clean up text based company names."""
 
@@ -101,53 +151,6 @@ class CompanyNameCleaner(BaseModel):
     #: Define if the letters with accents are replaced with non-accented ones
     remove_accents: bool = False
 
-    def _apply_regex_rules(
-        self, str_value: str, dict_regex_rules: dict[str, list[str]]
-    ) -> str:
-        r"""Applies several cleaning rules based on a custom dictionary.
-
-        The dictionary must contain cleaning rules written in regex format.
-
-        Arguments:
-            str_value (str): any value as string to be cleaned up.
-            dict_regex_rules (dict): a dictionary of cleaning rules writen in regex with the format
-                [rule name] : ['replacement', 'regex rule']
-
-        Returns:
-            (str): the modified/cleaned value.
-        """
-        clean_value = str_value
-        # Iterate through the dictionary and apply each regex rule
-        for name_rule, cleaning_rule in dict_regex_rules.items():
-            # First element is the replacement
-            replacement = cleaning_rule[0]
-            # Second element is the regex rule
-            regex_rule = cleaning_rule[1]
-
-            # Check if the regex rule is actually a reference to another regex rule.
-            # By adding a name of another regex rule in the place of the rule itself allows the execution
-            # of a regex rule twice
-            if regex_rule in dict_regex_rules:
-                replacement = dict_regex_rules[cleaning_rule[1]][0]
-                regex_rule = dict_regex_rules[cleaning_rule[1]][1]
-
-            # Make sure to use raw string
-            regex_rule = rf"{regex_rule}"
-
-            # Treat the special case of the word THE at the end of a text's name
-            found_the_word_the = None
-            if name_rule == "place_word_the_at_the_beginning":
-                found_the_word_the = re.search(regex_rule, clean_value)
-
-            # Apply the regex rule
-            clean_value = re.sub(regex_rule, replacement, clean_value)
-
-            # Adjust the name for the case of rule <place_word_the_at_the_beginning>
-            if found_the_word_the is not None:
-                clean_value = "the " + clean_value
-
-        return clean_value
-
     def _remove_unicode_chars(self, value: str) -> str:
         """Removes unicode character that is unreadable when converted to ASCII format.
 
@@ -163,50 +166,31 @@ class CompanyNameCleaner(BaseModel):
 
     def _apply_cleaning_rules(self, company_name: str) -> str:
         """Apply the cleaning rules from the dictionary of regex rules."""
-        cleaning_dict = {}
-        for rule_name in self.cleaning_rules_list:
-            cleaning_dict[rule_name] = CLEANING_RULES_DICT[rule_name]
+        clean_company_name = company_name
+        for rule_name, regex_rule, replacement in _compile_cleaning_rules(
+            tuple(dict.fromkeys(self.cleaning_rules_list))
+        ):
+            # Treat the special case of the word THE at the end of a text's name
+            found_the_word_the = None
+            if rule_name == "place_word_the_at_the_beginning":
+                found_the_word_the = regex_rule.search(clean_company_name)
 
-        # Apply all the cleaning rules
-        clean_company_name = self._apply_regex_rules(company_name, cleaning_dict)
+            clean_company_name = regex_rule.sub(replacement, clean_company_name)
+
+            if found_the_word_the is not None:
+                clean_company_name = "the " + clean_company_name
         return clean_company_name
 
     def _apply_normalization_of_legal_terms(self, company_name: str) -> str:
         """Apply the normalizattion of legal terms according to dictionary of regex rules."""
         # Make sure to remove extra spaces, so legal terms can be found in the end (if requested)
         clean_company_name = company_name.strip()
-
-        # The dictionary of legal terms define how to normalize the text's legal form abreviations
-        json_source = files("pudl.package_data.settings").joinpath(
-            self.__NAME_LEGAL_TERMS_DICT_FILE
-        )
-        with json_source.open() as json_file:
-            _dict_legal_terms = json.load(json_file)[
-                self.__NAME_JSON_ENTRY_LEGAL_TERMS
-            ]["en"]
-
-        # Apply normalization for legal terms
-        # Iterate through the dictionary of legal terms
-        for replacement, legal_terms in _dict_legal_terms.items():
-            # Each replacement has a list of possible terms to be searched for
-            replacement = " " + replacement.lower() + " "
-            for legal_term in legal_terms:
-                # Make sure to use raw string
-                legal_term = legal_term.lower()
-                # If the legal term has . (dots), then apply regex directly on the legal term
-                # Otherwise, if it's a legal term with only letters in sequence, make sure
-                # that regex find the legal term as a word (\\bLEGAL_TERM\\b)
-                if legal_term.find(".") > -1:
-                    legal_term = legal_term.replace(".", "\\.")
-                else:
-                    legal_term = "\\b" + legal_term + "\\b"
-                # Check if the legal term should be found only at the end of the string
-                if self.legal_term_location == LegalTermLocation.AT_THE_END:
-                    legal_term = legal_term + "$"
-                # ...and it's a raw string
-                regex_rule = rf"{legal_term}"
-                # Apply the replacement
-                clean_company_name = re.sub(regex_rule, replacement, clean_company_name)
+        for regex_rule, replacement in _compile_legal_terms(
+            self.__NAME_LEGAL_TERMS_DICT_FILE,
+            self.__NAME_JSON_ENTRY_LEGAL_TERMS,
+            self.legal_term_location,
+        ):
+            clean_company_name = regex_rule.sub(replacement, clean_company_name)
         return clean_company_name
 
     def get_clean_data(self, company_name: str) -> str:
@@ -256,6 +240,28 @@ class CompanyNameCleaner(BaseModel):
 
         return clean_company_name
 
+    def get_clean_series(self, company_names: pd.Series) -> pd.Series:
+        """Clean each unique name in a series only once.
+
+        Company names are often repeated many times, e.g. once for each year they
+        report, so the names are factorized and only the distinct values are cleaned
+        with :meth:`get_clean_data`. Null values are returned as pd.NA.
+
+        Arguments:
+            company_names: the original names.
+
+        Returns:
+            The clean version of the names, with the same index and name.
+        """
+        codes, unique_names = pd.factorize(company_names)
+        clean_names = np.empty(len(unique_names) + 1, dtype=object)
+        clean_names[:-1] = [self.get_clean_data(name) for name in unique_names]
+        # Nulls are coded as -1, which picks out the last element
+        clean_names[-1] = pd.NA
+        return pd.Series(
+            clean_names[codes], index=company_names.index, name=company_names.name
+        )
+
     def apply_name_cleaning(
         self, df: pd.DataFrame, return_as_dframe: bool = False
     ) -> pd.DataFrame:
@@ -274,11 +280,9 @@ class CompanyNameCleaner(BaseModel):
         if isinstance(df, pd.DataFrame) and len(df.columns) > 1:
             clean_df = pd.DataFrame()
             for col in df.columns:
-                clean_df = pd.concat(
-                    [clean_df, df[col].apply(self.get_clean_data)], axis=1
-                )
+                clean_df = pd.concat([clean_df, self.get_clean_series(df[col])], axis=1)
             return clean_df
-        out = df.squeeze().apply(self.get_clean_data)
+        out = self.get_clean_series(df.squeeze())
         if return_as_dframe:
             return out.to_frame()
         return out
@@ -38,6 +38,7 @@ from . import (
     eia_bulk_elec_assets,
     epacems_assets,
     glue_assets,
+    profiling,
     static_assets,
 )
 
@@ -200,12 +201,17 @@ default_asset_checks += [
 
 default_resources = {
     "datastore": datastore,
-    "pudl_io_manager": pudl_mixed_format_io_manager,
-    "ferc1_dbf_sqlite_io_manager": ferc1_dbf_sqlite_io_manager,
-    "ferc1_xbrl_sqlite_io_manager": ferc1_xbrl_sqlite_io_manager,
+    "pudl_io_manager": profiling.profiled_io_manager(pudl_mixed_format_io_manager),
+    "ferc1_dbf_sqlite_io_manager": profiling.profiled_io_manager(
+        ferc1_dbf_sqlite_io_manager
+    ),
+    "ferc1_xbrl_sqlite_io_manager": profiling.profiled_io_manager(
+        ferc1_xbrl_sqlite_io_manager
+    ),
     "dataset_settings": dataset_settings,
     "ferc_to_sqlite_settings": ferc_to_sqlite_settings,
-    "epacems_io_manager": epacems_io_manager,
+    "epacems_io_manager": profiling.profiled_io_manager(epacems_io_manager),
+    "asset_profiler": profiling.AssetProfiler(),
 }
 
 # Limit the number of concurrent workers when launch assets that use a lot of memory.
@@ -216,6 +222,10 @@ default_tag_concurrency_limits = [
         "limit": 4,
     },
 ]
+# Rough peak memory use in GB of a step with each value of the memory-use tag, with
+# None for untagged steps. Used to schedule steps within a memory budget when no
+# profiled measurements of their memory use are available.
+default_memory_use_estimates_gb = {None: 1.0, "high": 8.0}
 default_config = pudl.helpers.get_dagster_execution_config(
     tag_concurrency_limits=default_tag_concurrency_limits
 )
@@ -262,12 +272,14 @@ defs: Definitions = Definitions(
     jobs=[
         define_asset_job(
             name="etl_full",
+            hooks={profiling.asset_profiling_hook},
             description="This job executes all years of all assets.",
             config=default_config,
         ),
         define_asset_job(
             name="etl_full_no_cems",
             selection=create_non_cems_selection(default_assets),
+            hooks={profiling.asset_profiling_hook},
             description="This job executes all years of all assets except the "
             "core_epacems__hourly_emissions asset and all assets downstream.",
         ),
@@ -281,6 +293,7 @@ defs: Definitions = Definitions(
                     }
                 }
             },
+            hooks={profiling.asset_profiling_hook},
             description="This job executes the most recent year of each asset.",
         ),
         define_asset_job(
@@ -293,6 +306,7 @@ defs: Definitions = Definitions(
                     }
                 }
             },
+            hooks={profiling.asset_profiling_hook},
             description="This job executes the most recent year of each asset except the "
             "core_epacems__hourly_emissions asset and all assets downstream.",
         ),
@@ -40,7 +40,8 @@ def pudl_etl_job_factory(
     def get_pudl_etl_job():
         """Create an pudl_etl_job wrapped by to be wrapped by reconstructable."""
         pudl.logging_helpers.configure_root_logger(logfile=logfile, loglevel=loglevel)
-        jobs = [define_asset_job("etl_job")]
+        hooks = {pudl.etl.profiling.asset_profiling_hook}
+        jobs = [define_asset_job("etl_job", hooks=hooks)]
         if not process_epacems:
             jobs = [
                 define_asset_job(
@@ -48,6 +49,7 @@ def pudl_etl_job_factory(
                     selection=pudl.etl.create_non_cems_selection(
                         pudl.etl.default_assets
                     ),
+                    hooks=hooks,
                 )
             ]
         return Definitions(
@@ -59,6 +61,22 @@ def pudl_etl_job_factory(
     return get_pudl_etl_job
 
 
+def get_memory_use_estimates_gb() -> dict[str | None, float]:
+    """Estimate the peak memory use of steps with each value of the memory-use tag.
+
+    Measurements from the most recently profiled ETL run take precedence over the
+    rough default estimates in :data:`pudl.etl.default_memory_use_estimates_gb`.
+    """
+    estimates_gb = dict(pudl.etl.default_memory_use_estimates_gb)
+    profile_path = pudl.etl.profiling.default_profile_path()
+    if profile_path.exists():
+        profiles = pudl.etl.profiling.ProfileStore(profile_path).read()
+        measured_gb = pudl.etl.profiling.estimate_memory_use_gb(profiles)
+        logger.info(f"Using memory use measured in {profile_path}: {measured_gb}")
+        estimates_gb |= measured_gb
+    return estimates_gb
+
+
 @click.command(
     context_settings={"help_option_names": ["-h", "--help"]},
 )
@@ -77,6 +95,16 @@ def pudl_etl_job_factory(
     type=int,
     help="Max number of processes Dagster can launch. Defaults to the number of CPUs.",
 )
+@click.option(
+    "--memory-budget-gb",
+    type=float,
+    default=None,
+    help=(
+        "Limit the number of steps run at once so that their combined estimated "
+        "memory use stays within this many GB. Memory use is estimated from the most "
+        "recent run with --profile-assets if there is one."
+    ),
+)
 @click.option(
     "--gcs-cache-path",
     type=str,
@@ -90,6 +118,15 @@ def pudl_etl_job_factory(
         "project to pay data egress costs."
     ),
 )
+@click.option(
+    "--profile-assets",
+    is_flag=True,
+    default=False,
+    help=(
+        "Record the runtime, memory use and size of every asset in "
+        "$PUDL_OUTPUT/asset_profiles.sqlite. Summarize them with pudl_profile_report."
+    ),
+)
 @click.option(
     "--logfile",
     help="If specified, write logs to this file.",
@@ -109,7 +146,9 @@ def pudl_etl_job_factory(
 def pudl_etl(
     etl_settings_yml: pathlib.Path,
     dagster_workers: int,
+    memory_budget_gb: float | None,
     gcs_cache_path: str,
+    profile_assets: bool,
     logfile: pathlib.Path,
     loglevel: str,
 ):
@@ -145,6 +184,7 @@ def pudl_etl(
                     "gcs_cache_path": gcs_cache_path,
                 },
             },
+            "asset_profiler": {"config": {"enabled": profile_assets}},
         },
     }
 
@@ -161,6 +201,10 @@ def pudl_etl(
         get_dagster_execution_config(
             num_workers=dagster_workers,
             tag_concurrency_limits=tag_concurrency_limits,
+            memory_budget_gb=memory_budget_gb,
+            memory_use_estimates_gb=(
+                None if memory_budget_gb is None else get_memory_use_estimates_gb()
+            ),
         )
     )
 
@@ -119,6 +119,9 @@ def process_single_year(
 def consolidate_partitions(context, partitions: list[YearPartitions]) -> None:
     """Read partitions into memory and write to a single monolithic output.
 
+    An index of the range of plant IDs and times in each row group of the output is
+    written alongside it, for use by :func:`pudl.output.epacems.read_epacems`.
+
     Args:
         context: dagster keyword that provides access to resources and config.
         partitions: Year and state combinations in the output database.
@@ -136,7 +139,9 @@ def consolidate_partitions(context, partitions: list[YearPartitions]) -> None:
             for state in EPACEMS_STATES:
                 monolithic_writer.write_table(
                     # Concat a slice of each state's data from all quarters in a year
-                    # and write to parquet to create year-state row groups
+                    # and write to parquet to create year-state row groups. Sorting
+                    # them by plant and time keeps the ranges of these columns in each
+                    # row group narrow, so the row group index can skip more of them.
                     pa.concat_tables(
                         [
                             pq.read_table(
@@ -147,8 +152,14 @@ def consolidate_partitions(context, partitions: list[YearPartitions]) -> None:
                             )
                             for year_quarter in year_partition.year_quarters
                         ]
+                    ).sort_by(
+                        [
+                            ("plant_id_eia", "ascending"),
+                            ("operating_datetime_utc", "ascending"),
+                        ]
                     )
                 )
+    pudl.output.epacems.write_row_group_index(monolithic_path)
 
 
 @graph_asset
@@ -1,7 +1,8 @@
 """FERC and EIA and EPA CAMD glue assets."""
 
-import networkx as nx
+import numpy as np
 import pandas as pd
+import scipy
 from dagster import AssetOut, Output, asset, multi_asset
 
 import pudl
@@ -309,14 +310,14 @@ def core_epa__assn_eia_epacamd_subplant_ids(
         pudl.metadata.fields.apply_pudl_dtypes, "glue"
     )
     logger.info(
-        "After making the networkx generateds subplant_ids, "
+        "After making the graph generated subplant_ids, "
         f"{subplant_ids.subplant_id.notnull().sum() / len(subplant_ids):.1%} of"
         " records have a subplant_id."
     )
     # update the subplant ids for each plant
-    subplant_ids_updated = subplant_ids.groupby(
-        by=["plant_id_eia"], group_keys=False
-    ).apply(update_subplant_ids)
+    subplant_ids_updated = update_subplant_ids(
+        subplant_ids.sort_values("plant_id_eia", kind="stable")
+    )
     # log differences between updated ids
     subplant_id_diff = subplant_ids_updated[
         subplant_ids_updated.subplant_id != subplant_ids_updated.subplant_id_updated
@@ -403,12 +404,12 @@ def augment_crosswalk_with_bga_eia860(
     )
 
 
-######################
-# Nexworkx subplant_id
-######################
+#########################
+# Graph-based subplant_id
+#########################
 
 
-def _prep_for_networkx(crosswalk: pd.DataFrame) -> pd.DataFrame:
+def _prep_for_graph(crosswalk: pd.DataFrame) -> pd.DataFrame:
     """Make surrogate keys for combustors and generators.
 
     Args:
@@ -416,10 +417,10 @@ def _prep_for_networkx(crosswalk: pd.DataFrame) -> pd.DataFrame:
 
     Returns:
         A copy of ``core_epa__assn_eia_epacamd`` crosswalk with new surrogate ID columns
-            'combustor_id' and 'generator_id'
+            'combustor_id' and 'generator_id_unique'
     """
     prepped = crosswalk.copy()
-    # networkx can't handle composite keys, so make surrogates
+    # graph nodes can't have composite keys, so make surrogates
     prepped["combustor_id"] = prepped.groupby(
         by=["plant_id_eia", "emissions_unit_id_epa"]
     ).ngroup()
@@ -433,29 +434,63 @@ def _prep_for_networkx(crosswalk: pd.DataFrame) -> pd.DataFrame:
 
 
 def _subplant_ids_from_prepped_crosswalk(prepped: pd.DataFrame) -> pd.DataFrame:
-    """Use networkx graph analysis to create subplant IDs from crosswalk edge list.
+    """Use graph analysis to create subplant IDs from the crosswalk edge list.
+
+    Each row of the crosswalk is an edge between a combustor and a generator node.
+    Repeated edges are collapsed into one, keeping the values of the last of them, and
+    every missing combustor or generator ID is a distinct node. Nodes are numbered in
+    the order in which they first appear, so that the subplants, which are the
+    connected components of the graph, are numbered in the order in which they first
+    appear too. The edges are ordered by the first of their nodes to appear, and then
+    by their own first appearance.
 
     Args:
         prepped: ``core_epa__assn_eia_epacamd`` crosswalk passed through
-            :func:`_prep_for_networkx`
+            :func:`_prep_for_graph`
 
     Returns:
-        A copy of ``core_epa__assn_eia_epacamd`` crosswalk plus new column
-        ``global_subplant_id``
+        A copy of ``core_epa__assn_eia_epacamd`` crosswalk with one row per edge, plus
+        new column ``global_subplant_id``
     """
-    graph = nx.from_pandas_edgelist(
-        prepped,
-        source="combustor_id",
-        target="generator_id_unique",
-        edge_attr=True,
+    # Interleave the combustor and generator of each edge, in order of appearance.
+    ends = (
+        prepped[["combustor_id", "generator_id_unique"]]
+        .to_numpy(dtype=float, na_value=np.nan)
+        .ravel()
+    )
+    # Give each missing ID its own negative placeholder, so they're distinct nodes.
+    missing = np.isnan(ends)
+    ends[missing] = -1 - np.arange(missing.sum())
+    nodes, unique_nodes = pd.factorize(ends)
+    combustors, generators = nodes[0::2], nodes[1::2]
+    # Combustors and generators have distinct surrogate keys, so each edge connects
+    # two different kinds of node, and the graph is bipartite.
+    assert (
+        np.intersect1d(combustors, generators).size == 0
+    ), "non-bipartite combustor/generator graph"
+
+    # Edge codes are numbered in order of first appearance too.
+    edges, _ = pd.factorize(combustors * len(unique_nodes) + generators)
+    last_rows = (
+        pd.DataFrame({"first_node": np.minimum(combustors, generators), "edge": edges})
+        .drop_duplicates(subset="edge", keep="last")
+        .sort_values(["first_node", "edge"])
+        .index
+    )
+
+    graph = scipy.sparse.coo_matrix(
+        (np.ones(len(edges)), (combustors, generators)),
+        shape=(len(unique_nodes), len(unique_nodes)),
+    )
+    _, component_labels = scipy.sparse.csgraph.connected_components(
+        graph, directed=False
+    )
+    return (
+        prepped.assign(global_subplant_id=component_labels[combustors])
+        .drop(columns=["combustor_id", "generator_id_unique"])
+        .iloc[last_rows]
+        .reset_index(drop=True)
     )
-    for i, node_set in enumerate(nx.connected_components(graph)):
-        subgraph = graph.subgraph(node_set)
-        assert nx.algorithms.bipartite.is_bipartite(
-            subgraph
-        ), f"non-bipartite: i={i}, node_set={node_set}"
-        nx.set_edge_attributes(subgraph, name="global_subplant_id", values=i)
-    return nx.to_pandas_edgelist(graph)
 
 
 def _convert_global_id_to_composite_id(
@@ -474,52 +509,26 @@ def _convert_global_id_to_composite_id(
         crosswalk_with_ids: crosswalk with ``global_subplant_id``, as from
             :func:`_subplant_ids_from_prepped_crosswalk`
 
-    Raises:
-        ValueError: if crosswalk_with_ids has a MultiIndex
-
     Returns:
         A copy of crosswalk_with_ids with an added column: ``subplant_id``
     """
-    if isinstance(crosswalk_with_ids.index, pd.MultiIndex):
-        raise ValueError(
-            f"Input crosswalk must have single level index. Given levels: {crosswalk_with_ids.index.names}"
-        )
-
-    reindexed = crosswalk_with_ids.reset_index()  # copy
-    idx_name = crosswalk_with_ids.index.name
-    if idx_name is None:
-        # Indices with no name (None) are set to a pandas default name ('index'), which
-        # could (though probably won't) change.
-        idx_col = reindexed.columns.symmetric_difference(crosswalk_with_ids.columns)[
-            0
-        ]  # get index name
-    else:
-        idx_col = idx_name
-
-    composite_key: pd.Series = reindexed.groupby("plant_id_eia", as_index=False).apply(
-        lambda x: x.groupby("global_subplant_id").ngroup()
+    # Number the distinct global IDs within each plant in ascending order.
+    global_ids = crosswalk_with_ids.groupby(
+        ["plant_id_eia", "global_subplant_id"]
+    ).ngroup()
+    return crosswalk_with_ids.assign(
+        subplant_id=global_ids
+        - global_ids.groupby(crosswalk_with_ids.plant_id_eia).transform("min")
     )
 
-    # Recombine. Could use index join but I chose to reindex, sort and assign.
-    # Errors like mismatched length will raise exceptions, which is good.
-
-    # drop the outer group, leave the reindexed row index
-    composite_key = composite_key.reset_index(level=0, drop=True)
-    composite_key = composite_key.sort_index()  # put back in same order as reindexed
-    reindexed["subplant_id"] = composite_key
-    # restore original index
-    reindexed = reindexed.set_index(idx_col)  # restore values
-    reindexed.index = reindexed.index.rename(idx_name)  # restore original name
-    return reindexed
-
 
 def make_subplant_ids(crosswalk: pd.DataFrame) -> pd.DataFrame:
     """Identify sub-plants in the EPA/EIA crosswalk graph.
 
     In graph analysis terminology, the crosswalk is a list of edges between nodes
-    (combustors and generators) in a bipartite graph. The networkx python package
-    provides functions to analyze this edge list and extract disjoint subgraphs (groups
-    of combustors and generators that are connected to each other).  These are the
+    (combustors and generators) in a bipartite graph. We find the connected components
+    of this graph, which are disjoint subgraphs (groups of combustors and generators
+    that are connected to each other), using a sparse adjacency matrix.  These are the
     distinct power plants. To avoid a name collision with plant_id, we term these
     collections 'subplants', and identify them with a subplant_id that is unique within
     each plant_id. Subplants are thus identified with the composite key (plant_id,
@@ -549,7 +558,7 @@ def make_subplant_ids(crosswalk: pd.DataFrame) -> pd.DataFrame:
         pd.DataFrame: An edge list connecting EPA units to EIA generators, with
             connected pieces issued a subplant_id
     """
-    edge_list = _prep_for_networkx(crosswalk)
+    edge_list = _prep_for_graph(crosswalk)
     edge_list = _subplant_ids_from_prepped_crosswalk(edge_list)
     edge_list = _convert_global_id_to_composite_id(edge_list)
     return edge_list
@@ -563,9 +572,7 @@ def make_subplant_ids(crosswalk: pd.DataFrame) -> pd.DataFrame:
 def update_subplant_ids(subplant_crosswalk: pd.DataFrame) -> pd.DataFrame:
     """Ensure a complete and accurate subplant_id mapping for all generators.
 
-    This function is meant to be applied using a ``.groupby("plant_id_eia").apply()``
-    function. This function will only properly work when applied to a single
-    ``plant_id_eia`` at a time.
+    The IDs of each ``plant_id_eia`` are updated independently of all other plants.
 
     High-level overview of method:
     ==============================
@@ -601,7 +608,7 @@ def update_subplant_ids(subplant_crosswalk: pd.DataFrame) -> pd.DataFrame:
             )
         ),
         # create a new unique subplant_id based on the connected subplant ids and the
-        # filled unit_id
+        # filled unit_id, numbered consecutively from zero within each plant
         subplant_id_updated=(
             lambda x: x.groupby(
                 ["plant_id_eia", "subplant_id_connected", "unit_id_pudl_filled"],
@@ -609,6 +616,9 @@ def update_subplant_ids(subplant_crosswalk: pd.DataFrame) -> pd.DataFrame:
             ).ngroup()
         ),
     )
+    subplant_crosswalk["subplant_id_updated"] -= subplant_crosswalk.groupby(
+        "plant_id_eia"
+    ).subplant_id_updated.transform("min")
 
     return subplant_crosswalk
 
@@ -634,19 +644,29 @@ def connect_ids(
 
     # identify if any non-NA id_to_update are duplicated, indicated that it is associated with multiple connecting_id
     duplicates = subplant_unit_pairs[
-        (subplant_unit_pairs.duplicated(subset=id_to_update, keep=False))
+        (
+            subplant_unit_pairs.duplicated(
+                subset=["plant_id_eia", id_to_update], keep=False
+            )
+        )
         & (~subplant_unit_pairs[id_to_update].isna())
     ].copy()
 
     # if there are any duplicate units, indicating an incorrect id_to_update, fix the id_to_update
     subplant_crosswalk[f"{connecting_id}_connected"] = subplant_crosswalk[connecting_id]
     if len(duplicates) > 0:
-        # find the lowest number subplant id associated with each duplicated unit_id_pudl
-        duplicates.loc[:, f"{connecting_id}_to_replace"] = (
+        # within each plant, find the lowest number connecting_id associated with the
+        # lowest numbered duplicated id_to_update
+        to_replace = (
             duplicates.groupby(["plant_id_eia", id_to_update])[connecting_id]
             .min()
-            .iloc[0]
+            .groupby(level="plant_id_eia")
+            .head(1)
+            .droplevel(id_to_update)
         )
+        duplicates.loc[:, f"{connecting_id}_to_replace"] = duplicates[
+            "plant_id_eia"
+        ].map(to_replace)
         # merge this replacement subplant_id into the dataframe and use it to update the existing subplant id
         subplant_crosswalk = subplant_crosswalk.merge(
             duplicates,
@@ -654,8 +674,11 @@ def connect_ids(
             on=["plant_id_eia", id_to_update, connecting_id],
             validate="m:1",
         )
-        subplant_crosswalk[f"{connecting_id}_connected"].update(
-            subplant_crosswalk[f"{connecting_id}_to_replace"]
+        subplant_crosswalk[f"{connecting_id}_connected"] = subplant_crosswalk[
+            f"{connecting_id}_connected"
+        ].mask(
+            subplant_crosswalk[f"{connecting_id}_to_replace"].notna(),
+            subplant_crosswalk[f"{connecting_id}_to_replace"],
         )
     return subplant_crosswalk
 
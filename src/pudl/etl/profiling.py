@@ -0,0 +1,401 @@
+"""Opt-in profiling of the runtime, memory use and data volume of PUDL assets.
+
+When the ``asset_profiler`` resource is enabled, every IO manager wrapped with
+:func:`profiled_io_manager` records how long it took to write each asset and read
+each input, and how many rows and bytes of data were involved. The
+:func:`asset_profiling_hook` records the wall time, CPU time and peak resident memory
+of each successfully materialized step. All measurements are appended to a SQLite
+profile store, by default ``asset_profiles.sqlite`` in ``$PUDL_OUTPUT``, which can be
+summarized with the ``pudl_profile_report`` command.
+
+Peak resident memory is measured for the whole process running the step. With the
+default multiprocess executor each step runs in its own process, so this is the peak
+memory use of the step. With the in-process executor it is the peak memory use of all
+the steps executed so far, and is only an upper bound.
+"""
+
+import pathlib
+import resource
+import sqlite3
+import sys
+import time
+from datetime import UTC, datetime
+from typing import Any
+
+import click
+import pandas as pd
+from dagster import (
+    ConfigurableResource,
+    DagsterEventType,
+    HookContext,
+    InitResourceContext,
+    InputContext,
+    IOManager,
+    IOManagerDefinition,
+    OutputContext,
+    io_manager,
+    success_hook,
+)
+from pydantic import PrivateAttr
+
+import pudl
+from pudl.workspace.setup import PudlPaths
+
+logger = pudl.logging_helpers.get_logger(__name__)
+
+PROFILE_COLUMNS: dict[str, str] = {
+    "run_id": "TEXT",
+    "step_key": "TEXT",
+    "asset": "TEXT",
+    "event": "TEXT",
+    "wall_time_s": "REAL",
+    "cpu_time_s": "REAL",
+    "peak_rss_mb": "REAL",
+    "rows": "INTEGER",
+    "bytes": "INTEGER",
+    "memory_use": "TEXT",
+    "recorded_at": "TEXT",
+}
+"""Columns of the ``asset_profiles`` table in the profile store, and their types."""
+
+
+def default_profile_path() -> pathlib.Path:
+    """Default location of the profile store in ``$PUDL_OUTPUT``."""
+    return PudlPaths().output_dir / "asset_profiles.sqlite"
+
+
+def _peak_rss_mb() -> float:
+    """Peak resident memory of the current process in MB."""
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports the peak resident memory in kB, while macOS reports it in bytes.
+    if sys.platform == "darwin":
+        return peak_rss / 2**20
+    return peak_rss / 2**10
+
+
+def _data_volume(obj: Any) -> tuple[int | None, int | None]:
+    """Number of rows and bytes in a dataframe, or None for other kinds of outputs."""
+    if isinstance(obj, pd.DataFrame):
+        return len(obj), int(obj.memory_usage(deep=True).sum())
+    return None, None
+
+
+class ProfileStore:
+    """Append-only store of asset profiling measurements in a SQLite database.
+
+    Concurrently executing steps all write to the same database, so each measurement
+    is written in its own short transaction.
+    """
+
+    def __init__(self, path: pathlib.Path):
+        """Create the profile store at the given path if it doesn't exist already."""
+        self.path = pathlib.Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        columns = ", ".join(f"{col} {dtype}" for col, dtype in PROFILE_COLUMNS.items())
+        with self._connect() as conn:
+            conn.execute(f"CREATE TABLE IF NOT EXISTS asset_profiles ({columns})")
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=60)
+
+    def record(self, **measurement) -> None:
+        """Append a measurement, leaving out any columns which don't apply to it."""
+        measurement = {"recorded_at": datetime.now(UTC).isoformat()} | measurement
+        unknown = set(measurement) - set(PROFILE_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown asset profile columns: {sorted(unknown)}")
+        columns = ", ".join(measurement)
+        placeholders = ", ".join("?" for _ in measurement)
+        with self._connect() as conn:
+            conn.execute(
+                f"INSERT INTO asset_profiles ({columns}) VALUES ({placeholders})",  # noqa: S608 - column names are validated above
+                tuple(measurement.values()),
+            )
+
+    def read(self, run_id: str | None = None) -> pd.DataFrame:
+        """Read the measurements of a run, or of the most recent run by default."""
+        with self._connect() as conn:
+            if run_id is None:
+                run_id = conn.execute(
+                    "SELECT run_id FROM asset_profiles "
+                    "ORDER BY recorded_at DESC LIMIT 1"
+                ).fetchone()
+                run_id = run_id[0] if run_id else None
+            return pd.read_sql(
+                "SELECT * FROM asset_profiles WHERE run_id = ?",
+                conn,
+                params=(run_id,),
+            )
+
+
+class AssetProfiler(ConfigurableResource):
+    """Dagster resource which enables and configures asset profiling."""
+
+    enabled: bool = False
+    """If true, profile the assets as they are materialized."""
+
+    path: str = ""
+    """Path to the profile store. Defaults to ``asset_profiles.sqlite`` in
+    ``$PUDL_OUTPUT``."""
+
+    _cpu_time: float = PrivateAttr(default=0.0)
+
+    def setup_for_execution(self, context: InitResourceContext) -> None:
+        """Start measuring CPU time when the resource is initialized for a step."""
+        self._cpu_time = time.process_time()
+
+    @property
+    def store(self) -> ProfileStore:
+        """The profile store to which measurements are written."""
+        return ProfileStore(
+            pathlib.Path(self.path) if self.path else default_profile_path()
+        )
+
+    def cpu_time_since_last_step(self) -> float:
+        """CPU time used by this process since the previous step finished."""
+        cpu_time = time.process_time()
+        elapsed, self._cpu_time = cpu_time - self._cpu_time, cpu_time
+        return elapsed
+
+
+class ProfilingIOManager(IOManager):
+    """IO manager which profiles the reads and writes of another IO manager."""
+
+    def __init__(self, io_manager: IOManager, store: ProfileStore):
+        """Wrap an IO manager, recording its measurements in the profile store."""
+        self.io_manager = io_manager
+        self.store = store
+
+    def handle_output(self, context: OutputContext, obj: Any) -> None:
+        """Write the output, timing its serialization."""
+        wall_time, cpu_time = time.perf_counter(), time.process_time()
+        self.io_manager.handle_output(context, obj)
+        wall_time, cpu_time = (
+            time.perf_counter() - wall_time,
+            time.process_time() - cpu_time,
+        )
+        rows, nbytes = _data_volume(obj)
+        self.store.record(
+            run_id=context.run_id,
+            step_key=context.step_key,
+            asset=context.asset_key.to_user_string(),
+            event="handle_output",
+            wall_time_s=wall_time,
+            cpu_time_s=cpu_time,
+            rows=rows,
+            bytes=nbytes,
+        )
+
+    def load_input(self, context: InputContext) -> Any:
+        """Read the input, timing its deserialization."""
+        wall_time, cpu_time = time.perf_counter(), time.process_time()
+        obj = self.io_manager.load_input(context)
+        wall_time, cpu_time = (
+            time.perf_counter() - wall_time,
+            time.process_time() - cpu_time,
+        )
+        rows, nbytes = _data_volume(obj)
+        self.store.record(
+            run_id=context.step_context.run_id,
+            step_key=context.step_context.step.key,
+            asset=context.asset_key.to_user_string(),
+            event="load_input",
+            wall_time_s=wall_time,
+            cpu_time_s=cpu_time,
+            rows=rows,
+            bytes=nbytes,
+        )
+        return obj
+
+
+def profiled_io_manager(io_manager_def: IOManagerDefinition) -> IOManagerDefinition:
+    """Wrap an IO manager definition so that it's profiled when profiling is enabled.
+
+    The wrapped IO manager accepts the same configuration as the original one, and
+    additionally requires the ``asset_profiler`` resource.
+    """
+
+    @io_manager(
+        config_schema=io_manager_def.config_schema,
+        description=io_manager_def.description,
+        required_resource_keys=set(io_manager_def.required_resource_keys)
+        | {"asset_profiler"},
+    )
+    def _profiled_io_manager(init_context: InitResourceContext) -> IOManager:
+        manager = io_manager_def.resource_fn(init_context)
+        profiler = init_context.resources.asset_profiler
+        if profiler.enabled:
+            return ProfilingIOManager(manager, profiler.store)
+        return manager
+
+    return _profiled_io_manager
+
+
+@success_hook(required_resource_keys={"asset_profiler"})
+def asset_profiling_hook(context: HookContext) -> None:
+    """Record the wall time, CPU time and peak memory of each materialized step."""
+    profiler = context.resources.asset_profiler
+    if not profiler.enabled:
+        return
+    step_starts = context.instance.all_logs(
+        context.run_id, of_type=DagsterEventType.STEP_START
+    )
+    start_time = max(
+        (
+            event.timestamp
+            for event in step_starts
+            if event.step_key == context.step_key
+        ),
+        default=None,
+    )
+    profiler.store.record(
+        run_id=context.run_id,
+        step_key=context.step_key,
+        asset=context.op.name,
+        event="step",
+        wall_time_s=None if start_time is None else time.time() - start_time,
+        cpu_time_s=profiler.cpu_time_since_last_step(),
+        peak_rss_mb=_peak_rss_mb(),
+        memory_use=context.op.tags.get("memory-use"),
+    )
+
+
+def summarize_profiles(profiles: pd.DataFrame) -> pd.DataFrame:
+    """Summarize the measurements of a run, with one row per step.
+
+    Args:
+        profiles: measurements read from the :class:`ProfileStore`.
+
+    Returns:
+        The wall time, CPU time and peak memory of each step, with the number of rows
+        and bytes it read and wrote and the time spent reading and writing them.
+    """
+    steps = profiles.loc[
+        profiles.event == "step",
+        ["step_key", "wall_time_s", "cpu_time_s", "peak_rss_mb"],
+    ].drop_duplicates(subset="step_key", keep="last")
+    io = (
+        profiles[profiles.event.isin(["load_input", "handle_output"])]
+        .assign(
+            event=lambda df: df.event.map(
+                {"load_input": "input", "handle_output": "output"}
+            )
+        )
+        .pivot_table(
+            index="step_key",
+            columns="event",
+            values=["wall_time_s", "rows", "bytes"],
+            aggfunc="sum",
+        )
+    )
+    io.columns = [
+        f"{event}_{'io_time_s' if value == 'wall_time_s' else value}"
+        for value, event in io.columns
+    ]
+    columns = ["wall_time_s", "cpu_time_s", "peak_rss_mb"] + [
+        f"{event}_{value}"
+        for event in ["input", "output"]
+        for value in ["rows", "bytes", "io_time_s"]
+    ]
+    return (
+        steps.merge(io.reset_index(), on="step_key", how="outer")
+        .set_index("step_key")
+        .reindex(columns=columns)
+    )
+
+
+def estimate_memory_use_gb(profiles: pd.DataFrame) -> dict[str | None, float]:
+    """Measured peak memory of the steps with each value of the ``memory-use`` tag.
+
+    These estimates can be passed to :func:`pudl.helpers.get_dagster_execution_config`
+    to schedule steps within a memory budget.
+
+    Args:
+        profiles: measurements read from the :class:`ProfileStore`.
+
+    Returns:
+        The largest peak memory in GB of any step with each value of the
+        ``memory-use`` tag, with the key None for steps which aren't tagged.
+    """
+    steps = profiles[profiles.event == "step"].dropna(subset="peak_rss_mb")
+    peak_memory_gb = (
+        steps.groupby(steps.memory_use.fillna("untagged")).peak_rss_mb.max() / 2**10
+    )
+    return {
+        None if tag == "untagged" else tag: memory_gb
+        for tag, memory_gb in peak_memory_gb.items()
+    }
+
+
+def suggest_high_memory_steps(summary: pd.DataFrame, threshold_mb: float) -> list[str]:
+    """Steps whose measured peak memory use warrants the ``memory-use: high`` tag."""
+    return sorted(summary.index[summary.peak_rss_mb > threshold_mb])
+
+
+@click.command(
+    context_settings={"help_option_names": ["-h", "--help"]},
+)
+@click.option(
+    "--profile-path",
+    help="Path to the asset profile store. Defaults to $PUDL_OUTPUT/asset_profiles.sqlite.",
+    type=click.Path(exists=True, dir_okay=False, path_type=pathlib.Path),
+    default=None,
+)
+@click.option(
+    "--run-id",
+    help="Dagster run to report on. Defaults to the most recently profiled run.",
+    type=str,
+    default=None,
+)
+@click.option(
+    "--sort-by",
+    help="Measurement by which the steps are ranked.",
+    type=click.Choice(["wall_time_s", "cpu_time_s", "peak_rss_mb", "output_bytes"]),
+    default="wall_time_s",
+    show_default=True,
+)
+@click.option(
+    "--top",
+    help="Number of steps to report.",
+    type=int,
+    default=20,
+    show_default=True,
+)
+@click.option(
+    "--memory-threshold-mb",
+    help="Suggest tagging steps using more than this much memory as high memory use.",
+    type=float,
+    default=None,
+)
+def pudl_profile_report(
+    profile_path: pathlib.Path | None,
+    run_id: str | None,
+    sort_by: str,
+    top: int,
+    memory_threshold_mb: float | None,
+):
+    """Rank the most expensive assets in a profiled run of the PUDL ETL.
+
+    Enable profiling of an ETL run with ``pudl_etl --profile-assets``.
+    """
+    if not profile_path:
+        profile_path = default_profile_path()
+    profiles = ProfileStore(profile_path).read(run_id=run_id)
+    if profiles.empty:
+        raise click.ClickException(f"No asset profiles found in {profile_path}.")
+
+    summary = summarize_profiles(profiles).sort_values(sort_by, ascending=False)
+    click.echo(f"Asset profiles for run {profiles.run_id.iloc[0]}:")
+    with pd.option_context("display.width", 200, "display.max_columns", None):
+        click.echo(summary.head(top).to_string(float_format="{:.2f}".format))
+    if memory_threshold_mb is not None:
+        high_memory = suggest_high_memory_steps(summary, memory_threshold_mb)
+        click.echo(
+            f"\nSteps using more than {memory_threshold_mb:.0f} MB which should be "
+            f"tagged memory-use: high: {high_memory}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(pudl_profile_report())
@@ -12,103 +12,139 @@ tables: one of metadata and one of timeseries. That is the format delivered by t
 module.
 """
 
-import warnings
+import json
+import re
+from array import array
 from io import BytesIO
-from pathlib import Path
+from typing import IO
+from zipfile import ZipFile
 
+import numpy as np
 import pandas as pd
 
 from pudl.workspace.datastore import Datastore
 
+_SERIES_TO_EXTRACT = ["RECEIPTS_BTU", "COST_BTU"]
+_SERIES_PATTERN = "|".join(_SERIES_TO_EXTRACT)
+_SERIES_ID_REGEX = re.compile(rf"^ELEC\.(?:{_SERIES_PATTERN})")
+# Matches the raw JSON text of the desired series IDs, so that the ~99% of lines we
+# don't want can be skipped without parsing them.
+_SERIES_LINE_REGEX = re.compile(
+    rf'"series_id"\s*:\s*"ELEC\.(?:{_SERIES_PATTERN})'.encode()
+)
+_PERIOD_REGEX = r"^(?P<year>\d{4})(?:Q(?P<quarter>[1-4])|(?P<month>\d{2}))?$"
 
-def _filter_for_fuel_receipts_costs_series(df: pd.DataFrame) -> pd.DataFrame:
-    """Pick out the desired data series.
 
-    Fuel receipts and costs are about 1% of the total lines. This function filters for
-    series that contain the name "RECEIPTS_BTU" or "COST_BTU" in their ``series_id``.
+def _is_fuel_receipts_costs_series(line: bytes) -> bool:
+    """Pick out the lines containing the desired data series.
+
+    Fuel receipts and costs are about 1% of the total lines. This function looks for
+    series whose ``series_id`` starts with "ELEC.RECEIPTS_BTU" or "ELEC.COST_BTU" in the
+    raw JSON text of the line.
 
     Of the approximately 680,000 objects in the dataset, about 19,000 represent things
     other than data series (such as category definitions or plot axes). Those
-    non-series objects do not have a field called ``series_id``.
-    The ``except KeyError:`` clause handles that situation.
+    non-series objects do not have a field called ``series_id`` and never match.
     """
-    series_to_extract = ["RECEIPTS_BTU", "COST_BTU"]
-    series_pattern = "|".join(series_to_extract)
-    pattern = rf"^ELEC\.(?:{series_pattern})"
-    try:
-        _filter = df.loc[:, "series_id"].str.match(pattern, na=False)
-        return df.loc[_filter, :]
-    except KeyError:
-        return pd.DataFrame()  # empty
+    return _SERIES_LINE_REGEX.search(line) is not None
+
 
+def _parse_periods(periods: pd.Series) -> pd.Series:
+    """Convert the EIA period strings to timestamps.
 
-def _filter_and_read_to_dataframe(raw_zipfile: Path) -> pd.DataFrame:
-    """Decompress and filter the 1100 MB file down to the 16 MB we actually want.
+    There are three possible period formats:
 
-    This produces a dataframe with all text fields. The timeseries data is left as JSON
-    strings in the 'data' column. The other columns are metadata.
+    * annual data as "YYYY" eg "2020"
+    * quarterly data as "YYYYQQ" eg "2020Q2"
+    * monthly data as "YYYYMM" eg "202004"
+
+    Each period is converted to the first day of the year, quarter or month it refers
+    to.
     """
-    filtered = []
-    # Use chunksize arg to reduce peak memory usage when reading in 1.1 GB file
-    # For reference, the file has ~680k lines and we want around 8.5k
-    with pd.read_json(
-        raw_zipfile, compression="zip", lines=True, chunksize=10_000
-    ) as reader:
-        for chunk in reader:
-            filtered.append(_filter_for_fuel_receipts_costs_series(chunk))
-    out = pd.concat(filtered, ignore_index=True)
-    return out
-
-
-def _parse_data_column(elec_df: pd.DataFrame) -> pd.DataFrame:
-    out = []
-    for idx in elec_df.index:
-        data_df = pd.DataFrame(elec_df.loc[idx, "data"], columns=["date", "value"])
-        # three possible date formats, only annual/quarterly handled by pd.to_datetime() automatically
-        #   annual data as "YYYY" eg "2020"
-        #   quarterly data as "YYYYQQ" eg "2020Q2"
-        #   monthly data as "YYYYMM" eg "202004"
-        is_monthly = (
-            data_df.iloc[0:5, data_df.columns.get_loc("date")].str.match(r"\d{6}").all()
+    parts = periods.str.extract(_PERIOD_REGEX).astype(float)
+    unparsed = parts.year.isna()
+    if unparsed.any():
+        raise ValueError(
+            "Found unrecognized EIA bulk electricity periods: "
+            f"{periods[unparsed].unique()[:10].tolist()}"
         )
-        # Unfortunately, the date formats in the EIA bulk electricity data are not
-        # uniform, and so for now we need to fall back on dateutil. Currently this
-        # warning is emitted thousands of times, clogging up the logs.
-        with warnings.catch_warnings():
-            warnings.filterwarnings(
-                action="ignore",
-                message="Could not infer format, so each element will be parsed individually",
-                category=UserWarning,
-            )
-            if is_monthly:
-                data_df.loc[:, "date"] = pd.to_datetime(
-                    data_df.loc[:, "date"], format="%Y%m", errors="raise"
-                )
-            else:
-                data_df.loc[:, "date"] = pd.to_datetime(
-                    data_df.loc[:, "date"], errors="raise"
-                )
-        data_df["series_id"] = elec_df.loc[idx, "series_id"]
-        out.append(data_df)
-    out = pd.concat(out, ignore_index=True, axis=0)
-    out = out.convert_dtypes()
-    out.loc[:, "series_id"] = out.loc[:, "series_id"].astype("category", copy=False)
-    return out.loc[:, ["series_id", "date", "value"]]  # reorder cols
+    month = parts.month.fillna((parts.quarter - 1) * 3 + 1).fillna(1)
+    return pd.to_datetime(
+        pd.DataFrame({"year": parts.year, "month": month, "day": 1}), errors="raise"
+    )
+
+
+def _read_fuel_receipts_costs_series(
+    lines: IO[bytes],
+) -> tuple[list[dict], pd.DataFrame]:
+    """Stream the desired series out of the line-delimited JSON.
+
+    Only the lines matched by :func:`_is_fuel_receipts_costs_series` are parsed. The
+    ``[period, value]`` pairs of each series are appended directly to typed column
+    buffers, and each distinct period string is only stored and parsed once, so memory
+    use is bounded by the size of the desired timeseries rather than the whole file.
+
+    Args:
+        lines: binary file-like object containing one JSON object per line.
+
+    Returns:
+        A list of the metadata of each series (everything but its ``data``), and a
+        dataframe with one row per data point and columns "series_id", "date" and
+        "value".
+    """
+    metadata = []
+    series_codes = array("q")
+    period_codes = array("q")
+    values = array("d")
+    periods: dict[str, int] = {}
+    for line in lines:
+        if not _is_fuel_receipts_costs_series(line):
+            continue
+        series = json.loads(line)
+        if not _SERIES_ID_REGEX.match(series.get("series_id", "")):
+            continue
+        data = series.pop("data", [])
+        series_codes.extend(array("q", [len(metadata)]) * len(data))
+        metadata.append(series)
+        for period, value in data:
+            period_codes.append(periods.setdefault(period, len(periods)))
+            values.append(np.nan if value is None else value)
+
+    series_ids = pd.array([series["series_id"] for series in metadata], dtype="string")
+    dates = _parse_periods(pd.Series(list(periods), dtype=object))
+    timeseries = pd.DataFrame(
+        {
+            "series_id": series_ids[np.frombuffer(series_codes, dtype=np.int64)],
+            "date": dates.to_numpy()[np.frombuffer(period_codes, dtype=np.int64)],
+            "value": np.frombuffer(values, dtype=np.float64),
+        }
+    ).convert_dtypes()
+    return metadata, timeseries
 
 
 def _extract(raw_zipfile) -> dict[str, pd.DataFrame]:
     """Extract metadata and timeseries from raw EIA bulk electricity data.
 
+    The 1.1 GB file is decompressed and read one line at a time, keeping only the
+    ~16 MB of fuel receipts and costs series that we actually want.
+
     Args:
-        raw_zipfile: Path or other file-like object that can be read by pd.read_json()
+        raw_zipfile: Path or other file-like object containing a zip archive of the
+            line-delimited JSON bulk data file.
 
     Returns:
         Dictionary of dataframes with keys 'metadata' and 'timeseries'
     """
-    filtered = _filter_and_read_to_dataframe(raw_zipfile)
-    timeseries = _parse_data_column(filtered)
-    metadata = filtered.drop(columns="data")
-    return {"metadata": metadata, "timeseries": timeseries}
+    with ZipFile(raw_zipfile) as archive:
+        members = archive.namelist()
+        if len(members) != 1:
+            raise ValueError(
+                f"Expected a single file in the EIA bulk electricity archive, found "
+                f"{members}."
+            )
+        with archive.open(members[0]) as lines:
+            metadata, timeseries = _read_fuel_receipts_costs_series(lines)
+    return {"metadata": pd.DataFrame(metadata), "timeseries": timeseries}
 
 
 def extract(ds: Datastore) -> dict[str, pd.DataFrame]:
@@ -1,9 +1,16 @@
 """Generic extractor for all FERC XBRL data."""
 
 import io
+import json
+import os
+import shutil
+import sqlite3
 from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from contextlib import closing
 from datetime import date
 from pathlib import Path
+from tempfile import TemporaryDirectory
 
 from dagster import op
 from ferc_xbrl_extractor.cli import run_main
@@ -91,11 +98,106 @@ def xbrl2sqlite_op_factory(form: XbrlFormNumber) -> Callable:
             sql_path=sql_path,
             batch_size=rs.xbrl_batch_size,
             workers=rs.xbrl_num_workers,
+            year_workers=rs.xbrl_year_workers,
         )
 
     return inner_op
 
 
+def _convert_year(
+    filings_archive: io.BytesIO,
+    taxonomy_archive: io.BytesIO,
+    taxonomy_entry_point: str,
+    form: XbrlFormNumber,
+    sql_path: Path,
+    metadata_path: Path,
+    datapackage_path: Path,
+    batch_size: int | None,
+    workers: int | None,
+) -> None:
+    """Convert a single year of XBRL filings to its own SQLite DB.
+
+    This is a module level function so that it can be run in a worker process.
+    """
+    run_main(
+        instance_path=filings_archive,
+        sql_path=sql_path,
+        clobber=False,
+        taxonomy=taxonomy_archive,
+        entry_point=taxonomy_entry_point,
+        form_number=form.value,
+        metadata_path=str(metadata_path),
+        datapackage_path=str(datapackage_path),
+        workers=workers,
+        batch_size=batch_size,
+        loglevel="INFO",
+        logfile=None,
+    )
+
+
+def _merge_sqlite_dbs(year_sql_paths: list[Path], sql_path: Path) -> None:
+    """Append the tables of several SQLite DBs to a single SQLite DB.
+
+    Tables (and their indexes) that don't exist yet in the output DB are created using
+    the schema of the first input DB that contains them. Rows are appended in the order
+    the input DBs are listed.
+
+    Args:
+        year_sql_paths: paths to the SQLite DBs to merge, e.g. one per year of filings.
+        sql_path: path to the SQLite DB to append them to.
+    """
+    with closing(sqlite3.connect(sql_path)) as conn:
+        for year_sql_path in year_sql_paths:
+            conn.execute("ATTACH DATABASE ? AS year_db", (str(year_sql_path),))
+            existing = {
+                name for (name,) in conn.execute("SELECT name FROM main.sqlite_master")
+            }
+            schema = conn.execute(
+                "SELECT type, name, sql FROM year_db.sqlite_master "
+                "WHERE sql IS NOT NULL ORDER BY type = 'index'"
+            ).fetchall()
+            for kind, name, create_sql in schema:
+                if name not in existing:
+                    conn.execute(create_sql)
+                if kind != "table":
+                    continue
+                columns = ", ".join(
+                    f'"{column[1]}"'
+                    for column in conn.execute(f'PRAGMA year_db.table_info("{name}")')
+                )
+                conn.execute(
+                    f'INSERT INTO main."{name}" ({columns}) '  # noqa: S608 - names come from the DB schema
+                    f'SELECT {columns} FROM year_db."{name}"'
+                )
+            conn.commit()
+            conn.execute("DETACH DATABASE year_db")
+
+
+def _write_descriptors(
+    year_sql_path: Path,
+    year_metadata_path: Path,
+    year_datapackage_path: Path,
+    sql_path: Path,
+    metadata_path: Path,
+    datapackage_path: Path,
+) -> None:
+    """Copy the taxonomy metadata and datapackage of a single year to the outputs.
+
+    The datapackage resources refer to the SQLite DB they were extracted to, so they
+    are pointed at the merged DB instead.
+    """
+    if year_metadata_path.exists():
+        shutil.copyfile(year_metadata_path, metadata_path)
+    if year_datapackage_path.exists():
+        datapackage = json.loads(year_datapackage_path.read_text())
+        for resource in datapackage.get("resources", []):
+            if "path" in resource:
+                resource["path"] = resource["path"].replace(
+                    str(year_sql_path), str(sql_path)
+                )
+        datapackage_path.write_text(json.dumps(datapackage))
+
+
 def convert_form(
     form_settings: FercGenericXbrlToSqliteSettings,
     form: XbrlFormNumber,
@@ -104,9 +206,16 @@ def convert_form(
     sql_path: Path,
     batch_size: int | None = None,
     workers: int | None = None,
+    year_workers: int | None = None,
 ) -> None:
     """Clone a single FERC XBRL form to SQLite.
 
+    Each year of filings is parsed independently, so the years are converted
+    concurrently in separate processes, each writing to its own temporary SQLite DB.
+    Those DBs are then merged into ``sql_path`` in the order of the requested years,
+    and the datapackage descriptor and taxonomy metadata of the last year are written
+    to ``output_path``, just as if the years had been converted one after another.
+
     Args:
         form_settings: Validated settings for converting the desired XBRL form to SQLite.
         form: FERC form number.
@@ -114,30 +223,84 @@ def convert_form(
         output_path: PUDL output directory
         sql_path: path to the SQLite DB we'd like to write to.
         batch_size: Number of XBRL filings to process in a single CPU process.
-        workers: Number of CPU processes to create for processing XBRL filings.
+        workers: Number of CPU processes to create for processing XBRL filings within
+            each year. Defaults to splitting the CPUs evenly between the years being
+            converted concurrently.
+        year_workers: Number of years to convert concurrently. Defaults to the number
+            of CPUs. If 1, the years are converted one at a time in this process.
 
     Returns:
         None
     """
-    datapackage_path = str(output_path / f"ferc{form.value}_xbrl_datapackage.json")
-    metadata_path = str(output_path / f"ferc{form.value}_xbrl_taxonomy_metadata.json")
-    # Process XBRL filings for each year requested
-    for year in form_settings.years:
-        taxonomy_archive, taxonomy_entry_point = datastore.get_taxonomy(year, form)
-        filings_archive = datastore.get_filings(year, form)
-        # if we set clobber=True, clobbers on *every* call to run_main;
-        # we already delete the existing base on `clobber=True` in `xbrl2sqlite`
-        run_main(
-            instance_path=filings_archive,
+    years = list(form_settings.years)
+    if not years:
+        return
+    datapackage_path = output_path / f"ferc{form.value}_xbrl_datapackage.json"
+    metadata_path = output_path / f"ferc{form.value}_xbrl_taxonomy_metadata.json"
+    n_cpus = os.cpu_count() or 1
+    year_workers = min(year_workers or n_cpus, len(years))
+    if workers is None:
+        workers = max(1, n_cpus // year_workers)
+
+    # Keep the per-year DBs next to the output DB, as they can be large.
+    with TemporaryDirectory(dir=sql_path.parent) as tmp_dir:
+        year_paths = {
+            year: {
+                "sql_path": Path(tmp_dir) / f"ferc{form.value}_xbrl_{year}.sqlite",
+                "metadata_path": Path(tmp_dir) / f"{year}_{metadata_path.name}",
+                "datapackage_path": Path(tmp_dir) / f"{year}_{datapackage_path.name}",
+            }
+            for year in years
+        }
+
+        def year_args(year: int) -> dict:
+            taxonomy_archive, taxonomy_entry_point = datastore.get_taxonomy(year, form)
+            return {
+                "filings_archive": datastore.get_filings(year, form),
+                "taxonomy_archive": taxonomy_archive,
+                "taxonomy_entry_point": taxonomy_entry_point,
+                "form": form,
+                "batch_size": batch_size,
+                "workers": workers,
+            } | year_paths[year]
+
+        if year_workers == 1:
+            for year in years:
+                _convert_year(**year_args(year))
+        else:
+            logger.info(
+                f"Converting {len(years)} years of FERC Form {form.value} XBRL "
+                f"filings using {year_workers} processes."
+            )
+            with ProcessPoolExecutor(max_workers=year_workers) as executor:
+                # Only fetch the archives of a year once a process is free to convert
+                # it, so no more than year_workers years are held in memory at once.
+                futures = set()
+                for year in years:
+                    if len(futures) >= year_workers:
+                        done, futures = wait(futures, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            future.result()
+                    futures.add(executor.submit(_convert_year, **year_args(year)))
+                for future in futures:
+                    future.result()
+
+        _merge_sqlite_dbs(
+            [
+                paths["sql_path"]
+                for paths in year_paths.values()
+                if paths["sql_path"].exists()
+            ],
+            sql_path,
+        )
+
+        # Every year writes the same descriptors, the last of which used to win.
+        last_year = year_paths[years[-1]]
+        _write_descriptors(
+            year_sql_path=last_year["sql_path"],
+            year_metadata_path=last_year["metadata_path"],
+            year_datapackage_path=last_year["datapackage_path"],
             sql_path=sql_path,
-            clobber=False,
-            taxonomy=taxonomy_archive,
-            entry_point=taxonomy_entry_point,
-            form_number=form.value,
             metadata_path=metadata_path,
             datapackage_path=datapackage_path,
-            workers=workers,
-            batch_size=batch_size,
-            loglevel="INFO",
-            logfile=None,
         )
@@ -92,6 +92,15 @@ def ferc_to_sqlite_job_factory(
         "Defaults to using the number of CPUs."
     ),
 )
+@click.option(
+    "--year-workers",
+    type=int,
+    default=None,
+    help=(
+        "Number of years of XBRL filings to convert concurrently for each form. "
+        "Defaults to using the number of CPUs."
+    ),
+)
 @click.option(
     "--dagster-workers",
     type=int,
@@ -147,6 +156,7 @@ def main(
     etl_settings_yml: pathlib.Path,
     batch_size: int,
     workers: int | None,
+    year_workers: int | None,
     dagster_workers: int,
     clobber: bool,
     gcs_cache_path: str,
@@ -187,6 +197,7 @@ def main(
             "runtime_settings": {
                 "config": {
                     "xbrl_num_workers": workers,
+                    "xbrl_year_workers": year_workers,
                     "xbrl_batch_size": batch_size,
                     "clobber": clobber,
                 },
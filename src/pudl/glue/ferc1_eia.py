@@ -202,16 +202,9 @@ class GenericPlantFerc1TableTransformer(Ferc1AbstractTableTransformer):
         self.table_id = table_id
         super().__init__(**kwargs)
 
-    def transform(
-        self,
-        raw_dbf: pd.DataFrame,
-        raw_xbrl_instant: pd.DataFrame,
-        raw_xbrl_duration: pd.DataFrame,
-    ) -> pd.DataFrame:
-        """Only apply the generic :meth:``transform_start``."""
-        return self.transform_start(raw_dbf, raw_xbrl_instant, raw_xbrl_duration).pipe(
-            self.transform_main
-        )
+    def transform_end(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Skip the final cleanup, which only applies to fully transformed tables."""
+        return df
 
     def transform_main(self, df: pd.DataFrame) -> pd.DataFrame:
         """Basic name normalization and dropping of invalid rows."""
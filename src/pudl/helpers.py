@@ -10,11 +10,13 @@ with cleaning and restructing dataframes.
 import importlib.resources
 import itertools
 import json
+import math
+import os
 import pathlib
 import re
 import shutil
 from collections import defaultdict
-from collections.abc import Generator, Iterable
+from collections.abc import Callable, Generator, Iterable
 from functools import partial
 from io import BytesIO
 from typing import Any, Literal, NamedTuple
@@ -42,8 +44,17 @@ values as if they were zero. E.g. when calculating the heat rates of generation
 if there are some months where fuel consumption is reported as NA, but electricity
 generation is reported normally, then the fuel consumption for the year needs to be NA,
 otherwise we'll get unrealistic heat rates.
+
+Passed to :meth:`pandas.core.groupby.DataFrameGroupBy.agg` it is called once for every
+group. Use :func:`groupby_agg` to aggregate large tables with it.
 """
 
+min_na = partial(pd.Series.min, skipna=False)
+"""A min function that returns NA if the Series includes any NA values."""
+
+max_na = partial(pd.Series.max, skipna=False)
+"""A max function that returns NA if the Series includes any NA values."""
+
 logger = pudl.logging_helpers.get_logger(__name__)
 
 
@@ -446,18 +457,22 @@ def full_timeseries_date_merge(
     return out
 
 
-def _add_suffix_to_date_on(date_on):
-    """Check date_on list is valid and add _temp_for_merge suffix."""
+def _date_merge_periods(dates: pd.Series, date_on: list[str] | None) -> np.ndarray:
+    """Code the periods of the dates at the granularity of ``date_on`` as numbers.
+
+    The codes sort in the same order as the parts of the dates listed in ``date_on``.
+    """
     if date_on is None:
         date_on = ["year"]
-    date_on_suffix = []
+    n_digits = {"year": 4, "quarter": 1, "month": 2, "day": 2}
+    periods = np.zeros(len(dates))
     for col in date_on:
-        if col not in ["year", "month", "quarter", "day"]:
+        if col not in n_digits:
             raise AssertionError(
                 logger.error(f"{col} is not a valid string in date_on column list.")
             )
-        date_on_suffix.append(col + "_temp_for_merge")
-    return date_on_suffix
+        periods = periods * 10 ** n_digits[col] + getattr(dates.dt, col).to_numpy()
+    return periods
 
 
 def date_merge(
@@ -477,12 +492,12 @@ def date_merge(
     We often need to bring together data that is reported at different
     temporal granularities e.g. monthly basis versus annual basis. This function
     acts as a wrapper on a pandas merge to allow merging at different temporal
-    granularities. The date columns of both dataframes are separated into
-    year, quarter, month, and day columns. Then, the dataframes are merged according
-    to ``how`` on the columns specified by the ``on`` and ``date_on`` argument,
-    which list the new temporal columns to merge on as well any additional shared columns.
-    Finally, the datetime column is reconstructed in the output dataframe and
-    named according to the ``new_date_col`` parameter.
+    granularities. The dates of both dataframes are coded as numbers identifying their
+    periods at the granularity given by ``date_on``, e.g. ``year * 100 + month`` for
+    ``["year", "month"]``. Then, the dataframes are merged according to ``how`` on
+    these period codes and the additional shared columns listed in ``on``. Finally,
+    the datetime column is reconstructed in the output dataframe and named according
+    to the ``new_date_col`` parameter.
 
     Args:
         left: The left dataframe in the merge. Typically monthly in our use
@@ -502,14 +517,12 @@ def date_merge(
             ``report_date``. Must be a Datetime or convertible to a Datetime using
             :func:`pandas.to_datetime`.
         new_date_col: Name of the reconstructed datetime column in the output dataframe.
-        date_on: The temporal columns to merge on. Values in this list
-            of columns must be [``year``, ``quarter``, ``month``, ``day``].
-            E.g. if a monthly reported dataframe is being merged onto a daily reported
-            dataframe, then the merge would be performed on ``["year", "month"]``.
-            If one of these temporal columns already exists in the dataframe it will not
-            be clobbered by the merge, as the suffix "_temp_for_merge" is added when
-            expanding the datetime column into year, quarter, month, and day. By default,
-            `date_on` will just include year.
+        date_on: The parts of the dates to merge on. Values in this list must be
+            [``year``, ``quarter``, ``month``, ``day``]. E.g. if a monthly reported
+            dataframe is being merged onto a daily reported dataframe, then the merge
+            would be performed on ``["year", "month"]``. No columns are added to the
+            dataframes, so existing columns with these names aren't affected. By
+            default, `date_on` will just include year.
         how: How the dataframes should be merged. See :func:`pandas.DataFrame.merge`.
         report_at_start: Whether the data in the dataframe whose report date is not being
             kept in the merged output (in most cases the less frequently reported dataframe)
@@ -527,45 +540,50 @@ def date_merge(
         ValueError: if any of the labels referenced in ``on`` are missing from either
             the left or right dataframes.
     """
-
-    def separate_date_cols(df, date_col_name, date_on):
-        out_df = df.copy()
-        out_df.loc[:, date_col_name] = pd.to_datetime(out_df[date_col_name])
-        if "year_temp_for_merge" in date_on:
-            out_df.loc[:, "year_temp_for_merge"] = out_df[date_col_name].dt.year
-        if "quarter_temp_for_merge" in date_on:
-            out_df.loc[:, "quarter_temp_for_merge"] = out_df[date_col_name].dt.quarter
-        if "month_temp_for_merge" in date_on:
-            out_df.loc[:, "month_temp_for_merge"] = out_df[date_col_name].dt.month
-        if "day_temp_for_merge" in date_on:
-            out_df.loc[:, "day_temp_for_merge"] = out_df[date_col_name].dt.day
-        return out_df
-
     right = convert_col_to_datetime(right, right_date_col)
     left = convert_col_to_datetime(left, left_date_col)
-    date_on = _add_suffix_to_date_on(date_on)
-    right = separate_date_cols(right, right_date_col, date_on)
-    left = separate_date_cols(left, left_date_col, date_on)
-    merge_cols = date_on + on
-    out = pd.merge(left, right, on=merge_cols, how=how, **kwargs)
+    # Merge on the numerically coded periods of the dates, rather than adding year,
+    # quarter, month and day columns to copies of both dataframes. The periods are
+    # set as a named index of views of the dataframes, so neither is copied.
+    period_col = "_date_merge_period"
+    left_periods = _date_merge_periods(left[left_date_col], date_on)
+    right_periods = _date_merge_periods(right[right_date_col], date_on)
+    out = pd.merge(
+        left.set_axis(pd.Index(left_periods, name=period_col), copy=False),
+        right.set_axis(pd.Index(right_periods, name=period_col), copy=False),
+        on=[period_col] + on,
+        how=how,
+        **kwargs,
+    ).reset_index(drop=True)
 
     suffixes = ["", ""]
     if left_date_col == right_date_col:
         suffixes = kwargs.get("suffixes", ["_x", "_y"])
     # reconstruct the new report date column and clean up columns
     left_right_date_col = [left_date_col + suffixes[0], right_date_col + suffixes[1]]
-    if report_at_start:
+    dates = out[left_right_date_col]
+    date_dtype = dates.dtypes.iloc[0]
+    if isinstance(date_dtype, np.dtype) and (dates.dtypes == date_dtype).all():
         # keep the later of the two report dates when determining
-        # the new report date for each row
-        reconstructed_date = out[left_right_date_col].max(axis=1)
+        # the new report date for each row, or else the earlier one, ignoring NaTs
+        reduce = np.fmax if report_at_start else np.fmin
+        reconstructed_date = reduce(*(dates[col].to_numpy() for col in dates))
+    elif report_at_start:
+        reconstructed_date = dates.max(axis=1)
     else:
-        # keep the earlier of the two report dates
-        reconstructed_date = out[left_right_date_col].min(axis=1)
-    out = out.drop(left_right_date_col + date_on, axis=1)
+        reconstructed_date = dates.min(axis=1)
+    out = out.drop(left_right_date_col, axis=1)
     out.insert(loc=0, column=new_date_col, value=reconstructed_date)
     return out
 
 
+_EXPAND_TIMESERIES_PERIODS = {
+    pd.tseries.frequencies.to_offset(freq): period_freq
+    for freq, period_freq in [("D", "D"), ("MS", "M"), ("QS", "Q"), ("YS", "Y")]
+}
+"""Period frequencies of the timeseries frequencies expanded without resampling."""
+
+
 def expand_timeseries(
     df: pd.DataFrame,
     key_cols: list[str],
@@ -598,19 +616,103 @@ def expand_timeseries(
         ValueError: if ``fill_through_freq`` is not one of "year", "month" or "day".
     """
     try:
-        pd.tseries.frequencies.to_offset(freq)
+        offset = pd.tseries.frequencies.to_offset(freq)
     except ValueError:
         logger.exception(
             f"Frequency string {freq} is not valid. \
             See Pandas Timeseries Offset Aliases docs for valid strings."
         )
+        offset = None
+
+    df = convert_col_to_datetime(df, date_col)
+    if (
+        offset not in _EXPAND_TIMESERIES_PERIODS
+        or fill_through_freq not in ["year", "month", "day"]
+        or df.empty
+        or any(isinstance(df[col].dtype, pd.CategoricalDtype) for col in key_cols)
+    ):
+        return _expand_timeseries_by_resampling(
+            df, key_cols, date_col, freq, fill_through_freq
+        )
+    period_freq = _EXPAND_TIMESERIES_PERIODS[offset]
+
+    # Sort the records with dates by group, and then date. Records with NA keys are
+    # dropped, like they are by groupby.
+    codes = df.groupby(key_cols).ngroup().to_numpy()
+    dates = df[date_col]
+    rows = np.flatnonzero(~np.isnan(codes) & dates.notna().to_numpy())
+    rows = rows[np.lexsort((dates.to_numpy()[rows], codes[rows]))]
+    codes = np.unique(codes[rows], return_inverse=True)[1]
+    dates = dates.iloc[rows]
+    periods = dates.dt.to_period(period_freq)
+
+    # The timeseries of each group runs from the period of its first record through
+    # the last period starting before the end of its last reported fill_through_freq.
+    group_starts = np.flatnonzero(np.diff(codes, prepend=-1))
+    group_ends = np.append(group_starts[1:], len(codes)) - 1
+    last_dates = dates.iloc[group_ends]
+    if fill_through_freq == "year":
+        end_dates = (last_dates.dt.to_period("Y") + 1).dt.start_time
+    elif fill_through_freq == "month":
+        end_dates = (last_dates.dt.to_period("M") + 1).dt.start_time
+    else:
+        end_dates = last_dates + pd.tseries.offsets.DateOffset(days=1)
+    first_periods = periods.array.asi8[group_starts]
+    last_periods = (
+        (end_dates - pd.Timedelta(1, unit="ns")).dt.to_period(period_freq).array.asi8
+    )
+    n_periods = last_periods - first_periods + 1
+    out_starts = np.cumsum(n_periods) - n_periods
+    out_groups = np.repeat(np.arange(len(n_periods)), n_periods)
+    out_periods = (
+        np.arange(n_periods.sum()) - out_starts[out_groups] + first_periods[out_groups]
+    )
+
+    # Each period is filled with the last record reported at or before its start.
+    record_periods = periods.array.asi8 + (dates > periods.dt.start_time).to_numpy()
+    record_positions = out_starts[codes] + record_periods - first_periods[codes]
+    fill_from = (
+        np.searchsorted(record_positions, np.arange(len(out_groups)), side="right") - 1
+    )
+    filled = (fill_from >= 0) & (codes[fill_from] == out_groups)
+
+    data_cols = [col for col in df.columns if col not in key_cols + [date_col]]
+    # The dtypes of the data columns are the same as if missing values were added.
+    dtypes = pd.concat([df.iloc[:1], df.iloc[:1][key_cols + [date_col]]]).dtypes
+    out = (
+        df.iloc[rows[np.where(filled, fill_from, group_starts[out_groups])]]
+        .reset_index(drop=True)
+        .assign(
+            **{
+                date_col: pd.PeriodIndex.from_ordinals(out_periods, freq=period_freq)
+                .to_timestamp()
+                .astype(dates.dtype)
+            }
+        )
+        .astype(dtypes)
+    )[key_cols + [date_col] + data_cols]
+    if not filled.all():
+        out.loc[~filled, data_cols] = np.nan
+    return out.pipe(apply_pudl_dtypes)
+
+
+def _expand_timeseries_by_resampling(
+    df: pd.DataFrame,
+    key_cols: list[str],
+    date_col: str,
+    freq: str,
+    fill_through_freq: Literal["year", "month", "day"],
+) -> pd.DataFrame:
+    """Expand a dataframe to a full time series with :meth:`Resampler.ffill`.
 
+    Used by :func:`expand_timeseries` for frequencies which aren't the start of a
+    calendar period. See :func:`expand_timeseries` for the arguments.
+    """
     # For each group of ID columns add a dummy record with the date column
     # equal to one increment higher than the last record in the group for the
     # desired fill_through_freq.
     # This allows records to be filled through the end of the last reported period
     # and then this dummy record is dropped
-    df = convert_col_to_datetime(df, date_col)
     end_dates = df.groupby(key_cols).agg({date_col: "max"})
     if fill_through_freq == "year":
         end_dates.loc[:, date_col] = pd.to_datetime(
@@ -654,6 +756,85 @@ def expand_timeseries(
     )
 
 
+def distribute_annually_reported_data_to_months(
+    df: pd.DataFrame,
+    key_cols: list[str],
+    data_col: str,
+    date_col: str = "report_date",
+    respondent_cols: list[str] = ["plant_id_eia"],
+) -> pd.DataFrame:
+    """Spread data reported once a year evenly across the months of that year.
+
+    A record is reported annually if it is the only record with a non-null, non-zero
+    value in ``data_col`` out of the 12 monthly records of its group of ``key_cols``
+    in a year, and it falls in January or December. All of the records of a
+    respondent in a year that has any annually reported records are replaced by 12
+    monthly records for each of the annually reported records, with the other columns
+    copied from the annual record and 1/12th of its ``data_col`` value. The records of
+    all other respondent-years are returned unchanged.
+
+    The groups are identified with integer codes of the keys and years, so the whole
+    table is classified and broadcast in a few vectorized passes. A warning is logged
+    if fewer than 40% of the records that were reported once a year are in January or
+    December, as that undermines the assumption about which records are annual.
+
+    Args:
+        df: A table of monthly records.
+        key_cols: The primary key columns of ``df``. May include ``date_col``.
+        data_col: The name of the data column to distribute to months.
+        date_col: The name of the monthly datetime column.
+        respondent_cols: The columns identifying the respondent whose records in a
+            year are all considered to be annual if any of them are annual.
+
+    Returns:
+        A table with the same columns as ``df``, with the records of the monthly
+        reporters first, in their original order, followed by the 12 monthly records
+        of each annual record, in the order of the annual records in ``df``.
+    """
+    year = df[date_col].dt.year
+    id_cols = [df[col] for col in key_cols if col != date_col]
+    key_year = df.groupby(id_cols + [year], dropna=False, sort=False).ngroup()
+    respondent_year = df.groupby(
+        [df[col] for col in respondent_cols] + [year], dropna=False, sort=False
+    ).ngroup()
+
+    # count the months with missing (or zero) data in each key-year
+    missing = (df[data_col].isnull() | np.isclose(df[data_col], 0)).to_numpy()
+    n_missing = np.bincount(key_year, weights=missing)[key_year]
+    once_a_year = ~missing & (n_missing == 11)
+    annual = once_a_year & df[date_col].dt.month.isin([1, 12]).to_numpy()
+
+    # check if the plurality of the once_a_year_reporters are in Jan or Dec
+    if once_a_year.any() and (perc_of_annual := annual.sum() / once_a_year.sum()) < 0.4:
+        logger.warning(
+            f"Less than 40% ({perc_of_annual:.0%}) of the once-a-year reporters "
+            "are in January or December. Examine assumption about annual reporters."
+        )
+    logger.info(
+        f"Distributing {annual.sum() / max(len(df), 1):.1%} annually reported"
+        " records to months."
+    )
+    annual_respondent_year = np.bincount(respondent_year, weights=annual)[
+        respondent_year
+    ].astype(bool)
+
+    # broadcast each annual record to the 12 months of its year
+    annual_records = df.iloc[np.flatnonzero(annual).repeat(12)]
+    year_start = annual_records[date_col].to_numpy().astype("datetime64[Y]")
+    monthly_annual_records = annual_records.assign(
+        **{
+            date_col: (
+                year_start.astype("datetime64[M]")
+                + np.tile(np.arange(12), annual.sum())
+            ).astype(df[date_col].dtype),
+            data_col: annual_records[data_col] / 12,
+        }
+    )
+    return pd.concat(
+        [df.loc[~annual_respondent_year], monthly_annual_records], ignore_index=True
+    )
+
+
 def organize_cols(df: pd.DataFrame, cols: list[str]) -> pd.DataFrame:
     """Organize columns into key ID & name fields & alphabetical data columns.
 
@@ -1599,6 +1780,77 @@ def weighted_average(
     return result.to_frame(name=data_col)  # .reset_index()
 
 
+def _sum_na_by_group(values: np.ndarray, codes: np.ndarray, ngroups: int) -> np.ndarray:
+    """Sum the values of each group, in the order they appear, propagating NaNs.
+
+    numpy sums the values of each group pairwise, so the sums depend on the number and
+    order of the values. Lining up the groups that have the same number of values as
+    the rows of a 2D array and summing each row gives sums that are bit-for-bit
+    identical to summing each group on its own, as :data:`sum_na` does.
+    """
+    order = np.argsort(codes, kind="stable")
+    values = values[order]
+    counts = np.bincount(codes, minlength=ngroups)
+    starts = np.cumsum(counts) - counts
+    sums = np.zeros(ngroups, dtype=values.dtype)
+    for count in np.unique(counts[counts > 0]):
+        groups = np.flatnonzero(counts == count)
+        sums[groups] = values[starts[groups, None] + np.arange(count)].sum(axis=1)
+    return sums
+
+
+def groupby_agg(
+    gb: pd.core.groupby.DataFrameGroupBy, agg: dict[str, str | Callable]
+) -> pd.DataFrame:
+    """Aggregate grouped columns, with vectorized NA-propagating sums, mins and maxes.
+
+    Gives the same results as ``gb.agg(agg)``, but the numeric columns which are
+    aggregated with :data:`sum_na`, :data:`min_na` or :data:`max_na` are aggregated for
+    all of the groups at once, rather than by calling the function on each group. The
+    mins and maxes use the cythonized pandas groupby methods, and the sums are
+    calculated with numpy so that they are bit-for-bit identical to :data:`sum_na`.
+    The other columns are aggregated by pandas as usual.
+
+    Args:
+        gb: A grouped dataframe, with the group keys as its index (``as_index=True``).
+        agg: A dictionary mapping each column to aggregate to a single aggregation
+            function or the name of one.
+
+    Returns:
+        A table of the aggregated columns, in the order of ``agg``, indexed by the
+        group keys.
+    """
+    na_aggs = {
+        col: func
+        for col, func in agg.items()
+        if any(func is na_func for na_func in [sum_na, min_na, max_na])
+        and isinstance(gb.obj[col].dtype, np.dtype)
+        and gb.obj[col].dtype.kind in "fiu"
+    }
+    if not na_aggs or not gb.as_index:
+        return gb.agg(agg)
+
+    other_aggs = {col: func for col, func in agg.items() if col not in na_aggs}
+    aggregated = gb.agg(other_aggs) if other_aggs else gb.size().to_frame()
+    # unobserved categorical groups don't have group codes
+    if len(aggregated) != gb.ngroups:
+        return gb.agg(agg)
+    # rows with NA group keys that were dropped from the groups have NA codes
+    codes = gb.ngroup()
+    in_group = codes.notna().to_numpy()
+    codes = codes.to_numpy()[in_group].astype(int)
+    for col, func in na_aggs.items():
+        if func is sum_na and gb.obj[col].dtype.kind == "f":
+            values = gb.obj[col].to_numpy()[in_group]
+            aggregated[col] = _sum_na_by_group(values, codes, gb.ngroups)
+        elif func is sum_na:
+            aggregated[col] = gb[col].sum()
+        else:
+            has_na = gb[col].count() < gb[col].size()
+            aggregated[col] = getattr(gb[col], func.func.__name__)().mask(has_na)
+    return aggregated[list(agg)]
+
+
 def sum_and_weighted_average_agg(
     df_in: pd.DataFrame,
     by: list[str],
@@ -1897,8 +2149,76 @@ def scale_by_ownership(
     return gens
 
 
+def get_memory_budget_concurrency_limits(
+    memory_budget_gb: float,
+    memory_use_estimates_gb: dict[str | None, float],
+    max_workers: int = 0,
+) -> tuple[int, list[dict]]:
+    """Limit step concurrency so the estimated memory use stays within a budget.
+
+    Dagster can only limit the number of steps running at once, overall and for each
+    value of a tag. We choose these limits so that even in the worst case, in which
+    every tier of the ``memory-use`` tag runs as many steps as it is allowed to, and
+    the remaining workers run untagged steps, the combined estimated memory use is
+    within the budget. Each tier is allowed to run at least one step at a time, and
+    any remaining memory is used to run more of the most memory hungry steps first.
+
+    Args:
+        memory_budget_gb: total memory available to the steps, in GB.
+        memory_use_estimates_gb: estimated peak memory use in GB of a step with each
+            value of the ``memory-use`` tag. The key None gives the estimate for steps
+            which aren't tagged, and must be present.
+        max_workers: maximum number of steps to run at once. If 0, use the number of
+            CPUs.
+
+    Returns:
+        The maximum number of steps to run at once, and the tag concurrency limits to
+        apply to each value of the ``memory-use`` tag.
+
+    Raises:
+        ValueError: if the budget can't accommodate running one step of each tier and
+            one untagged step at the same time.
+    """
+    untagged_gb = memory_use_estimates_gb[None]
+    extra_gb = {
+        tag: max(estimate_gb - untagged_gb, 0.0)
+        for tag, estimate_gb in memory_use_estimates_gb.items()
+        if tag is not None
+    }
+    reserved_gb = sum(extra_gb.values())
+    max_concurrent = min(
+        max_workers or os.cpu_count(),
+        math.floor((memory_budget_gb - reserved_gb) / untagged_gb),
+    )
+    if max_concurrent < 1:
+        raise ValueError(
+            f"A memory budget of {memory_budget_gb} GB is too small to run one step "
+            f"of each memory-use tier at once. At least {reserved_gb + untagged_gb} GB "
+            "is needed."
+        )
+
+    remaining_gb = memory_budget_gb - reserved_gb - max_concurrent * untagged_gb
+    tag_concurrency_limits = []
+    for tag, tag_extra_gb in sorted(
+        extra_gb.items(), key=lambda item: item[1], reverse=True
+    ):
+        additional_steps = max_concurrent - 1
+        if tag_extra_gb > 0:
+            additional_steps = min(
+                additional_steps, math.floor(remaining_gb / tag_extra_gb)
+            )
+        remaining_gb -= additional_steps * tag_extra_gb
+        tag_concurrency_limits.append(
+            {"key": "memory-use", "value": tag, "limit": 1 + additional_steps}
+        )
+    return max_concurrent, tag_concurrency_limits
+
+
 def get_dagster_execution_config(
-    num_workers: int = 0, tag_concurrency_limits: list[dict] = []
+    num_workers: int = 0,
+    tag_concurrency_limits: list[dict] = [],
+    memory_budget_gb: float | None = None,
+    memory_use_estimates_gb: dict[str | None, float] | None = None,
 ):
     """Get the dagster execution config for a given number of workers.
 
@@ -1907,6 +2227,11 @@ def get_dagster_execution_config(
     executor, otherwise multi-process executor with maximum of num_workers
     will be used.
 
+    If a memory budget is given, the number of workers and the concurrency limits
+    on the ``memory-use`` tag are chosen so that the estimated memory use of the
+    steps running at once stays within the budget. See
+    :func:`get_memory_budget_concurrency_limits`.
+
     Args:
         num_workers: The number of workers to use for the dagster execution config.
             If 0, then the dagster execution config will not include a multiprocess
@@ -1920,6 +2245,11 @@ def get_dagster_execution_config(
             all values of that key. If the value is set to a dict with
             `applyLimitPerUniqueValue: true`, the limit will apply to the number
             of unique values for that key. Note that these limits are per run, not global.
+        memory_budget_gb: Total memory in GB available to the steps of the run. If
+            None, steps are not scheduled based on their memory use.
+        memory_use_estimates_gb: Estimated peak memory use in GB of a step with each
+            value of the ``memory-use`` tag, with the key None for untagged steps.
+            Required if a memory budget is given.
 
     Returns:
         A dagster execution config.
@@ -1932,6 +2262,19 @@ def get_dagster_execution_config(
                 },
             },
         }
+    if memory_budget_gb is not None:
+        num_workers, memory_use_limits = get_memory_budget_concurrency_limits(
+            memory_budget_gb=memory_budget_gb,
+            memory_use_estimates_gb=memory_use_estimates_gb,
+            max_workers=num_workers,
+        )
+        tag_concurrency_limits = [
+            limit for limit in tag_concurrency_limits if limit["key"] != "memory-use"
+        ] + memory_use_limits
+        logger.info(
+            f"Running up to {num_workers} steps within a {memory_budget_gb} GB memory "
+            f"budget, with memory-use limits: {memory_use_limits}"
+        )
     return {
         "execution": {
             "config": {
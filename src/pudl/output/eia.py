@@ -620,10 +620,13 @@ def assign_unit_ids(gens_df: pd.DataFrame) -> pd.DataFrame:
     """Group generators into operational units using various heuristics.
 
     Splits a few columns off from the big generator dataframe and uses several
-    heuristic functions to fill in missing unit_id_pudl values beyond those that
+    heuristic rules to fill in missing unit_id_pudl values beyond those that
     are generated in the boiler generator association process. Then merges the
     new unit ID values back in to the generators dataframe.
 
+    The rules are applied in priority order by :class:`GeneratorUnitAssigner`, each
+    only assigning unit IDs to generators which don't have one yet.
+
     Args:
         gens_df: An EIA generator table. Must contain at least the columns:
             ``report_date``, ``plant_id_eia``, ``generator_id``, ``unit_id_pudl``,
@@ -655,70 +658,57 @@ def assign_unit_ids(gens_df: pd.DataFrame) -> pd.DataFrame:
         errstr = f"Input DataFrame missing required columns: {missing_cols}."
         raise ValueError(errstr)
 
-    unit_ids = (
-        gens_df.loc[:, required_cols]
-        # Forward and back fill preexisting Unit IDs:
-        .pipe(fill_unit_ids)
-        # Assign Unit IDs to the CT+CA CC generators:
-        .pipe(assign_cc_unit_ids)
-        # For whole-combined cycle (CC) and single-shaft combined cycle (CS)
-        # units, we give each generator their own unit ID. We do the same for
-        # internal combustion and simple-cycle gas combustion turbines.
-        .pipe(assign_single_gen_unit_ids, prime_mover_codes=["CC", "CS", "GT", "IC"])
-        # Nuclear units don't report in core_eia923__monthly_boiler_fuel or core_eia923__monthly_generation
-        # Their fuel consumption is reported as mmbtu in core_eia923__monthly_generation_fuel
-        # Their net generation also only shows up in core_eia923__monthly_generation_fuel
-        # The core_eia923__monthly_generation_fuel table records a "nuclear_unit_id" which
-        # appears to be the same as the associated generator_id. However, we
-        # can't use that as a unit_id_pudl since it might have a collision with
-        # other already assigned unit_id_pudl values in the same plant for
-        # generators with other fuel types. Thus we still need to assign them
-        # a fuel-and-prime-mover based unit ID here. For now ALL nuclear plants
-        # use steam turbines.
-        .pipe(
-            assign_single_gen_unit_ids,
-            prime_mover_codes=["ST"],
-            fuel_type_code_pudl="nuclear",
-            label_prefix="nuclear",
-        )
-        # In these next 4 assignments, we lump together all steam turbine (ST)
-        # generators that have a consistent simplified fuel_type_code_pudl
-        # across all years within a given plant into the same unit, since we
-        # won't be able to distinguish them in the core_eia923__monthly_generation_fuel
-        # table. This will lump together solid fuels like BIT, LIG, SUB, PC etc.
-        # under "coal".  There are a few cases in which a generator has truly
-        # changed its fuel type, e.g. coal-to-gas conversions but these are
-        # rare and insubstantial. They will not be assigned a Unit ID in this
-        # process. Non-fuel steam generation is also left out (geothermal &
-        # solar thermal)
-        .pipe(
-            assign_prime_fuel_unit_ids,
-            prime_mover_code="ST",
-            fuel_type_code_pudl="coal",
-        )
-        .pipe(
-            assign_prime_fuel_unit_ids, prime_mover_code="ST", fuel_type_code_pudl="oil"
-        )
-        .pipe(
-            assign_prime_fuel_unit_ids, prime_mover_code="ST", fuel_type_code_pudl="gas"
-        )
-        .pipe(
-            assign_prime_fuel_unit_ids,
-            prime_mover_code="ST",
-            fuel_type_code_pudl="waste",
-        )
-        # Retain only the merge keys and output columns
-        .loc[
-            :,
-            [
-                "plant_id_eia",  # Merge key
-                "generator_id",  # Merge key
-                "report_date",  # Merge key
-                "unit_id_pudl",  # Output column
-                "bga_source",  # Output column
-            ],
-        ]
+    # Forward and back fill preexisting Unit IDs:
+    unit_ids = gens_df.loc[:, required_cols].pipe(fill_unit_ids)
+    assigner = GeneratorUnitAssigner(unit_ids)
+    # Assign Unit IDs to the CT+CA CC generators:
+    assigner.assign_cc_unit_ids()
+    # For whole-combined cycle (CC) and single-shaft combined cycle (CS)
+    # units, we give each generator their own unit ID. We do the same for
+    # internal combustion and simple-cycle gas combustion turbines.
+    assigner.assign_single_gen_unit_ids(prime_mover_codes=["CC", "CS", "GT", "IC"])
+    # Nuclear units don't report in core_eia923__monthly_boiler_fuel or core_eia923__monthly_generation
+    # Their fuel consumption is reported as mmbtu in core_eia923__monthly_generation_fuel
+    # Their net generation also only shows up in core_eia923__monthly_generation_fuel
+    # The core_eia923__monthly_generation_fuel table records a "nuclear_unit_id" which
+    # appears to be the same as the associated generator_id. However, we
+    # can't use that as a unit_id_pudl since it might have a collision with
+    # other already assigned unit_id_pudl values in the same plant for
+    # generators with other fuel types. Thus we still need to assign them
+    # a fuel-and-prime-mover based unit ID here. For now ALL nuclear plants
+    # use steam turbines.
+    assigner.assign_single_gen_unit_ids(
+        prime_mover_codes=["ST"],
+        fuel_type_code_pudl="nuclear",
+        label_prefix="nuclear",
     )
+    # In these next 4 assignments, we lump together all steam turbine (ST)
+    # generators that have a consistent simplified fuel_type_code_pudl
+    # across all years within a given plant into the same unit, since we
+    # won't be able to distinguish them in the core_eia923__monthly_generation_fuel
+    # table. This will lump together solid fuels like BIT, LIG, SUB, PC etc.
+    # under "coal".  There are a few cases in which a generator has truly
+    # changed its fuel type, e.g. coal-to-gas conversions but these are
+    # rare and insubstantial. They will not be assigned a Unit ID in this
+    # process. Non-fuel steam generation is also left out (geothermal &
+    # solar thermal)
+    for fuel_type_code_pudl in ["coal", "oil", "gas", "waste"]:
+        assigner.assign_prime_fuel_unit_ids(
+            prime_mover_code="ST", fuel_type_code_pudl=fuel_type_code_pudl
+        )
+    # Retain only the merge keys and output columns
+    unit_ids = unit_ids.assign(
+        unit_id_pudl=assigner.unit_id_pudl, bga_source=assigner.bga_source
+    ).loc[
+        :,
+        [
+            "plant_id_eia",  # Merge key
+            "generator_id",  # Merge key
+            "report_date",  # Merge key
+            "unit_id_pudl",  # Output column
+            "bga_source",  # Output column
+        ],
+    ]
     # Check that each generator is only ever associated with a single unit,
     # at least within the codes that we've just assigned -- the Unit IDs that
     # are based on the EIA boiler-generator-association or other matching
@@ -822,355 +812,231 @@ def fill_unit_ids(gens_df: pd.DataFrame) -> pd.DataFrame:
     return gens_df
 
 
-def max_unit_id_by_plant(gens_df: pd.DataFrame) -> pd.DataFrame:
-    """Identify the largest unit ID associated with each plant so we don't overlap.
+class GeneratorUnitAssigner:
+    """Assign PUDL Unit IDs to generators using a sequence of heuristic rules.
 
-    The PUDL Unit IDs are sequentially assigned integers. To assign a new ID, we
-    need to know the largest existing Unit ID within a plant. This function
-    calculates that largest existing ID, or uses zero, if no Unit IDs are set
-    within the plant.
+    The generator table is reduced once to integer codes identifying each plant,
+    generator and plant-year, and the unit IDs and their sources are kept in arrays
+    which each rule updates in place using boolean masks. The largest unit ID within
+    each plant is also only calculated once, and kept up to date as new unit IDs are
+    assigned, so that new IDs never overlap with existing ones.
 
-    Note that this calculation depends on having all of the pre-existing
-    generators and units still available in the dataframe!
-
-    Args:
-        gens_df: A core_eia860__scd_generators dataframe containing at
-            least the columns plant_id_eia and unit_id_pudl.
-
-    Returns:
-        A DataFrame having two columns: plant_id_eia and max_unit_id_pudl
-        in which each row should be unique.
+    Each rule only assigns unit IDs to generators that don't have one yet, so the
+    order in which the rules are applied determines their priority.
     """
-    return (
-        gens_df[["plant_id_eia", "unit_id_pudl"]]
-        .drop_duplicates()
-        .groupby("plant_id_eia")
-        .agg({"unit_id_pudl": max})
-        .fillna(0)
-        .rename(columns={"unit_id_pudl": "max_unit_id_pudl"})
-        .reset_index()
-    )
 
+    def __init__(self, gens_df: pd.DataFrame):
+        """Encode the generator table.
 
-def _append_masked_units(
-    gens_df: pd.DataFrame,
-    row_mask: np.ndarray,
-    unit_ids: pd.DataFrame,
-    on: str | list[str],
-) -> pd.DataFrame:
-    """Replace rows with new PUDL Unit IDs in the original dataframe.
-
-    Merges the newly assigned Unit IDs found in ``unit_ids`` into the
-    ``gens_df`` dataframe, but only for those rows which are selected by the
-    boolean ``row_mask``. Merges using the column or columns specified by
-    ``on``. This operation should only result in changes to the values of
-    ``unit_id_pudl`` and ``bga_source`` in the output dataframe. All of
-    ``gens_df``, ``unit_ids`` and ``row_mask`` must be similarly indexed for
-    this to work.
-
-    Args:
-        gens_df: a gens_eia860 based dataframe.
-        row_mask (boolean mask): A boolean array indicating which records
-            in ``gens_df`` should be replaced using values from ``unit_ids``.
-        unit_ids : A dataframe containing newly assigned
-            ``unit_id_pudl`` values to be integrated into ``gens_df``.
-        on: Column or list of columns to merge on.
-
-    Returns:
-        A DataFrame with unit IDs.
-    """
-    return gens_df.loc[~row_mask].append(
-        gens_df.loc[row_mask]
-        .drop(["unit_id_pudl", "bga_source"], axis="columns")
-        .merge(
-            unit_ids,
-            on=on,
-            how="left",
-            validate="many_to_one",
+        Args:
+            gens_df: EIA generator records, which must include the ``plant_id_eia``,
+                ``generator_id``, ``report_date``, ``prime_mover_code``,
+                ``fuel_type_code_pudl``, ``unit_id_pudl`` and ``bga_source``
+                columns. New unit IDs are numbered in the order in which generators
+                first appear, so the records should be sorted by date.
+        """
+        self.plant = pd.factorize(gens_df.plant_id_eia)[0]
+        self.generator = (
+            gens_df.groupby(["plant_id_eia", "generator_id"], sort=False)
+            .ngroup()
+            .to_numpy()
         )
-    )
-
-
-def assign_single_gen_unit_ids(
-    gens_df: pd.DataFrame,
-    prime_mover_codes: list[str],
-    fuel_type_code_pudl: str = None,
-    label_prefix: str = "single",
-) -> pd.DataFrame:
-    """Assign a unique PUDL Unit ID to each generator of a given prime mover type.
-
-    Calculate the maximum pre-existing PUDL Unit ID within each plant, and
-    assign each as of yet unidentified distinct generator within each plant
-    with an incrementing integer unit_id_pudl, beginning with 1 + the previous
-    maximum unit_id_pudl found in that plant. Mark that generator with a label
-    in the bga_source column consisting of label_prefix + the prime mover code.
-
-    If fuel_type_code_pudl is not None, then only assign new Unit IDs to those
-    generators having the specified fuel type code, and use that fuel type code
-    as the label prefix, e.g. "coal_st" for a coal-fired steam turbine.
-
-    Only generators having NA unit_id_pudl will be assigned a new ID.
-
-    Args:
-        gens_df: A collection of EIA generator records.
-            Must include the ``plant_id_eia``, ``generator_id`` and
-            ``prime_mover_code`` and ``unit_id_pudl`` columns.
-        prime_mover_codes: List of prime mover codes for which we are
-            attempting to assign simple Unit IDs.
-        fuel_type_code_pudl: If not None, then limit the records
-            assigned a unit_id to those that have the specified
-            fuel_type_code_pudl (e.g. "coal", "gas", "oil", "nuclear")
-        label_prefix: String to use in labeling records as to how their
-            unit_id_pudl was set. Will be concatenated with the prime mover
-            code.
-
-    Returns:
-        A new dataframe with the same rows and columns as
-        were passed in, but with the unit_id_pudl and bga_source columns updated
-        to reflect the newly assigned Unit IDs.
-    """
-    if fuel_type_code_pudl is not None:
-        # Need to make this only apply to consistent inter-year fuel types.
-        fuel_type_mask = gens_df.fuel_type_code_pudl == fuel_type_code_pudl
-    else:
-        fuel_type_mask = True
-
-    # Only alter the rows lacking Unit IDs and matching our target rows
-    row_mask = (
-        (gens_df.prime_mover_code.isin(prime_mover_codes))
-        & (gens_df.unit_id_pudl.isnull())
-        & (fuel_type_mask)
-    )
-    # We only need a few columns to make these assignments.
-    cols = ["plant_id_eia", "generator_id", "unit_id_pudl", "prime_mover_code"]
-
-    logger.info(
-        "Selected %s %s records lacking Unit IDs from %s records overall. ",
-        row_mask.sum(),
-        prime_mover_codes,
-        len(gens_df),
-    )
-
-    unit_ids = (
-        gens_df.loc[row_mask, cols]
-        .drop_duplicates()
-        .merge(
-            max_unit_id_by_plant(gens_df),
-            on="plant_id_eia",
-            how="left",
-            validate="many_to_one",
+        self.plant_year = (
+            gens_df.groupby(["plant_id_eia", "report_date"], sort=False)
+            .ngroup()
+            .to_numpy()
         )
-        # Assign new unit_id_pudl values based on number of distinct generators:
-        .assign(
-            unit_id_pudl=lambda x: (
-                x.groupby("plant_id_eia")["generator_id"].cumcount()
-                + x.max_unit_id_pudl
-                + 1
-            ),
-            bga_source=lambda x: label_prefix + "_" + x.prime_mover_code.str.lower(),
+        # Use empty strings for missing codes so they can be compared directly.
+        self.prime_mover = gens_df.prime_mover_code.to_numpy(dtype=object, na_value="")
+        self.fuel_type = gens_df.fuel_type_code_pudl.to_numpy(dtype=object, na_value="")
+        # The number of distinct fuel types each generator has been reported with:
+        self.fuel_type_count = (
+            gens_df.groupby(["plant_id_eia", "generator_id"])["fuel_type_code_pudl"]
+            .transform("nunique")
+            .to_numpy()
         )
-        .drop(["max_unit_id_pudl", "prime_mover_code"], axis="columns")
-    )
-    # Split original dataframe based on row_mask, and merge in the new IDs and
-    # labels only on the subset of the dataframe matching our row_mask:
-    return _append_masked_units(
-        gens_df, row_mask, unit_ids, on=["plant_id_eia", "generator_id"]
-    )
-
-
-def assign_cc_unit_ids(gens_df: pd.DataFrame) -> pd.DataFrame:
-    """Assign PUDL Unit IDs for combined cycle generation units.
-
-    This applies only to combined cycle units reported as a combination of CT
-    and CA prime movers. All CT and CA generators within a plant that do not
-    already have a unit_id_pudl assigned will be given the same unit ID. The
-    ``bga_source`` column is set to one of several flags indicating what type
-    of arrangement was found:
-
-    * ``orphan_ct`` (zero CA gens, 1+ CT gens)
-    * ``orphan_ca`` (zero CT gens, 1+ CA gens)
-    * ``one_ct_one_ca_inferred`` (1 CT, 1 CA)
-    * ``one_ct_many_ca_inferred`` (1 CT, 1+ CA)
-    * ``many_ct_one_ca_inferred`` (1+ CT, 1 CA)
-    * ``many_ct_many_ca_inferred`` (1+ CT, 1+ CA)
-
-    Orphaned generators are still assigned a ``unit_id_pudl`` so that they can
-    potentially be associated with other generators in the same unit across
-    years. It's likely that these orphans are a result of mislabled or missing
-    generators. Note that as generators are added or removed over time, the
-    flags associated with each generator may change, even though it remains
-    part of the same inferred unit.
-
-    Returns:
-        A dataframe with assigned PUDL unit IDs.
-    """
-    # Calculate the largest preexisting unit_id_pudl within each plant
-    max_unit_ids = max_unit_id_by_plant(gens_df)
-
-    cc_missing_units = gens_df[
-        (gens_df.unit_id_pudl.isna()) & gens_df.prime_mover_code.isin(["CT", "CA"])
-    ]
-    # On a per-plant, per-year basis, count up the number of CT and CA generators.
-    # Only look at those which don't already have a unit ID assigned:
-    cc_pm_counts = (
-        cc_missing_units.groupby(["plant_id_eia", "report_date"])["prime_mover_code"]
-        .value_counts()
-        .unstack(fill_value=0)
-        .astype(int)
-        .reset_index()
-    )
-    cc_pm_counts.columns.name = None
-
-    # Bring the max unit ID and PM counts into the DF so we can select and
-    # assign based on them. We're using the cc_missing_units and a temporary
-    # dataframe here to avoid interference from the CT & CA generators
-    # that do already have unit IDs assigned to them in gens_df.
-    tmp_df = cc_missing_units.merge(
-        max_unit_ids,
-        on="plant_id_eia",
-        how="left",
-        validate="many_to_one",
-    ).merge(
-        cc_pm_counts,
-        on=["plant_id_eia", "report_date"],
-        how="left",
-        validate="many_to_one",
-    )
-
-    # Assign the new Unit IDs.
-    # All CA and CT units get assigned to the same unit within a plant:
-    tmp_df["unit_id_pudl"] = tmp_df["max_unit_id_pudl"] + 1
-
-    # Assign the orphan flags
-    tmp_df.loc[tmp_df.CA == 0, "bga_source"] = "orphan_ct"
-    tmp_df.loc[tmp_df.CT == 0, "bga_source"] = "orphan_ca"
-    # The orphan flags should only have been applied to generators that had
-    # at least one prime mover of the orphaned type. Just checking...
-    assert (tmp_df.loc[tmp_df.bga_source == "orphan_ct", "CT"] > 0).all()  # nosec: B101
-    assert (tmp_df.loc[tmp_df.bga_source == "orphan_ca", "CA"] > 0).all()  # nosec: B101
-
-    # Assign flags for various arrangements of CA and CT generators
-    tmp_df.loc[((tmp_df.CT == 1) & (tmp_df.CA == 1)), "bga_source"] = (
-        "one_ct_one_ca_inferred"
-    )
-    tmp_df.loc[((tmp_df.CT == 1) & (tmp_df.CA > 1)), "bga_source"] = (
-        "one_ct_many_ca_inferred"
-    )
-    tmp_df.loc[((tmp_df.CT > 1) & (tmp_df.CA == 1)), "bga_source"] = (
-        "many_ct_one_ca_inferred"
-    )
-    tmp_df.loc[((tmp_df.CT > 1) & (tmp_df.CA > 1)), "bga_source"] = (
-        "many_ct_many_ca_inferred"
-    )
-
-    # Align the indices of the two dataframes so we can assign directly
-    tmp_df = tmp_df.set_index(["plant_id_eia", "generator_id", "report_date"])
-    out_df = gens_df.set_index(["plant_id_eia", "generator_id", "report_date"])
-    out_df.loc[tmp_df.index, ["unit_id_pudl", "bga_source"]] = tmp_df[
-        ["unit_id_pudl", "bga_source"]
-    ]
-
-    return out_df.reset_index()
+        self.unit_id = gens_df.unit_id_pudl.to_numpy(dtype=float, na_value=np.nan)
+        self.source = gens_df.bga_source.to_numpy(dtype=object, na_value=None)
+        # The largest unit ID within each plant, or zero if it has none:
+        self.max_unit_id = np.zeros(self.plant.max(initial=-1) + 1)
+        np.fmax.at(self.max_unit_id, self.plant, self.unit_id)
+
+    @property
+    def unit_id_pudl(self) -> pd.arrays.IntegerArray:
+        """The unit ID of each generator record."""
+        return pd.array(self.unit_id, dtype="Int64")
+
+    @property
+    def bga_source(self) -> pd.arrays.StringArray:
+        """How the unit ID of each generator record was assigned."""
+        return pd.array(self.source, dtype="string")
+
+    def _assign(self, row_mask: np.ndarray, unit_ids: np.ndarray, source) -> None:
+        """Assign unit IDs and their source to the selected generator records."""
+        self.unit_id[row_mask] = unit_ids
+        self.source[row_mask] = source
+        np.fmax.at(self.max_unit_id, self.plant[row_mask], unit_ids)
+
+    def assign_cc_unit_ids(self) -> None:
+        """Assign PUDL Unit IDs for combined cycle generation units.
+
+        This applies only to combined cycle units reported as a combination of CT
+        and CA prime movers. All CT and CA generators within a plant that do not
+        already have a unit_id_pudl assigned will be given the same unit ID. The
+        ``bga_source`` column is set to one of several flags indicating what type
+        of arrangement was found:
+
+        * ``orphan_ct`` (zero CA gens, 1+ CT gens)
+        * ``orphan_ca`` (zero CT gens, 1+ CA gens)
+        * ``one_ct_one_ca_inferred`` (1 CT, 1 CA)
+        * ``one_ct_many_ca_inferred`` (1 CT, 1+ CA)
+        * ``many_ct_one_ca_inferred`` (1+ CT, 1 CA)
+        * ``many_ct_many_ca_inferred`` (1+ CT, 1+ CA)
+
+        Orphaned generators are still assigned a ``unit_id_pudl`` so that they can
+        potentially be associated with other generators in the same unit across
+        years. It's likely that these orphans are a result of mislabled or missing
+        generators. Note that as generators are added or removed over time, the
+        flags associated with each generator may change, even though it remains
+        part of the same inferred unit.
+        """
+        missing = np.isnan(self.unit_id)
+        is_ct = missing & (self.prime_mover == "CT")
+        is_ca = missing & (self.prime_mover == "CA")
+        row_mask = is_ct | is_ca
+        # On a per-plant, per-year basis, count up the number of CT and CA generators.
+        # Only look at those which don't already have a unit ID assigned:
+        n_plant_years = self.plant_year.max(initial=-1) + 1
+        n_ct = np.bincount(self.plant_year[is_ct], minlength=n_plant_years)
+        n_ca = np.bincount(self.plant_year[is_ca], minlength=n_plant_years)
+        n_ct = n_ct[self.plant_year[row_mask]]
+        n_ca = n_ca[self.plant_year[row_mask]]
+        source = np.select(
+            [
+                n_ca == 0,
+                n_ct == 0,
+                (n_ct == 1) & (n_ca == 1),
+                (n_ct == 1) & (n_ca > 1),
+                (n_ct > 1) & (n_ca == 1),
+            ],
+            [
+                "orphan_ct",
+                "orphan_ca",
+                "one_ct_one_ca_inferred",
+                "one_ct_many_ca_inferred",
+                "many_ct_one_ca_inferred",
+            ],
+            default="many_ct_many_ca_inferred",
+        )
+        # The orphan flags should only have been applied to generators that had
+        # at least one prime mover of the orphaned type. Just checking...
+        assert (n_ct[source == "orphan_ct"] > 0).all()  # nosec: B101
+        assert (n_ca[source == "orphan_ca"] > 0).all()  # nosec: B101
+        logger.info(
+            "Selected %s CT and CA records lacking Unit IDs from %s records overall.",
+            row_mask.sum(),
+            len(row_mask),
+        )
+        # All CA and CT units get assigned to the same unit within a plant:
+        self._assign(row_mask, self.max_unit_id[self.plant[row_mask]] + 1, source)
 
+    def assign_single_gen_unit_ids(
+        self,
+        prime_mover_codes: list[str],
+        fuel_type_code_pudl: str | None = None,
+        label_prefix: str = "single",
+    ) -> None:
+        """Assign a unique PUDL Unit ID to each generator of a given prime mover type.
 
-def assign_prime_fuel_unit_ids(
-    gens_df: pd.DataFrame, prime_mover_code: str, fuel_type_code_pudl: str
-) -> pd.DataFrame:
-    """Assign a PUDL Unit ID to all generators with a given prime mover and fuel.
-
-    Within each plant, assign a Unit ID to all generators that don't have one,
-    and that share the same `fuel_type_code_pudl` and `prime_mover_code`. This
-    is especially useful for differentiating between different types of steam
-    turbine generators, as there are so many different kinds of steam turbines,
-    and the only characteristic we have to differentiate between them in this
-    context is the fuel they consume. E.g. nuclear, geothermal, solar thermal,
-    natural gas, diesel, and coal can all run steam turbines, but it doesn't
-    make sense to lump those turbines together into a single unit just because
-    they are located at the same plant.
-
-    This routine only assigns a PUDL Unit ID to generators that have a
-    consistently reported value of `fuel_type_code_pudl` across all of the years
-    of data in `gens_df`. This consistency is important because otherwise the
-    prime-fuel based unit assignment could put the same generator into different
-    units in different years, which is currently not compatible with our concept
-    of "units."
+        Assign each as of yet unidentified distinct generator within each plant
+        with an incrementing integer unit_id_pudl, beginning with 1 + the previous
+        maximum unit_id_pudl found in that plant. Mark that generator with a label
+        in the bga_source column consisting of label_prefix + the prime mover code.
 
-    Args:
-        gens_df (pandas.DataFrame): A collection of EIA generator records.
-            Must include the ``plant_id_eia``, ``generator_id`` and
-            ``prime_mover_code`` and ``unit_id_pudl`` columns.
-        prime_mover_code (str): List of prime mover codes for which we are
-            attempting to assign simple Unit IDs.
-        fuel_type_code_pudl (str): If not None, then limit the records
-            assigned a unit_id to those that have the specified
-            fuel_type_code_pudl (e.g. "coal", "gas", "oil", "nuclear")
+        Only generators having NA unit_id_pudl will be assigned a new ID.
 
-    Returns:
-        A DataFrame where generators without a unit ID are assigned one based on
-        `fuel_type_code_pudl`.
-    """
-    # Find generators with a consistent fuel_type_code_pudl across all years.
-    consistent_fuel = (
-        gens_df.groupby(["plant_id_eia", "generator_id"])[
-            "fuel_type_code_pudl"
-        ].transform(lambda x: x.nunique())
-    ) == 1
-    # This mask defines the generators generators we are going to alter:
-    row_mask = (
-        (gens_df.prime_mover_code == prime_mover_code)
-        & (gens_df.unit_id_pudl.isna())
-        & (gens_df.fuel_type_code_pudl == fuel_type_code_pudl)
-        & (consistent_fuel)
-    )
+        Args:
+            prime_mover_codes: List of prime mover codes for which we are
+                attempting to assign simple Unit IDs.
+            fuel_type_code_pudl: If not None, then limit the records
+                assigned a unit_id to those that have the specified
+                fuel_type_code_pudl (e.g. "coal", "gas", "oil", "nuclear")
+            label_prefix: String to use in labeling records as to how their
+                unit_id_pudl was set. Will be concatenated with the prime mover
+                code.
+        """
+        # Only alter the rows lacking Unit IDs and matching our target rows
+        row_mask = np.isnan(self.unit_id) & np.isin(self.prime_mover, prime_mover_codes)
+        if fuel_type_code_pudl is not None:
+            row_mask &= self.fuel_type == fuel_type_code_pudl
+        logger.info(
+            "Selected %s %s records lacking Unit IDs from %s records overall. ",
+            row_mask.sum(),
+            prime_mover_codes,
+            len(row_mask),
+        )
 
-    # We only need a few columns to make these assignments.
-    cols = ["plant_id_eia", "generator_id", "unit_id_pudl"]
+        # Number the selected generators within each plant in order of appearance:
+        rows = np.flatnonzero(row_mask)
+        _, first_appearance = np.unique(self.generator[rows], return_index=True)
+        first_rows = rows[np.sort(first_appearance)]
+        gen_plants = self.plant[first_rows]
+        gen_number = pd.Series(gen_plants).groupby(gen_plants).cumcount().to_numpy()
+        gen_unit_ids = np.full(self.generator.max(initial=-1) + 1, np.nan)
+        gen_unit_ids[self.generator[first_rows]] = (
+            self.max_unit_id[gen_plants] + 1 + gen_number
+        )
 
-    logger.info(
-        "Selected %s %s records lacking Unit IDs burning %s from %s records overall.",
-        row_mask.sum(),
-        prime_mover_code,
-        fuel_type_code_pudl,
-        len(gens_df),
-    )
+        source = (
+            label_prefix + "_" + pd.Series(self.prime_mover[rows]).str.lower()
+        ).to_numpy()
+        self._assign(row_mask, gen_unit_ids[self.generator[rows]], source)
+
+    def assign_prime_fuel_unit_ids(
+        self, prime_mover_code: str, fuel_type_code_pudl: str
+    ) -> None:
+        """Assign a PUDL Unit ID to all generators with a given prime mover and fuel.
+
+        Within each plant, assign a Unit ID to all generators that don't have one,
+        and that share the same `fuel_type_code_pudl` and `prime_mover_code`. This
+        is especially useful for differentiating between different types of steam
+        turbine generators, as there are so many different kinds of steam turbines,
+        and the only characteristic we have to differentiate between them in this
+        context is the fuel they consume. E.g. nuclear, geothermal, solar thermal,
+        natural gas, diesel, and coal can all run steam turbines, but it doesn't
+        make sense to lump those turbines together into a single unit just because
+        they are located at the same plant.
+
+        This routine only assigns a PUDL Unit ID to generators that have a
+        consistently reported value of `fuel_type_code_pudl` across all of the years
+        of data. This consistency is important because otherwise the prime-fuel based
+        unit assignment could put the same generator into different units in
+        different years, which is currently not compatible with our concept of
+        "units." Generators with an inconsistent fuel type are labeled as such in
+        ``bga_source`` but aren't assigned a unit ID.
 
-    unit_ids = (
-        gens_df.loc[row_mask, cols]
-        .drop_duplicates()
-        .merge(
-            max_unit_id_by_plant(gens_df),
-            on="plant_id_eia",
-            how="left",
-            validate="many_to_one",
+        Args:
+            prime_mover_code: Prime mover code for which we are attempting to assign
+                Unit IDs.
+            fuel_type_code_pudl: Limit the records assigned a unit_id to those that
+                have the specified fuel_type_code_pudl (e.g. "coal", "gas", "oil")
+        """
+        candidates = (
+            np.isnan(self.unit_id)
+            & (self.prime_mover == prime_mover_code)
+            & (self.fuel_type == fuel_type_code_pudl)
         )
-        # Assign all selected generators within each plant the next PUDL Unit ID.
-        .assign(
-            unit_id_pudl=lambda x: x.max_unit_id_pudl + 1,
-            bga_source=lambda x: fuel_type_code_pudl + "_" + prime_mover_code.lower(),
+        # Only generators with a consistent fuel_type_code_pudl across all years.
+        row_mask = candidates & (self.fuel_type_count == 1)
+        logger.info(
+            "Selected %s %s records lacking Unit IDs burning %s from %s records overall.",
+            row_mask.sum(),
+            prime_mover_code,
+            fuel_type_code_pudl,
+            len(row_mask),
         )
-        .drop(["max_unit_id_pudl"], axis="columns")
-    )
-
-    # Split original dataframe based on row_mask, and merge in the new IDs and
-    # labels only on the subset of the dataframe matching our row_mask:
-    out_df = _append_masked_units(
-        gens_df, row_mask, unit_ids, on=["plant_id_eia", "generator_id"]
-    )
-
-    # Find generators with inconsistent fuel_type_code_pudl so we can label them
-    inconsistent_fuel = (
-        out_df.groupby(["plant_id_eia", "generator_id"])[
-            "fuel_type_code_pudl"
-        ].transform(lambda x: x.nunique())
-    ) > 1
-
-    inconsistent_fuel_mask = (
-        (out_df.prime_mover_code == prime_mover_code)
-        & (out_df.unit_id_pudl.isna())
-        & (out_df.fuel_type_code_pudl == fuel_type_code_pudl)
-        & (inconsistent_fuel)
-    )
-    out_df.loc[inconsistent_fuel_mask, "bga_source"] = (
-        "inconsistent_" + fuel_type_code_pudl + "_" + prime_mover_code.lower()
-    )
-    return out_df
+        # Assign all selected generators within each plant the next PUDL Unit ID.
+        label = f"{fuel_type_code_pudl}_{prime_mover_code.lower()}"
+        self._assign(row_mask, self.max_unit_id[self.plant[row_mask]] + 1, label)
+        # Label the generators with inconsistent fuel types
+        self.source[candidates & (self.fuel_type_count > 1)] = f"inconsistent_{label}"
@@ -368,7 +368,10 @@ def time_aggregated_eia923_asset_factory(
                 by=["plant_id_eia", "generator_id", pd.Grouper(freq=freq)],
                 observed=True,
             )
-            .agg({"net_generation_mwh": pudl.helpers.sum_na, "data_maturity": "first"})
+            .pipe(
+                pudl.helpers.groupby_agg,
+                {"net_generation_mwh": pudl.helpers.sum_na, "data_maturity": "first"},
+            )
             .reset_index()
             .pipe(
                 denorm_by_gen,
@@ -403,7 +406,8 @@ def time_aggregated_eia923_asset_factory(
                 ],
                 observed=True,
             )
-            .agg(
+            .pipe(
+                pudl.helpers.groupby_agg,
                 {
                     # Sum up these values so we can calculate quantity weighted averages
                     "fuel_consumed_units": pudl.helpers.sum_na,
@@ -412,7 +416,7 @@ def time_aggregated_eia923_asset_factory(
                     "fuel_consumed_for_electricity_mmbtu": pudl.helpers.sum_na,
                     "net_generation_mwh": pudl.helpers.sum_na,
                     "data_maturity": "first",
-                }
+                },
             )
         ).reset_index()
         # Nuclear plants don't report units of fuel consumed, so fuel heat content ends
@@ -480,14 +484,15 @@ def time_aggregated_eia923_asset_factory(
             )
             # Sum up these totals within each group, and recalculate the per-unit
             # values (weighted in this case by fuel_consumed_units)
-            .agg(
+            .pipe(
+                pudl.helpers.groupby_agg,
                 {
                     "fuel_consumed_mmbtu": pudl.helpers.sum_na,
                     "fuel_consumed_units": pudl.helpers.sum_na,
                     "total_sulfur_content": pudl.helpers.sum_na,
                     "total_ash_content": pudl.helpers.sum_na,
                     "data_maturity": "first",
-                }
+                },
             )
             .assign(
                 fuel_mmbtu_per_unit=lambda x: x.fuel_consumed_mmbtu
@@ -535,7 +540,8 @@ def time_aggregated_eia923_asset_factory(
                 by=["plant_id_eia", "fuel_type_code_pudl", pd.Grouper(freq=freq)],
                 observed=True,
             )
-            .agg(
+            .pipe(
+                pudl.helpers.groupby_agg,
                 {
                     "fuel_received_units": pudl.helpers.sum_na,
                     "fuel_consumed_mmbtu": pudl.helpers.sum_na,
@@ -548,7 +554,7 @@ def time_aggregated_eia923_asset_factory(
                     "fuel_cost_from_eiaapi": "any",
                     "state": "first",
                     "data_maturity": "first",
-                }
+                },
             )
             .assign(
                 fuel_cost_per_mmbtu=lambda x: x.total_fuel_cost / x.fuel_consumed_mmbtu,
@@ -1,13 +1,36 @@
 """Routines that provide user-friendly access to the partitioned EPA CEMS dataset."""
 
+import hashlib
+import operator
+import os
 from collections.abc import Iterable, Sequence
+from functools import reduce
 from itertools import product
 from pathlib import Path
 
 import dask.dataframe as dd
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 
+import pudl
 from pudl.workspace.setup import PudlPaths
 
+logger = pudl.logging_helpers.get_logger(__name__)
+
+ROW_GROUP_INDEX_COLUMNS: tuple[str, ...] = (
+    "plant_id_eia",
+    "operating_datetime_utc",
+    "year",
+    "state",
+)
+"""Columns whose range of values within each row group is recorded in the index."""
+
+_SIGNATURE_KEY = b"pudl_epacems_signature"
+"""Key of the signature of the indexed Parquet file in the index's schema metadata."""
+
 
 def year_state_filter(
     years: Iterable[int] = None, states: Iterable[str] = None
@@ -146,3 +169,264 @@ def epacems(
         ),
     )
     return epacems
+
+
+def row_group_index_path(epacems_path: Path) -> Path:
+    """Return the path to the row group index of an EPA CEMS Parquet file.
+
+    The index is stored alongside the Parquet file it describes, e.g. the index of
+    ``core_epacems__hourly_emissions.parquet`` is
+    ``core_epacems__hourly_emissions_row_groups.parquet``.
+    """
+    return epacems_path.with_name(f"{epacems_path.stem}_row_groups.parquet")
+
+
+def make_row_group_index(epacems_path: Path) -> pd.DataFrame:
+    """Tabulate the range of values in each row group of EPA CEMS Parquet data.
+
+    The minimum and maximum of each of the :data:`ROW_GROUP_INDEX_COLUMNS` are taken
+    from the statistics in the Parquet file footers, so none of the data itself needs to
+    be read.
+
+    Args:
+        epacems_path: a Parquet file, or a directory of Parquet files.
+
+    Returns:
+        One row per row group, with the name of the ``file`` it's in, its index within
+        that file (``row_group``), its number of rows (``num_rows``) and the minimum and
+        maximum values of each index column, e.g. ``plant_id_eia_min`` and
+        ``plant_id_eia_max``. The minimum and maximum are null if the row group has no
+        statistics for that column.
+    """
+    epacems_path = Path(epacems_path)
+    files = (
+        sorted(epacems_path.glob("*.parquet"))
+        if epacems_path.is_dir()
+        else [epacems_path]
+    )
+    records = []
+    for file in files:
+        metadata = pq.read_metadata(file)
+        columns = {
+            metadata.schema.column(i).name: i for i in range(metadata.num_columns)
+        }
+        for row_group in range(metadata.num_row_groups):
+            row_group_metadata = metadata.row_group(row_group)
+            record = {
+                "file": file.name,
+                "row_group": row_group,
+                "num_rows": row_group_metadata.num_rows,
+            }
+            for col in ROW_GROUP_INDEX_COLUMNS:
+                stats = row_group_metadata.column(columns[col]).statistics
+                has_min_max = stats is not None and stats.has_min_max
+                record[f"{col}_min"] = stats.min if has_min_max else None
+                record[f"{col}_max"] = stats.max if has_min_max else None
+            records.append(record)
+    index_columns = ["file", "row_group", "num_rows"] + [
+        f"{col}_{stat}" for col in ROW_GROUP_INDEX_COLUMNS for stat in ("min", "max")
+    ]
+    return pd.DataFrame.from_records(records, columns=index_columns).astype(
+        {
+            "plant_id_eia_min": "Int64",
+            "plant_id_eia_max": "Int64",
+            "operating_datetime_utc_min": "datetime64[ms]",
+            "operating_datetime_utc_max": "datetime64[ms]",
+            "year_min": "Int64",
+            "year_max": "Int64",
+            "state_min": "string",
+            "state_max": "string",
+        }
+    )
+
+
+def _parquet_signature(path: Path) -> str:
+    """Identify the contents of a Parquet file by its size and a hash of its footer.
+
+    The footer holds the schema and the statistics of every row group, so any change to
+    the row groups changes the signature. Only the footer bytes are read, and they
+    aren't parsed.
+    """
+    with path.open("rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        # The file ends with the length of the footer and the magic bytes "PAR1"
+        f.seek(size - 8)
+        footer_length = int.from_bytes(f.read(4), "little")
+        f.seek(size - 8 - footer_length)
+        footer_hash = hashlib.sha256(f.read(footer_length)).hexdigest()
+    return f"{size}:{footer_length}:{footer_hash}"
+
+
+def write_row_group_index(epacems_path: Path) -> Path:
+    """Write the row group index of an EPA CEMS Parquet file alongside it.
+
+    The signature of the Parquet file (its size and a hash of its footer) is stored in
+    the metadata of the index, so that :func:`read_epacems` can tell whether the index
+    still describes the Parquet file, however the files were copied.
+
+    Args:
+        epacems_path: the Parquet file to index.
+
+    Returns:
+        The path to the index, see :func:`row_group_index_path`.
+    """
+    index_path = row_group_index_path(epacems_path)
+    signature = _parquet_signature(epacems_path)
+    index = pa.Table.from_pandas(
+        make_row_group_index(epacems_path), preserve_index=False
+    )
+    pq.write_table(
+        index.replace_schema_metadata(
+            {**index.schema.metadata, _SIGNATURE_KEY: signature}
+        ),
+        index_path,
+    )
+    logger.info(f"Wrote EPA CEMS row group index to {index_path}")
+    return index_path
+
+
+def _load_row_group_index(epacems_path: Path) -> pd.DataFrame:
+    """Read the row group index of a Parquet file, or make it if it's missing or stale.
+
+    The index is stale if the signature of the Parquet file it was made from doesn't
+    match the Parquet file, e.g. because it was rebuilt or downloaded again without
+    its index.
+    """
+    index_path = row_group_index_path(epacems_path)
+    if not (epacems_path.is_file() and index_path.exists()):
+        return make_row_group_index(epacems_path)
+    index = pq.read_table(index_path)
+    signature = (index.schema.metadata or {}).get(_SIGNATURE_KEY)
+    if signature == _parquet_signature(epacems_path).encode():
+        return index.to_pandas()
+    logger.warning(
+        f"The EPA CEMS row group index {index_path} doesn't match {epacems_path}, "
+        "so it's being remade. Rewrite it with write_row_group_index()."
+    )
+    return make_row_group_index(epacems_path)
+
+
+def _overlaps(
+    index: pd.DataFrame, col: str, values: Sequence | None = None, lo=None, hi=None
+) -> pd.Series:
+    """Find the row groups which may contain any of the values, or values in a range.
+
+    Row groups without statistics for the column might contain anything.
+    """
+    col_min, col_max = index[f"{col}_min"], index[f"{col}_max"]
+    unknown = col_min.isna() | col_max.isna()
+    overlaps = unknown.copy()
+    if values is not None:
+        values = np.sort(np.asarray(values))
+        # Count the values between the minimum and maximum of each row group
+        n_values = np.searchsorted(
+            values, col_max[~unknown].tolist(), side="right"
+        ) - np.searchsorted(values, col_min[~unknown].tolist(), side="left")
+        overlaps[~unknown] = n_values > 0
+    else:
+        overlaps[~unknown] = (lo is None or col_max[~unknown] >= lo) & (
+            hi is None or col_min[~unknown] <= hi
+        )
+    return overlaps
+
+
+def read_epacems(
+    plant_ids: Iterable[int] | None = None,
+    unit_ids: Iterable[str] | None = None,
+    states: Iterable[str] | None = None,
+    years: Iterable[int] | None = None,
+    start_datetime: str | pd.Timestamp | None = None,
+    end_datetime: str | pd.Timestamp | None = None,
+    columns: Sequence[str] | None = None,
+    epacems_path: Path | None = None,
+) -> pd.DataFrame:
+    """Read a subset of the EPA CEMS data into a pandas dataframe.
+
+    Unlike :func:`epacems`, this doesn't use Dask. Instead it uses the row group index
+    written alongside the Parquet file (see :func:`write_row_group_index`) to find the
+    row groups which might contain the requested records, and only reads those with
+    :mod:`pyarrow.dataset`. This makes it quick to read the data of a few plants. If
+    there's no index, or it no longer matches the Parquet file, it's made from the
+    Parquet file footers on the fly.
+
+    Args:
+        plant_ids: subset by EIA plant ID. Defaults to None (which gets all plants).
+        unit_ids: subset by ``emissions_unit_id_epa``. Defaults to None (which gets all
+            units). Unit IDs are only unique within a plant, so this is usually
+            combined with ``plant_ids``.
+        states: subset by state abbreviation. Defaults to None (which gets all states).
+        years: subset by year. Defaults to None (which gets all years).
+        start_datetime: the earliest ``operating_datetime_utc`` to read, inclusive.
+            Defaults to None (which gets all the data before ``end_datetime``).
+        end_datetime: the latest ``operating_datetime_utc`` to read, inclusive. Defaults
+            to None (which gets all the data after ``start_datetime``).
+        columns: subset by column. Defaults to None (which gets all columns).
+        epacems_path: path to the Parquet file, or a directory of Parquet files. By
+            default it's the consolidated EPA CEMS output in the PUDL output directory.
+
+    Returns:
+        The requested EPA CEMS data. If requested plants, units, states or years are
+        not available, no error will be raised.
+    """
+    if epacems_path is None:
+        epacems_path = PudlPaths().parquet_path("core_epacems__hourly_emissions")
+    epacems_path = Path(epacems_path)
+    start_datetime, end_datetime = (
+        None if dt is None else _as_naive_utc(pd.Timestamp(dt))
+        for dt in (start_datetime, end_datetime)
+    )
+
+    index = _load_row_group_index(epacems_path)
+    keep = pd.Series(True, index=index.index)
+    filters = []
+    if plant_ids is not None:
+        plant_ids = list(plant_ids)
+        keep &= _overlaps(index, "plant_id_eia", values=plant_ids)
+        filters.append(ds.field("plant_id_eia").isin(plant_ids))
+    if unit_ids is not None:
+        filters.append(ds.field("emissions_unit_id_epa").isin(list(unit_ids)))
+    if states is not None:
+        states = [state.upper() for state in states]
+        keep &= _overlaps(index, "state", values=states)
+        filters.append(ds.field("state").isin(states))
+    if years is not None:
+        years = list(years)
+        keep &= _overlaps(index, "year", values=years)
+        filters.append(ds.field("year").isin(years))
+    if start_datetime is not None or end_datetime is not None:
+        keep &= _overlaps(
+            index, "operating_datetime_utc", lo=start_datetime, hi=end_datetime
+        )
+    if start_datetime is not None:
+        filters.append(
+            ds.field("operating_datetime_utc") >= start_datetime.to_pydatetime()
+        )
+    if end_datetime is not None:
+        filters.append(
+            ds.field("operating_datetime_utc") <= end_datetime.to_pydatetime()
+        )
+    row_groups = index[keep].groupby("file", sort=False).row_group.agg(list)
+    logger.debug(
+        f"Reading {keep.sum()} of {len(index)} EPA CEMS row groups from {epacems_path}"
+    )
+
+    dataset = ds.dataset(epacems_path, format="parquet")
+    fragments = [
+        fragment.subset(row_group_ids=row_groups[Path(fragment.path).name])
+        for fragment in dataset.get_fragments()
+        if Path(fragment.path).name in row_groups.index
+    ]
+    table = ds.FileSystemDataset(
+        fragments, dataset.schema, dataset.format, dataset.filesystem
+    ).to_table(
+        columns=None if columns is None else list(columns),
+        filter=reduce(operator.and_, filters) if filters else None,
+    )
+    return table.to_pandas()
+
+
+def _as_naive_utc(timestamp: pd.Timestamp) -> pd.Timestamp:
+    """Convert a timestamp to UTC, without a timezone, like ``operating_datetime_utc``."""
+    if timestamp.tz is None:
+        return timestamp
+    return timestamp.tz_convert("UTC").tz_localize(None)
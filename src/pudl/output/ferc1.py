@@ -2572,13 +2572,6 @@ class XbrlCalculationForestFerc1(BaseModel):
             stepparents = stepparents.union(graph.predecessors(stepchild))
         return list(stepparents)
 
-    def _get_path_weight(self, path: list[NodeId], graph: nx.DiGraph) -> float:
-        """Multiply all weights along a path together."""
-        leaf_weight = 1.0
-        for parent, child in zip(path, path[1:], strict=False):
-            leaf_weight *= graph.get_edge_data(parent, child)["weight"]
-        return leaf_weight
-
     @cached_property
     def leafy_meta(self: Self) -> pd.DataFrame:
         """Identify leaf facts and compile their metadata.
@@ -2597,60 +2590,57 @@ class XbrlCalculationForestFerc1(BaseModel):
         - The leaf node's xbrl_factoid_original
         - The weight associated with the leaf, in relation to its root.
         """
-        # Construct a dataframe that links the leaf node IDs to their root nodes:
+        forest = self.annotated_forest
         leaves = self.forest_leaves
         roots = self.forest_roots
-        leaf_to_root_map = {
-            leaf: root
-            for leaf in leaves
-            for root in roots
-            if leaf in nx.descendants(self.annotated_forest, root)
-        }
-        leaves_df = pd.DataFrame(list(leaf_to_root_map.keys()))
-        roots_df = pd.DataFrame(list(leaf_to_root_map.values())).rename(
-            columns={col: col + "_root" for col in self.calc_cols}
-        )
-        leafy_meta = pd.concat([roots_df, leaves_df], axis="columns")
+        root_position = {root: position for position, root in enumerate(roots)}
+        nodes = list(nx.topological_sort(forest))
+        node_idx = {node: idx for idx, node in enumerate(nodes)}
+
+        # Propagate root membership, cumulative weights and inherited tags from the
+        # roots down to the leaves in a single pass over the topologically sorted
+        # nodes. If a node is reachable from several roots, the last one is used. Path
+        # weights are tracked separately for each root, so that we can check whether
+        # every path from a leaf's root to the leaf has the same weight.
+        root_of = np.full(len(nodes), -1)
+        path_weights: list[dict[int, set[float]]] = [{} for _ in nodes]
+        inherited_tags: list[dict[str, Any]] = [{} for _ in nodes]
+        for idx, node in enumerate(nodes):
+            if node in root_position:
+                root_of[idx] = root_position[node]
+                path_weights[idx] = {root_of[idx]: {1.0}}
+            inherited_tags[idx] |= forest.nodes[node].get("tags", {})
+            for child in forest.successors(node):
+                child_idx = node_idx[child]
+                edge_weight = forest.edges[node, child]["weight"]
+                root_of[child_idx] = max(root_of[child_idx], root_of[idx])
+                for root, weights in path_weights[idx].items():
+                    path_weights[child_idx].setdefault(root, set()).update(
+                        weight * edge_weight for weight in weights
+                    )
+                inherited_tags[child_idx] |= inherited_tags[idx]
 
-        # Propagate tags and weights to leaf nodes
         leaf_rows = []
         for leaf in leaves:
-            leaf_tags = {}
-            ancestors = list(nx.ancestors(self.annotated_forest, leaf)) + [leaf]
-            for node in ancestors:
-                leaf_tags |= self.annotated_forest.nodes[node].get("tags", {})
-            all_leaf_weights = {
-                self._get_path_weight(path, self.annotated_forest)
-                for path in nx.all_simple_paths(
-                    self.annotated_forest, leaf_to_root_map[leaf], leaf
-                )
-            }
+            leaf_idx = node_idx[leaf]
+            root = roots[root_of[leaf_idx]]
+            all_leaf_weights = path_weights[leaf_idx][root_of[leaf_idx]]
             if len(all_leaf_weights) != 1:
                 raise ValueError(
-                    f"Paths from {leaf_to_root_map[leaf]} to {leaf} have "
-                    f"different weights: {all_leaf_weights}"
+                    f"Paths from {root} to {leaf} have different weights: "
+                    f"{all_leaf_weights}"
                 )
-            leaf_weight = all_leaf_weights.pop()
-
-            # Construct a dictionary describing the leaf node and convert it into a
-            # single row DataFrame. This makes adding arbitrary tags easy.
-            leaf_attrs = {
-                "table_name": leaf.table_name,
-                "xbrl_factoid": leaf.xbrl_factoid,
-                "utility_type": leaf.utility_type,
-                "plant_status": leaf.plant_status,
-                "plant_function": leaf.plant_function,
-                "weight": leaf_weight,
-                "tags": leaf_tags,
-            }
-            leaf_rows.append(pd.json_normalize(leaf_attrs, sep="_"))
-
-        # Combine the two dataframes we've constructed above:
-        return (
-            pd.merge(leafy_meta, pd.concat(leaf_rows), validate="one_to_one")
-            .reset_index(drop=True)
-            .convert_dtypes()
-        )
+            # Construct a dictionary describing the leaf node and its root. Tags are
+            # flattened into separate columns, which makes adding arbitrary tags easy.
+            leaf_rows.append(
+                {f"{col}_root": value for col, value in root._asdict().items()}
+                | leaf._asdict()
+                | {
+                    "weight": next(iter(all_leaf_weights)),
+                    "tags": inherited_tags[leaf_idx],
+                }
+            )
+        return pd.json_normalize(leaf_rows, sep="_").convert_dtypes()
 
     @cached_property
     def root_calculations(self: Self) -> pd.DataFrame:
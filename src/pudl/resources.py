@@ -12,6 +12,7 @@ class RuntimeSettings(ConfigurableResource):
 
     clobber: bool = False
     xbrl_num_workers: None | int = None
+    xbrl_year_workers: None | int = None
     xbrl_batch_size: int = 50
 
 
@@ -32,6 +32,9 @@ and intermediate dataframe caching.
   * To iteratively apply a :class:`ColumnTransformFunc` to several columns in a table,
     use :func:`multicol_transform_factory` to construct a
     :class:`MultiColumnTransformFunc`
+  * To apply several column transforms to a table in one pass over each column, use
+    :func:`compile_column_transforms` or
+    :meth:`AbstractTableTransformer.transform_columns`.
 
 Using a hierarchy of ``TableTransformer`` classes to organize the functions and
 parameters allows us to apply a particular set of transformations uniformly across every
@@ -67,9 +70,10 @@ defined in the per-dataset modules under :mod:`pudl.transform.params` e.g.
 import enum
 import re
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Sequence
 from functools import wraps
 from itertools import combinations
+from numbers import Number
 from typing import Annotated, Any, Protocol, Self
 
 import numpy as np
@@ -682,7 +686,9 @@ class UnitCorrections(TransformParams):
         return self
 
 
-def correct_units(df: pd.DataFrame, params: UnitCorrections) -> pd.DataFrame:
+def correct_units(
+    df: pd.DataFrame, params: UnitCorrections | list[UnitCorrections]
+) -> pd.DataFrame:
     """Correct outlying values based on inferred discrepancies in reported units.
 
     In many cases we know that a particular column in the database should have a value
@@ -704,36 +710,95 @@ def correct_units(df: pd.DataFrame, params: UnitCorrections) -> pd.DataFrame:
     function needs to have access to the whole dataframe.
 
     Data values which are not found in one of the expected ranges are set to NA.
+
+    A list of corrections gives the same result as applying each of them in order, but
+    the corrections of each data column are applied together: the rows are matched to
+    their correction once, and every candidate unit conversion is evaluated for all of
+    the selected rows at once.
     """
-    logger.info(
-        f"Correcting units of {params.data_col} "
-        f"where {params.cat_col}=={params.cat_val}."
-    )
-    # Select a subset of the input dataframe to work on. E.g. only the heat content
-    # column for coal records:
-    selected = df.loc[df[params.cat_col] == params.cat_val, params.data_col]
-    not_selected = df[params.data_col].drop(index=selected.index)
-
-    # Now, we only want to alter the subset of these values which, when transformed by
-    # the unit conversion, lie in the range of valid values.
-    for uc in params.unit_conversions:
-        converted = convert_units(col=selected, params=uc)
-        converted = nullify_outliers(col=converted, params=params.valid_range)
-        selected = selected.where(converted.isna(), converted)
+    if isinstance(params, UnitCorrections):
+        params = [params]
+    df = df.copy(deep=False)
+    for batch in _batch_unit_corrections(params):
+        data_col = batch[0].data_col
+        df[data_col] = _correct_units_batch(df[data_col], df[batch[0].cat_col], batch)
+    return df
+
+
+def _batch_unit_corrections(
+    corrections: list[UnitCorrections],
+) -> list[list[UnitCorrections]]:
+    """Split unit corrections into batches that can be applied together.
+
+    Each batch is a run of consecutive corrections of a single data column, selected by
+    a single category column, which never select the same records twice. Applying the
+    batches in order is equivalent to applying the corrections in order.
+    """
+    batches = []
+    for correction in corrections:
+        batch = batches[-1] if batches else []
+        if (
+            batch
+            and batch[0].data_col == correction.data_col
+            and batch[0].cat_col == correction.cat_col
+            and correction.cat_val not in {uc.cat_val for uc in batch}
+        ):
+            batch.append(correction)
+        else:
+            batches.append([correction])
+    return batches
+
+
+def _correct_units_batch(
+    data: pd.Series, cats: pd.Series, corrections: list[UnitCorrections]
+) -> pd.Series:
+    """Apply a batch of unit corrections which select disjoint sets of records.
+
+    Because the domains of the unit conversions in a correction don't overlap with each
+    other or with the valid range, at most one conversion maps a value into the valid
+    range, and it's the one that gets applied.
+    """
+    # The index of the correction which selects each record, or -1 if there's none:
+    codes = pd.Categorical(cats, categories=[uc.cat_val for uc in corrections]).codes
+    selected = np.flatnonzero(codes >= 0)
+    codes = codes[selected]
+    values = pd.to_numeric(data.iloc[selected]).to_numpy(dtype=float, na_value=np.nan)
+
+    lower = np.array([uc.valid_range.lower_bound for uc in corrections])[codes]
+    upper = np.array([uc.valid_range.upper_bound for uc in corrections])[codes]
+    # Conversions that don't exist are padded with NaN, which is never valid:
+    n_convs = max(len(uc.unit_conversions) for uc in corrections)
+    multipliers = np.full((len(corrections), n_convs), np.nan)
+    adders = np.full((len(corrections), n_convs), np.nan)
+    for i, uc in enumerate(corrections):
+        for j, conv in enumerate(uc.unit_conversions):
+            multipliers[i, j] = conv.multiplier
+            adders[i, j] = conv.adder
+    converted = multipliers[codes] * values[:, np.newaxis] + adders[codes]
+    valid = (converted >= lower[:, np.newaxis]) & (converted <= upper[:, np.newaxis])
+    rows = np.flatnonzero(valid.any(axis=1))
+    corrected = values.copy()
+    corrected[rows] = converted[rows, valid[rows].argmax(axis=1)]
 
     # Nullify outliers that remain after the corrections have been applied.
-    na_before = sum(selected.isna())
-    selected = nullify_outliers(col=selected, params=params.valid_range)
-    na_after = sum(selected.isna())
-    total_nullified = na_after - na_before
-    logger.info(
-        f"{total_nullified}/{len(selected)} ({total_nullified/len(selected):.2%}) "
-        "of records could not be corrected and were set to NA."
-    )
-    # Combine our cleaned up values with the other values we didn't select.
-    df = df.copy()
-    df[params.data_col] = pd.concat([selected, not_selected])
-    return df
+    na_before = np.isnan(corrected)
+    corrected[~((corrected >= lower) & (corrected <= upper))] = np.nan
+    nullified = np.bincount(
+        codes, weights=np.isnan(corrected) & ~na_before, minlength=len(corrections)
+    ).astype(int)
+    n_selected = np.bincount(codes, minlength=len(corrections))
+    for uc, n_nullified, n_rows in zip(corrections, nullified, n_selected, strict=True):
+        logger.info(
+            f"Correcting units of {uc.data_col} where {uc.cat_col}=={uc.cat_val}. "
+            f"{n_nullified}/{n_rows} ({n_nullified / max(n_rows, 1):.2%}) "
+            "of records could not be corrected and were set to NA."
+        )
+
+    if not pd.api.types.is_float_dtype(data.dtype):
+        data = data.astype(float)
+    data = data.copy()
+    data.iloc[selected] = corrected
+    return data
 
 
 ################################################################################
@@ -782,6 +847,73 @@ class InvalidRows(TransformParams):
         return self
 
 
+def invalid_value_mask(df: pd.DataFrame, invalid_values: Iterable[Any]) -> np.ndarray:
+    """Find the values in a dataframe which are among a collection of invalid values.
+
+    This is like :meth:`pd.DataFrame.isin`, except that missing values are treated
+    consistently: if any kind of missing value (``None``, ``np.nan``, ``pd.NA`` or
+    ``pd.NaT``) is among the invalid values, then all missing values are invalid,
+    regardless of how they are represented, or the dtype of their column. Otherwise
+    missing values are valid. Other values are only compared to the invalid values that
+    could appear in their column: numbers in numeric and boolean columns, strings in
+    string and categorical columns, and all of them in object columns.
+
+    All numeric columns are compared at once as a single 2-D array of floats, as are
+    all object columns. Categorical columns are compared by their categories, and
+    string columns (including Arrow backed strings) with their own vectorized
+    :meth:`pd.Series.isin`.
+
+    Args:
+        df: the dataframe to check.
+        invalid_values: values to consider invalid.
+
+    Returns:
+        A boolean array with the same shape as ``df``, which is True where ``df``
+        contains an invalid value.
+    """
+    invalid_values = list(invalid_values)
+    na_is_invalid = any(
+        pd.api.types.is_scalar(v) and pd.isna(v) for v in invalid_values
+    )
+    values_to_match = [
+        v for v in invalid_values if not (pd.api.types.is_scalar(v) and pd.isna(v))
+    ]
+    numbers_to_match = [v for v in values_to_match if isinstance(v, Number)]
+    strings_to_match = [v for v in values_to_match if isinstance(v, str)]
+
+    mask = np.zeros(df.shape, dtype=bool)
+    numeric_cols, object_cols = [], []
+    for i, dtype in enumerate(df.dtypes):
+        if isinstance(dtype, pd.CategoricalDtype):
+            col = df.iloc[:, i]
+            codes = col.cat.codes.to_numpy()
+            invalid_categories = col.cat.categories.isin(values_to_match)
+            mask[:, i] = np.where(codes == -1, na_is_invalid, invalid_categories[codes])
+        elif pd.api.types.is_numeric_dtype(dtype):
+            numeric_cols.append(i)
+        elif pd.api.types.is_object_dtype(dtype):
+            object_cols.append(i)
+        elif pd.api.types.is_string_dtype(dtype):
+            col = df.iloc[:, i]
+            mask[:, i] = col.isin(strings_to_match).to_numpy(dtype=bool) | (
+                na_is_invalid & col.isna().to_numpy()
+            )
+        else:
+            # e.g. datetimes, which can't be invalid unless they're missing
+            mask[:, i] = na_is_invalid & df.iloc[:, i].isna().to_numpy()
+    if numeric_cols:
+        values = df.iloc[:, numeric_cols].to_numpy(dtype=float, na_value=np.nan)
+        mask[:, numeric_cols] = np.isin(values, numbers_to_match) | (
+            na_is_invalid & np.isnan(values)
+        )
+    if object_cols:
+        values = df.iloc[:, object_cols].to_numpy()
+        mask[:, object_cols] = pd.Series(values.ravel()).isin(
+            values_to_match
+        ).to_numpy().reshape(values.shape) | (na_is_invalid & pd.isna(values))
+    return mask
+
+
 def drop_invalid_rows(df: pd.DataFrame, params: InvalidRows) -> pd.DataFrame:
     """Drop rows with only invalid values in all specificed columns.
 
@@ -827,16 +959,9 @@ def drop_invalid_rows(df: pd.DataFrame, params: InvalidRows) -> pd.DataFrame:
     # Create a boolean mask selecting the ROWS where NOT ALL of the columns we
     # care about are invalid (i.e. where ANY of the columns we care about contain a
     # valid value):
-
-    # For some reason, a simple cols_to_check.isin(params.invalid_values) fails
-    # on some dfs with NA values. this cols_to_check.transform() is intended as
-    # a drop-in replacement for cols_to_check.isin(params.invalid_values)
-    invalids = cols_to_check.transform(
-        lambda x: x.map(dict.fromkeys(params.invalid_values, True)).fillna(False)
-    )
-    mask = ~(invalids.all(axis="columns"))
-    # Mask the input dataframe and make a copy to avoid returning a slice.
-    df_out = df[mask].copy()
+    mask = ~invalid_value_mask(cols_to_check, params.invalid_values).all(axis=1)
+    # Taking the rows by position returns a new dataframe, rather than a slice.
+    df_out = df.take(np.flatnonzero(mask))
     logger.info(
         f"{1 - (len(df_out)/pre_drop_len):.1%} of records ({pre_drop_len-len(df_out)} "
         f"rows) contain only {params.invalid_values} values in required columns. "
@@ -861,8 +986,17 @@ class ReplaceWithNa(TransformParams):
 
 
 def replace_with_na(col: pd.Series, params: ReplaceWithNa) -> pd.Series:
-    """Replace specified values with NA."""
-    return col.replace(params.replace_with_na, pd.NA)
+    """Replace specified values with NA.
+
+    Values are matched as in :func:`invalid_value_mask`. Columns which contain none of
+    the specified values are returned unchanged.
+    """
+    to_replace = invalid_value_mask(col.to_frame(), params.replace_with_na)[:, 0]
+    if not to_replace.any():
+        return col
+    if pd.api.types.is_object_dtype(col.dtype):
+        return col.mask(to_replace, pd.NA)
+    return col.mask(to_replace)
 
 
 replace_with_na_multicol = multicol_transform_factory(replace_with_na)
@@ -933,6 +1067,70 @@ def spot_fix_values(df: pd.DataFrame, params: SpotFixes) -> pd.DataFrame:
     return df
 
 
+################################################################################
+# Compile several column transforms into a single pass over each column
+################################################################################
+COLUMN_TRANSFORM_FUNCS: dict[str, ColumnTransformFunc] = {
+    "normalize_strings": normalize_strings,
+    "categorize_strings": categorize_strings,
+    "convert_units": convert_units,
+    "strip_non_numeric_values": strip_non_numeric_values,
+    "nullify_outliers": nullify_outliers,
+    "replace_with_na": replace_with_na,
+}
+"""The column transform functions, keyed by the name of their table parameters."""
+
+
+def compile_column_transforms(
+    params: "TableTransformParams", steps: Sequence[str], columns: Iterable[str]
+) -> dict[str, list[tuple[ColumnTransformFunc, TransformParams]]]:
+    """Compile the column transforms of several steps into one plan per column.
+
+    Applying each step to a whole table with its :class:`MultiColumnTransformFunc`
+    makes a new copy of the table for every column that's transformed. Instead, this
+    follows each column through all the steps, so all of its transformations can be
+    applied one after the other. Columns renamed by :func:`convert_units` are followed
+    under their new name in later steps.
+
+    Args:
+        params: the table transform parameters, including the parameters of each step.
+        steps: names of the column transforms in the order they're applied. Each must be
+            a key of :data:`COLUMN_TRANSFORM_FUNCS`.
+        columns: the columns of the table to be transformed.
+
+    Returns:
+        The transform functions and their parameters to apply in order to each column
+        of the input table that needs to be transformed.
+
+    Raises:
+        ValueError: if a column would be renamed to the name of another column.
+    """
+    # The input column which each of the current column names came from
+    sources = {col: col for col in columns}
+    plan: dict[str, list[tuple[ColumnTransformFunc, TransformParams]]] = {}
+    for step in steps:
+        col_func = COLUMN_TRANSFORM_FUNCS[step]
+        for col_name, col_params in getattr(params, step).items():
+            if col_name not in sources:
+                logger.warning(
+                    f"Expected column {col_name} not found in dataframe during "
+                    f"application of {col_func.__name__}."
+                )
+                continue
+            new_name = col_name
+            if col_func is convert_units:
+                new_name = re.sub(col_params.pattern, col_params.repl, col_name)
+                if new_name != col_name and new_name in sources:
+                    raise ValueError(
+                        f"Converting the units of {col_name} would rename it to "
+                        f"{new_name}, which is already a column."
+                    )
+            source = sources.pop(col_name)
+            sources[new_name] = source
+            plan.setdefault(source, []).append((col_func, col_params))
+    return plan
+
+
 ################################################################################
 # A parameter model collecting all the valid generic transform params:
 ################################################################################
@@ -1113,6 +1311,13 @@ class AbstractTableTransformer(ABC):
     clear_cached_dfs: bool = True
     """Determines whether cached dataframes are deleted at the end of the transform."""
 
+    compile_column_transforms: bool = True
+    """Whether to apply several column transforms in one pass over each column.
+
+    See :meth:`AbstractTableTransformer.transform_columns`. When False, each column
+    transform is applied to the whole table in turn, which can be easier to debug.
+    """
+
     _cached_dfs: dict[str, pd.DataFrame] = {}
     """Cached intermediate dataframes for use in development and debugging.
 
@@ -1140,6 +1345,7 @@ class AbstractTableTransformer(ABC):
         params: TableTransformParams | None = None,
         cache_dfs: bool = False,
         clear_cached_dfs: bool = True,
+        compile_column_transforms: bool = True,
         **kwargs,
     ) -> None:
         """Initialize the table transformer, setting caching flags."""
@@ -1152,6 +1358,7 @@ class AbstractTableTransformer(ABC):
             self.params = params
         self.cache_dfs = cache_dfs
         self.clear_cached_dfs = clear_cached_dfs
+        self.compile_column_transforms = compile_column_transforms
 
     ################################################################################
     # Abstract methods that must be defined by subclasses
@@ -1303,10 +1510,53 @@ class AbstractTableTransformer(ABC):
         )
         return convert_units_multicol(df, params)
 
+    def transform_columns(self, df: pd.DataFrame, steps: Sequence[str]) -> pd.DataFrame:
+        """Apply several column transforms, in one pass over each column.
+
+        The result is the same as applying the methods named in ``steps`` one after
+        the other, using the transformer's parameters, except that columns which are
+        transformed stay where they are unless they're renamed. The transforms are
+        compiled with :func:`compile_column_transforms` and the transformed columns
+        replace the originals in a shallow copy of the dataframe, so the columns which
+        aren't transformed are never copied.
+
+        If :attr:`compile_column_transforms` is False, or any of the methods named in
+        ``steps`` has been overridden, the methods are applied one after the other.
+
+        Args:
+            df: the dataframe to transform.
+            steps: names of the column transform methods to apply, in order. Each must
+                be a key of :data:`COLUMN_TRANSFORM_FUNCS`.
+        """
+        overridden = [
+            step
+            for step in steps
+            if getattr(type(self), step) is not getattr(AbstractTableTransformer, step)
+        ]
+        if overridden or not self.compile_column_transforms:
+            for step in steps:
+                df = getattr(self, step)(df)
+            return df
+
+        plan = compile_column_transforms(self.params, steps, df.columns)
+        logger.info(
+            f"{self.table_id.value}: Applying {', '.join(steps)} to {len(plan)} "
+            "columns."
+        )
+        df = df.copy(deep=False)
+        for col_name, transforms in plan.items():
+            col = df[col_name]
+            for col_func, col_params in transforms:
+                col = col_func(col=col, params=col_params)
+            if col.name != col_name:
+                del df[col_name]
+            df[col.name] = col
+        return df
+
     def correct_units(
         self,
         df: pd.DataFrame,
-        params: UnitCorrections | None = None,
+        params: list[UnitCorrections] | None = None,
     ) -> pd.DataFrame:
         """Apply all specified unit corrections to the table in order.
 
@@ -1317,9 +1567,7 @@ class AbstractTableTransformer(ABC):
         logger.info(
             f"{self.table_id.value}: Correcting inferred non-standard column units."
         )
-        for correction in params:
-            df = correct_units(df, correction)
-        return df
+        return correct_units(df, params)
 
     def drop_invalid_rows(
         self, df: pd.DataFrame, params: list[InvalidRows] | None = None
@@ -17,8 +17,11 @@ found in :func:`pudl.transform.eia._boiler_generator_assn`.
 """
 
 import importlib.resources
+import os
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from enum import StrEnum, auto
+from pathlib import Path
 from typing import Literal
 
 import networkx as nx
@@ -42,6 +45,7 @@ from pudl.metadata.enums import APPROXIMATE_TIMEZONES
 from pudl.metadata.fields import apply_pudl_dtypes, get_pudl_dtypes
 from pudl.metadata.resources import ENTITIES
 from pudl.settings import EiaSettings
+from pudl.workspace.setup import PudlPaths
 
 logger = pudl.logging_helpers.get_logger(__name__)
 
@@ -116,6 +120,8 @@ def occurrence_consistency(
     the number of occurances of each reported record for each entity. With that
     information we can determine if the reported records are strict enough.
 
+    This is a single column version of :func:`occurrence_consistency_by_column`.
+
     Args:
         entity_idx: a list of the id(s) for the entity. Ex: for a plant
             entity, the entity_idx is ['plant_id_eia']. For a generator entity,
@@ -134,50 +140,112 @@ def occurrence_consistency(
         A transformed version of compiled_df with NaNs removed and with new columns with
         information about the consistency of the reported values.
     """
-    # select only the colums you want and drop the NaNs
-    # we want to drop the NaNs because
-    col_df = compiled_df[entity_idx + ["report_date", col]].copy()
-    if get_pudl_dtypes(group="eia")[col] == "string":
-        nan_str_mask = (col_df[col] == "nan").fillna(False)
-        col_df.loc[nan_str_mask, col] = pd.NA
-    col_df = col_df.dropna()
-
-    if len(col_df) == 0:
-        col_df[f"{col}_is_consistent"] = pd.NA
-        col_df[f"{col}_consistent_rate"] = pd.NA
-        col_df["entity_occurences"] = pd.NA
-        return col_df
-    # determine how many times each entity occurs in col_df
-    occur = (
-        col_df.assign(entity_occurences=1)
-        .groupby(by=cols_to_consit, observed=True)[["entity_occurences"]]
-        .count()
-        .reset_index()
-    )
+    return occurrence_consistency_by_column(
+        entity_idx,
+        compiled_df,
+        cols_to_consit={col: cols_to_consit},
+        strictness={col: strictness},
+    )[col]
 
-    # add the occurances into the main dataframe
-    col_df = col_df.merge(occur, on=cols_to_consit)
 
-    # determine how many instances of each of the records in col exist
-    consist_df = (
-        col_df.assign(record_occurences=1)
-        .groupby(by=cols_to_consit + [col], observed=True)[["record_occurences"]]
-        .count()
-        .reset_index()
-    )
-    # now in col_df we have # of times an entity occurred accross the tables
-    # and we are going to merge in the # of times each value occured for each
-    # entity record. When we merge the consistency in with the occurances, we
-    # can determine if the records are more than 70% consistent across the
-    # occurances of the entities.
-    col_df = col_df.merge(consist_df, how="outer")
-    # change all of the fully consistent records to True
-    col_df[f"{col}_consistent_rate"] = (
-        col_df["record_occurences"] / col_df["entity_occurences"]
-    )
-    col_df[f"{col}_is_consistent"] = col_df[f"{col}_consistent_rate"] > strictness
-    col_df = col_df.sort_values(f"{col}_consistent_rate")
-    return col_df
+def occurrence_consistency_by_column(
+    entity_idx: list[str],
+    compiled_df: pd.DataFrame,
+    cols_to_consit: dict[str, list[str]],
+    strictness: dict[str, float],
+) -> dict[str, pd.DataFrame]:
+    """Find the occurence of entities & the consistency of records for many columns.
+
+    Rather than grouping and merging the compiled records separately for each column,
+    every harvestable value is integer coded and stacked into a single long table,
+    indexed by column, entity (or entity-year) and value. The number of occurences of
+    each entity and of each reported record for every column are then found with one
+    grouped pass over that long table.
+
+    The returned dataframes are identical to those the original column-by-column
+    merge based implementation produced, including their row order, which determines
+    which value is harvested when more than one value passes the strictness threshold.
+
+    Args:
+        entity_idx: a list of the id(s) for the entity. Ex: for a plant
+            entity, the entity_idx is ['plant_id_eia']. For a generator entity,
+            the entity_idx is ['plant_id_eia', 'generator_id'].
+        compiled_df: a dataframe with every instance of the columns we are trying to
+            harvest.
+        cols_to_consit: a dictionary mapping the name of each column we are trying to
+            harvest to the list of columns used to determine its consistency. This is
+            either the [entity_id] or the [entity_id, 'report_date'], depending on
+            whether the column is static or annual.
+        strictness: a dictionary mapping the name of each column we are trying to
+            harvest to the share of records that need to be consistent in order to
+            accept harvesting the record.
+
+    Returns:
+        A dictionary with one dataframe per harvested column, containing the records
+        of compiled_df with NaNs removed and with new columns with information about
+        the consistency of the reported values.
+    """
+    eia_dtypes = get_pudl_dtypes(group="eia")
+    group_codes = {
+        consit: compiled_df.groupby(list(consit), observed=True, sort=False)
+        .ngroup()
+        .to_numpy()
+        for consit in {tuple(consit) for consit in cols_to_consit.values()}
+    }
+    key_present = compiled_df[entity_idx + ["report_date"]].notna().all(axis=1)
+    stacked = []
+    for col_num, (col, consit) in enumerate(cols_to_consit.items()):
+        present = key_present & compiled_df[col].notna()
+        if eia_dtypes[col] == "string":
+            present &= ~(compiled_df[col] == "nan").fillna(False)
+        rows = np.flatnonzero(present.to_numpy())
+        stacked.append(
+            pd.DataFrame(
+                {
+                    "col_num": col_num,
+                    "entity": group_codes[tuple(consit)][rows],
+                    "value": pd.factorize(compiled_df[col])[0][rows],
+                    "row": rows,
+                }
+            )
+        )
+    stacked = pd.concat(stacked, ignore_index=True)
+    stacked["entity_occurences"] = stacked.groupby(["col_num", "entity"], sort=False)[
+        "row"
+    ].transform("size")
+    stacked["record_occurences"] = stacked.groupby(
+        ["col_num", "entity", "value"], sort=False
+    )["row"].transform("size")
+
+    col_dfs = {}
+    for col_num, (col, consit) in enumerate(cols_to_consit.items()):
+        col_stack = stacked[stacked.col_num == col_num]
+        col_df = (
+            compiled_df[entity_idx + ["report_date", col]]
+            .iloc[col_stack.row.to_numpy()]
+            .reset_index(drop=True)
+        )
+        if len(col_df) == 0:
+            col_df[f"{col}_is_consistent"] = pd.NA
+            col_df[f"{col}_consistent_rate"] = pd.NA
+            col_df["entity_occurences"] = pd.NA
+            col_dfs[col] = col_df
+            continue
+        col_df["entity_occurences"] = col_stack.entity_occurences.to_numpy()
+        col_df["record_occurences"] = col_stack.record_occurences.to_numpy()
+        # Records are ordered by their consistency keys and then by their order of
+        # appearance in compiled_df, like the outer merge this replaced.
+        col_df = col_df.sort_values(consit + [col], kind="stable").reset_index(
+            drop=True
+        )
+        col_df[f"{col}_consistent_rate"] = (
+            col_df["record_occurences"] / col_df["entity_occurences"]
+        )
+        col_df[f"{col}_is_consistent"] = (
+            col_df[f"{col}_consistent_rate"] > strictness[col]
+        )
+        col_dfs[col] = col_df.sort_values(f"{col}_consistent_rate")
+    return col_dfs
 
 
 def _lat_long(
@@ -296,23 +364,117 @@ def _round_operating_date(
     return op_clean_df
 
 
-def _add_timezone(plants_entity: pd.DataFrame) -> pd.DataFrame:
+def find_timezones(
+    locations: pd.DataFrame,
+    cache_path: Path | None = None,
+    round_to: int = 6,
+) -> pd.Series:
+    """Find the timezones associated with many locations at once.
+
+    This is a batch version of :func:`find_timezone` with ``strict=False``. Rather
+    than looking up every row, the coordinates are rounded to ``round_to`` decimal
+    places and each unique (latitude, longitude) pair is only resolved once. Rows with
+    missing or out-of-range coordinates fall back to the approximate timezone of their
+    state, using a vectorized lookup.
+
+    If ``cache_path`` is given, previously resolved coordinates are read from that
+    Parquet file, and any newly resolved coordinates are added to it, so that
+    subsequent runs don't need to repeat the (slow) geographic lookups. The cache is
+    only valid for the version of timezonefinder that filled it, which is why
+    :attr:`pudl.workspace.setup.PudlPaths.timezone_cache_path` is versioned.
+
+    Args:
+        locations: Table including columns named "latitude" and "longitude", and
+            optionally "state".
+        cache_path: Path to a Parquet file used to persist resolved timezones between
+            runs. If None, no cache is used.
+        round_to: Number of decimal places to which coordinates are rounded before
+            they are looked up and used as cache keys.
+
+    Returns:
+        A series of IANA timezone strings with the same index as ``locations``.
+        Timezone may be missing if lat / lon is missing or invalid and no state is
+        available.
+    """
+    coords = pd.DataFrame(
+        {
+            "latitude": pd.to_numeric(locations["latitude"], errors="coerce")
+            .astype(float)
+            .round(round_to),
+            "longitude": pd.to_numeric(locations["longitude"], errors="coerce")
+            .astype(float)
+            .round(round_to),
+        },
+        index=locations.index,
+    )
+    # Coordinates that timezonefinder would reject. These use the state fallback.
+    valid = coords.latitude.between(-90, 90) & coords.longitude.between(-180, 180)
+    unique_coords = coords[valid].drop_duplicates().reset_index(drop=True)
+
+    cached = pd.DataFrame({"latitude": [], "longitude": [], "timezone": []}).astype(
+        {"latitude": float, "longitude": float, "timezone": "string"}
+    )
+    if cache_path is not None and Path(cache_path).exists():
+        cached = pd.read_parquet(cache_path).astype(cached.dtypes.to_dict())
+    unique_coords = unique_coords.merge(
+        cached, on=["latitude", "longitude"], how="left", indicator=True
+    )
+    uncached = unique_coords["_merge"] == "left_only"
+    logger.info(
+        f"Looking up timezones for {uncached.sum()} of {len(unique_coords)} "
+        "unique plant locations."
+    )
+    unique_coords.loc[uncached, "timezone"] = [
+        find_timezone(lng=lng, lat=lat, strict=False)
+        for lat, lng in zip(
+            unique_coords.loc[uncached, "latitude"],
+            unique_coords.loc[uncached, "longitude"],
+            strict=True,
+        )
+    ]
+    unique_coords = unique_coords.drop(columns="_merge")
+    if cache_path is not None and uncached.any():
+        Path(cache_path).parent.mkdir(parents=True, exist_ok=True)
+        new_coords = unique_coords.loc[uncached, cached.columns]
+        if not cached.empty:
+            new_coords = pd.concat([cached, new_coords], ignore_index=True)
+        # Write the cache to a temporary file and move it into place, so that
+        # concurrent runs never read a partially written cache.
+        tmp_path = Path(cache_path).with_suffix(f".{os.getpid()}.tmp")
+        new_coords.astype(cached.dtypes.to_dict()).to_parquet(tmp_path, index=False)
+        tmp_path.replace(cache_path)
+
+    timezones = (
+        coords.reset_index(drop=True)
+        .merge(unique_coords, on=["latitude", "longitude"], how="left")
+        .set_axis(coords.index)["timezone"]
+        .astype("object")
+    )
+    if "state" in locations.columns:
+        timezones = timezones.where(
+            valid, locations["state"].map(APPROXIMATE_TIMEZONES)
+        )
+    else:
+        timezones = timezones.where(valid)
+    return timezones.where(timezones.notna(), None)
+
+
+def _add_timezone(
+    plants_entity: pd.DataFrame, cache_path: Path | None = None
+) -> pd.DataFrame:
     """Add plant IANA timezone based on lat/lon or state if lat/lon is unavailable.
 
     Args:
         plants_entity: Plant entity table, including columns named "latitude",
             "longitude", and optionally "state"
+        cache_path: Optional Parquet file in which resolved timezones are cached
+            between runs. See :func:`find_timezones`.
 
     Returns:
         A DataFrame containing the same table, with a "timezone" column added.
         Timezone may be missing if lat / lon is missing or invalid.
     """
-    plants_entity["timezone"] = plants_entity.apply(
-        lambda row: find_timezone(
-            lng=row["longitude"], lat=row["latitude"], state=row["state"], strict=False
-        ),
-        axis=1,
-    )
+    plants_entity["timezone"] = find_timezones(plants_entity, cache_path=cache_path)
     return plants_entity
 
 
@@ -447,11 +609,119 @@ def _manage_strictness(col: str, eia860m: bool) -> float:
     return strictness_cols.get(col, strictness_default)
 
 
+def _harvest_column(
+    col: str,
+    col_df: pd.DataFrame,
+    entity_id_df: pd.DataFrame,
+    annual_id_df: pd.DataFrame,
+    id_cols: list[str],
+    static_cols: list[str],
+    cols_to_consit: list[str],
+    debug: bool = False,
+) -> tuple[pd.DataFrame, pd.DataFrame | None, dict]:
+    """Select the consistent values of a single harvested column.
+
+    Args:
+        col: name of the column being harvested.
+        col_df: the consistency of each record of the column, as produced by
+            :func:`occurrence_consistency_by_column`.
+        entity_id_df: a dataframe with a complete set of possible entity ids.
+        annual_id_df: a dataframe with a complete set of possible entity ids and
+            report dates.
+        id_cols: the id column(s) of the entity.
+        static_cols: the static columns of the entity.
+        cols_to_consit: the columns used to determine the consistency of the column.
+        debug: if True, log when columns are inconsistent, but don't raise an error.
+
+    Returns:
+        The harvested values of the column indexed by id_cols (and report_date for
+        annual columns), the values harvested by a special case method if the column
+        has one (or None), and the consistency statistics of the column.
+    """
+    special_case_cols = {
+        "latitude": [_lat_long, 1],
+        "longitude": [_lat_long, 1],
+        "generator_operating_date": [_round_operating_date, "Y"],
+    }
+    # pull the correct values out of the df and merge w/ the plant ids
+    col_correct_df = col_df[col_df[f"{col}_is_consistent"]].drop_duplicates(
+        subset=(cols_to_consit + [f"{col}_is_consistent"])
+    )
+
+    # we need this to be an empty df w/ columns bc we are going to use it
+    if col_correct_df.empty:
+        col_correct_df = pd.DataFrame(columns=col_df.columns)
+
+    if col in static_cols:
+        clean_df = entity_id_df.merge(col_correct_df, on=id_cols, how="left")
+        clean_df = clean_df[id_cols + [col]]
+    else:
+        clean_df = annual_id_df.merge(
+            col_correct_df, on=(id_cols + ["report_date"]), how="left"
+        )
+        clean_df = clean_df[id_cols + ["report_date", col]]
+
+    special_clean_df = None
+    if col in special_case_cols:
+        if col not in static_cols:
+            raise AssertionError(
+                "Method currenty not configured to work with annual values."
+            )
+        # get the still dirty records by using the cleaned ids w/null values
+        # we need the plants that have no 'correct' value so
+        # we can't just use the col_df records when the consistency is not True
+        dirty_df = col_df.merge(clean_df[clean_df[col].isnull()][id_cols])
+        special_clean_df = special_case_cols[col][0](
+            dirty_df,
+            clean_df,
+            entity_id_df,
+            id_cols,
+            col,
+            cols_to_consit,
+            special_case_cols[col][1],
+        )[id_cols + [col]]
+
+    # this next section is used to print and test whether the harvested
+    # records are consistent enough
+    total = len(col_df.drop_duplicates(subset=cols_to_consit))
+    # if the total is 0, the ratio will error, so assign null values.
+    if total == 0:
+        ratio = np.nan
+        wrongos = np.nan
+        logger.debug(f"       Zero records found for {col}")
+    if total > 0:
+        ratio = (
+            len(
+                col_df[(col_df[f"{col}_is_consistent"])].drop_duplicates(
+                    subset=cols_to_consit
+                )
+            )
+            / total
+        )
+        wrongos = (1 - ratio) * total
+        logger.debug(
+            f"       Ratio: {ratio:.3}  "
+            f"Wrongos: {wrongos:.5}  "
+            f"Total: {total}   {col}"
+        )
+        if ratio < 0.9:
+            if debug:
+                logger.error(f"{col} has low consistency: {ratio:.3}.")
+            else:
+                raise AssertionError(
+                    f"Harvesting of {col} is too inconsistent at {ratio:.3}."
+                )
+    consistency = {"consistent_ratio": [ratio], "wrongos": [wrongos], "total": [total]}
+    return clean_df, special_clean_df, consistency
+
+
 def harvest_entity_tables(  # noqa: C901
     entity: EiaEntity,
     clean_dfs: dict[str, pd.DataFrame],
     eia_settings: EiaSettings,
     debug: bool = False,
+    timezone_cache_path: Path | None = None,
+    max_workers: int = 1,
 ) -> tuple:
     """Compile consistent records for various entities.
 
@@ -485,6 +755,10 @@ def harvest_entity_tables(  # noqa: C901
         eia860m: if True, the etl run is attempting to include year-to-date updated from
             EIA 860M.
         debug: if True, log when columns are inconsistent, but don't raise an error.
+        timezone_cache_path: Parquet file used to cache plant timezones looked up from
+            their coordinates between runs. Only used for the plants entity.
+        max_workers: number of threads used to select the consistent values of the
+            harvested columns. Columns are harvested serially if 1.
 
     Returns:
         entity_df (the harvested entity table), annual_df (the annual entity table),
@@ -537,127 +811,69 @@ def harvest_entity_tables(  # noqa: C901
         subset=id_cols
     )
 
-    entity_df = entity_id_df.copy()
-    annual_df = annual_id_df.copy()
-    special_case_cols = {
-        "latitude": [_lat_long, 1],
-        "longitude": [_lat_long, 1],
-        "generator_operating_date": [_round_operating_date, "Y"],
+    cols_to_consit = {col: id_cols for col in static_cols} | {
+        col: id_cols + ["report_date"] for col in annual_cols
     }
-    consistency = pd.DataFrame(
-        columns=["column", "consistent_ratio", "wrongos", "total"]
+    col_dfs = occurrence_consistency_by_column(
+        id_cols,
+        compiled_df,
+        cols_to_consit=cols_to_consit,
+        strictness={
+            col: _manage_strictness(col, eia_settings.eia860.eia860m)
+            for col in cols_to_consit
+        },
     )
-    col_dfs = {}
-    # determine how many times each of the columns occur
-    for col in static_cols + annual_cols:
-        if col in annual_cols:
-            cols_to_consit = id_cols + ["report_date"]
-        if col in static_cols:
-            cols_to_consit = id_cols
-
-        strictness = _manage_strictness(col, eia_settings.eia860.eia860m)
-        col_df = occurrence_consistency(
-            id_cols, compiled_df, col, cols_to_consit, strictness=strictness
-        )
 
-        # pull the correct values out of the df and merge w/ the plant ids
-        col_correct_df = col_df[col_df[f"{col}_is_consistent"]].drop_duplicates(
-            subset=(cols_to_consit + [f"{col}_is_consistent"])
+    def harvest_col(col: str) -> tuple[pd.DataFrame, pd.DataFrame | None, dict]:
+        return _harvest_column(
+            col,
+            col_dfs[col],
+            entity_id_df=entity_id_df,
+            annual_id_df=annual_id_df,
+            id_cols=id_cols,
+            static_cols=static_cols,
+            cols_to_consit=cols_to_consit[col],
+            debug=debug,
         )
 
-        # we need this to be an empty df w/ columns bc we are going to use it
-        if col_correct_df.empty:
-            col_correct_df = pd.DataFrame(columns=col_df.columns)
+    if max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            harvested_cols = list(executor.map(harvest_col, cols_to_consit))
+    else:
+        harvested_cols = [harvest_col(col) for col in cols_to_consit]
 
+    entity_df = entity_id_df.copy()
+    annual_df = annual_id_df.copy()
+    consistency = pd.DataFrame(
+        columns=["column", "consistent_ratio", "wrongos", "total"]
+    )
+    for col, (clean_df, special_clean_df, col_consistency) in zip(
+        cols_to_consit, harvested_cols, strict=True
+    ):
         if col in static_cols:
-            clean_df = entity_id_df.merge(col_correct_df, on=id_cols, how="left")
-            clean_df = clean_df[id_cols + [col]]
             entity_df = entity_df.merge(clean_df, on=id_cols)
-
+            if special_clean_df is not None:
+                entity_df = entity_df.drop(columns=[col]).merge(
+                    special_clean_df, on=id_cols
+                )
         if col in annual_cols:
-            clean_df = annual_id_df.merge(
-                col_correct_df, on=(id_cols + ["report_date"]), how="left"
-            )
-            clean_df = clean_df[id_cols + ["report_date", col]]
             annual_df = annual_df.merge(clean_df, on=(id_cols + ["report_date"]))
-
-        # get the still dirty records by using the cleaned ids w/null values
-        # we need the plants that have no 'correct' value so
-        # we can't just use the col_df records when the consistency is not True
-        dirty_df = col_df.merge(clean_df[clean_df[col].isnull()][id_cols])
-
-        if col in special_case_cols:
-            clean_df = special_case_cols[col][0](
-                dirty_df,
-                clean_df,
-                entity_id_df,
-                id_cols,
-                col,
-                cols_to_consit,
-                special_case_cols[col][1],
-            )
-            if col in static_cols:
-                clean_df = clean_df[id_cols + [col]]
-                entity_df = entity_df.drop(columns=[col]).merge(clean_df, on=id_cols)
-            elif col in annual_cols:
-                raise AssertionError(
-                    "Method currenty not configured to work with annual values."
-                )
-
-        if debug:
-            col_dfs[col] = col_df
-        # this next section is used to print and test whether the harvested
-        # records are consistent enough
-        total = len(col_df.drop_duplicates(subset=cols_to_consit))
-        # if the total is 0, the ratio will error, so assign null values.
-        if total == 0:
-            ratio = np.nan
-            wrongos = np.nan
-            logger.debug(f"       Zero records found for {col}")
-        if total > 0:
-            ratio = (
-                len(
-                    col_df[(col_df[f"{col}_is_consistent"])].drop_duplicates(
-                        subset=cols_to_consit
-                    )
-                )
-                / total
-            )
-            wrongos = (1 - ratio) * total
-            logger.debug(
-                f"       Ratio: {ratio:.3}  "
-                f"Wrongos: {wrongos:.5}  "
-                f"Total: {total}   {col}"
-            )
-            if ratio < 0.9:
-                if debug:
-                    logger.error(f"{col} has low consistency: {ratio:.3}.")
-                else:
-                    raise AssertionError(
-                        f"Harvesting of {col} is too inconsistent at {ratio:.3}."
-                    )
         # add to a small df to be used in order to print out the ratio of
         # consistent records
         consistency = pd.concat(
-            [
-                consistency,
-                pd.DataFrame(
-                    {
-                        "column": [col],
-                        "consistent_ratio": [ratio],
-                        "wrongos": [wrongos],
-                        "total": [total],
-                    }
-                ),
-            ],
+            [consistency, pd.DataFrame({"column": [col]} | col_consistency)],
             ignore_index=True,
         )
+    if not debug:
+        col_dfs = {}
     mcs = consistency["consistent_ratio"].mean()
     logger.info(f"Average consistency of static {entity.value} values is {mcs:.2%}")
 
     if entity == EiaEntity.PLANTS:
         # Post-processing specific to the plants entity tables
-        entity_df = _add_additional_epacems_plants(entity_df).pipe(_add_timezone)
+        entity_df = _add_additional_epacems_plants(entity_df).pipe(
+            _add_timezone, cache_path=timezone_cache_path
+        )
         annual_df = fillna_balancing_authority_codes_via_names(annual_df).pipe(
             fix_balancing_authority_codes_with_state, plants_entity=entity_df
         )
@@ -794,7 +1010,10 @@ def core_eia860__assn_boiler_generator(context, **clean_dfs) -> pd.DataFrame:
     bf_eia923 = (
         bf_eia923.set_index(pd.DatetimeIndex(bf_eia923.report_date))
         .groupby([pd.Grouper(freq="YS"), "plant_id_eia", "boiler_id"])
-        .agg({"total_heat_content_mmbtu": pudl.helpers.sum_na})
+        .pipe(
+            pudl.helpers.groupby_agg,
+            {"total_heat_content_mmbtu": pudl.helpers.sum_na},
+        )
         .reset_index()
         .drop_duplicates(subset=["plant_id_eia", "report_date", "boiler_id"])
     )
@@ -1259,6 +1478,22 @@ def harvested_entity_asset_factory(
                     "produce additional debugging output."
                 ),
             ),
+            "max_workers": Field(
+                int,
+                default_value=1,
+                description=(
+                    "Number of threads used to harvest the entity's columns. "
+                    "Columns are harvested serially if 1."
+                ),
+            ),
+            "cache_timezones": Field(
+                bool,
+                default_value=True,
+                description=(
+                    "If True, cache the plant timezones looked up from their "
+                    "coordinates in the PUDL input directory between runs."
+                ),
+            ),
         },
         required_resource_keys={"dataset_settings"},
         name=f"harvested_{entity.value}_eia",
@@ -1273,7 +1508,14 @@ def harvested_entity_asset_factory(
         }
 
         entity_df, annual_df, _col_dfs = harvest_entity_tables(
-            entity, clean_dfs, debug=debug, eia_settings=eia_settings
+            entity,
+            clean_dfs,
+            debug=debug,
+            eia_settings=eia_settings,
+            timezone_cache_path=PudlPaths().timezone_cache_path
+            if context.op_config["cache_timezones"]
+            else None,
+            max_workers=context.op_config["max_workers"],
         )
 
         return (
@@ -16,12 +16,13 @@ import re
 from abc import abstractmethod
 from collections import namedtuple
 from collections.abc import Mapping
+from functools import cache
 from typing import Annotated, Any, Literal, Self
 
 import numpy as np
 import pandas as pd
 import sqlalchemy as sa
-from dagster import AssetIn, AssetsDefinition, asset
+from dagster import AssetIn, AssetsDefinition, In, Out, asset, graph_asset, op
 from pandas.core.groupby import DataFrameGroupBy
 from pydantic import BaseModel, Field, field_validator
 
@@ -1867,7 +1868,16 @@ def get_data_cols_raw_xbrl(
 
 
 def read_xbrl_calculation_fixes() -> pd.DataFrame:
-    """Read in the table of calculation fixes."""
+    """Read in the table of calculation fixes.
+
+    The fixes are only read from the package data once per process. Each call returns
+    a new copy of them which the caller is free to modify.
+    """
+    return _read_xbrl_calculation_fixes().copy()
+
+
+@cache
+def _read_xbrl_calculation_fixes() -> pd.DataFrame:
     source = importlib.resources.files("pudl.package_data.ferc1").joinpath(
         "xbrl_calculation_component_fixes.csv"
     )
@@ -1918,14 +1928,27 @@ class Ferc1AbstractTableTransformer(AbstractTableTransformer):
         params: TableTransformParams | None = None,
         cache_dfs: bool = False,
         clear_cached_dfs: bool = True,
+        compile_column_transforms: bool = True,
+        xbrl_metadata: pd.DataFrame | None = None,
+        xbrl_calculations: pd.DataFrame | None = None,
     ) -> None:
-        """Augment inherited initializer to store XBRL metadata in the class."""
+        """Augment inherited initializer to store XBRL metadata in the class.
+
+        The XBRL metadata can either be processed from the table's raw
+        ``xbrl_metadata_json``, or be passed in already processed as ``xbrl_metadata``
+        and ``xbrl_calculations``, e.g. from :func:`_core_ferc1_xbrl__table_metadata`,
+        which processes the metadata of all the tables once per run.
+        """
         super().__init__(
             params=params,
             cache_dfs=cache_dfs,
             clear_cached_dfs=clear_cached_dfs,
+            compile_column_transforms=compile_column_transforms,
         )
-        if xbrl_metadata_json:
+        if xbrl_metadata is not None:
+            self.xbrl_metadata = xbrl_metadata
+            self.xbrl_calculations = xbrl_calculations
+        elif xbrl_metadata_json:
             xbrl_metadata_converted = self.convert_xbrl_metadata_json_to_df(
                 xbrl_metadata_json
             )
@@ -1944,8 +1967,20 @@ class Ferc1AbstractTableTransformer(AbstractTableTransformer):
         raw_xbrl_duration: pd.DataFrame,
     ) -> pd.DataFrame:
         """Process the raw data until the XBRL and DBF inputs have been unified."""
-        processed_dbf = self.process_dbf(raw_dbf)
-        processed_xbrl = self.process_xbrl(raw_xbrl_instant, raw_xbrl_duration)
+        return self.concat_dbf_xbrl(
+            self.process_dbf(raw_dbf),
+            self.process_xbrl(raw_xbrl_instant, raw_xbrl_duration),
+        )
+
+    def concat_dbf_xbrl(
+        self, processed_dbf: pd.DataFrame, processed_xbrl: pd.DataFrame
+    ) -> pd.DataFrame:
+        """Unify the separately processed DBF and XBRL data.
+
+        The DBF and XBRL data are processed independently of each other, and of the
+        XBRL metadata, so they can be processed concurrently, as they are by the assets
+        made by :func:`ferc1_transform_asset_factory`.
+        """
         processed_dbf = self.select_dbf_rows_by_category(processed_dbf, processed_xbrl)
         logger.info(f"{self.table_id.value}: Concatenating DBF + XBRL dataframes.")
         return pd.concat([processed_dbf, processed_xbrl]).reset_index(drop=True)
@@ -1963,12 +1998,17 @@ class Ferc1AbstractTableTransformer(AbstractTableTransformer):
         """
         df = (
             self.spot_fix_values(df)
-            .pipe(self.normalize_strings)
-            .pipe(self.categorize_strings)
-            .pipe(self.convert_units)
-            .pipe(self.strip_non_numeric_values)
-            .pipe(self.nullify_outliers)
-            .pipe(self.replace_with_na)
+            .pipe(
+                self.transform_columns,
+                steps=[
+                    "normalize_strings",
+                    "categorize_strings",
+                    "convert_units",
+                    "strip_non_numeric_values",
+                    "nullify_outliers",
+                    "replace_with_na",
+                ],
+            )
             .pipe(self.drop_invalid_rows)
             .pipe(PUDL_PACKAGE.encode)
             .pipe(self.merge_xbrl_metadata)
@@ -3801,9 +3841,7 @@ class SmallPlantsTableTransformer(Ferc1AbstractTableTransformer):
         )
         return df
 
-    def _find_note_clumps(
-        self, group: DataFrameGroupBy
-    ) -> tuple[DataFrameGroupBy, pd.DataFrame]:
+    def _find_note_clumps(self, df: pd.DataFrame) -> pd.DataFrame:
         """Find groups of rows likely to be notes.
 
         Once the :func:`_find_possible_header_or_note_rows` function identifies rows
@@ -3811,23 +3849,17 @@ class SmallPlantsTableTransformer(Ferc1AbstractTableTransformer):
         described in the :func:`_label_note_rows` function, notes rows are usually
         adjecent rows with no content.
 
-        This function itentifies instances of two or more adjecent rows where
-        ``possible_header_or_note`` = True. It takes individual utility-year groups as a
-        parameter as opposed to the entire dataset because adjecent rows are only
+        This function identifies clumps of adjecent rows where
+        ``possible_header_or_note`` has the same value. Adjecent rows are only
         meaningful if they are from the same reporting entity in the same year. If we
-        were to run this on the whole dataframe, we would see "note clumps" that are
+        were to ignore the utility-year groups, we would see "note clumps" that are
         actually notes from the end of one utility's report and headers from the
-        beginning of another. For this reason, we run this function from within the
-        :func:`_label_note_rows_group` function.
-
-        The output of this function is not a modified version of the original
-        utility-year group, rather, it is a DataFrame containing information about the
-        nature of the ``possible_header_or_note`` = True rows that is used to determine
-        if that row is a note or not. It also returns the original utility-year-group as
-        groupby objects seperated by each time ``possible_header_or_note`` changes from
-        True to False or vice versa.
+        beginning of another. For this reason, a new clump starts whenever either
+        ``possible_header_or_note`` or the utility-year changes. All the clumps in the
+        table are found at once by comparing each row to the one before it, so the
+        table must already be sorted by utility and year.
 
-        If you pass in the following df:
+        If you pass in the following utility-year:
 
         +-------------------+-------------------------+
         | plant_name_ferc1  | possible_header_or_note |
@@ -3847,51 +3879,58 @@ class SmallPlantsTableTransformer(Ferc1AbstractTableTransformer):
         | (c) project #2852 | True                    |
         +-------------------+-------------------------+
 
-        You will get the following output (in addition to the groupby objects for each
-        clump):
-
-        +----------------+----------------+
-        | header_or_note | rows_per_clump |
-        +================+================+
-        | True           | 1              |
-        +----------------+----------------+
-        | False          | 3              |
-        +----------------+----------------+
-        | True           | 3              |
-        +----------------+----------------+
-
-        This shows each clump of adjecent records where ``possible_header_or_note`` is
-        True or False and how many records are in each clump.
+        You will get the following output:
+
+        +-------+----------------+---------------+---------------+
+        | clump | rows_per_clump | last_in_clump | is_last_clump |
+        +=======+================+===============+===============+
+        | 1     | 1              | True          | False         |
+        +-------+----------------+---------------+---------------+
+        | 2     | 3              | False         | False         |
+        +-------+----------------+---------------+---------------+
+        | 2     | 3              | False         | False         |
+        +-------+----------------+---------------+---------------+
+        | 2     | 3              | True          | False         |
+        +-------+----------------+---------------+---------------+
+        | 3     | 3              | False         | True          |
+        +-------+----------------+---------------+---------------+
+        | 3     | 3              | False         | True          |
+        +-------+----------------+---------------+---------------+
+        | 3     | 3              | True          | True          |
+        +-------+----------------+---------------+---------------+
+
+        This shows which clump of adjecent records each row belongs to, how many
+        records are in that clump, whether the row is the last one in its clump, and
+        whether the clump is the last one in its utility-year.
 
         Params:
-            group: A utility-year grouping of the concatenated FERC XBRL and DBF tables.
+            df: The concatenated FERC XBRL and DBF tables, sorted by utility and year.
                 This table must have been run through the
                 :func:`_find_possible_header_or_note_rows` function and contain the
                 column ``possible_header_or_note``.
 
         Returns:
-            A tuple containing groupby objects for each of the note and non-note clumps
-            and a DataFrame indicating the number of rows in each note or non-note
-            clump.
+            A DataFrame with the same index as ``df`` describing the clump that each
+            row belongs to.
         """
-        # Make groups based on consecutive sections where the group_col is alike.
-        clump_groups = group.groupby(
-            (
-                group["possible_header_or_note"].shift()
-                != group["possible_header_or_note"]
-            ).cumsum(),
-            as_index=False,
-        )
-
-        # Identify the first (and only) group_col value for each group and count
-        # how many rows are in each group.
-        clump_groups_df = clump_groups.agg(
-            header_or_note=("possible_header_or_note", "first"),
-            rows_per_clump=("possible_header_or_note", "count"),
+        possible = df["possible_header_or_note"]
+        util_year = df[["utility_id_ferc1", "report_year"]]
+        new_util_year = (util_year != util_year.shift()).any(axis="columns")
+        new_clump = new_util_year | (possible != possible.shift())
+        clump = new_clump.cumsum()
+        last_in_clump = new_clump.shift(-1, fill_value=True)
+        last_in_util_year = new_util_year.shift(-1, fill_value=True)
+        return pd.DataFrame(
+            {
+                "clump": clump,
+                "rows_per_clump": clump.groupby(clump).transform("size"),
+                "last_in_clump": last_in_clump,
+                "is_last_clump": (last_in_clump & last_in_util_year)
+                .groupby(clump)
+                .transform("any"),
+            }
         )
 
-        return clump_groups, clump_groups_df
-
     def _label_header_rows(self, df: pd.DataFrame) -> pd.DataFrame:
         """Label header rows by adding ``header`` to ``row_type`` column.
 
@@ -3976,16 +4015,20 @@ class SmallPlantsTableTransformer(Ferc1AbstractTableTransformer):
 
         return df
 
-    def _label_note_rows_group(
-        self, util_year_group: DataFrameGroupBy
-    ) -> DataFrameGroupBy:
+    def _label_note_rows(self, df: pd.DataFrame) -> pd.DataFrame:
         """Label note rows by adding ``note`` to ``row_type`` column.
 
-        Called within the wraper function :func:`_label_note_rows`
+        The small plants table has lots of note rows that contain useful information.
+        Unfortunately, the notes are in their own row rather than their own column! This
+        means that useful information pertaining to plant rows is floating around as a
+        junk row with no other information except the note in the ``plant_name_ferc1``
+        field. Luckily, the data are reported just like they would be on paper. I.e.,
+        The headers are at the top, and the notes are at the bottom. See the table in
+        :func:`label_row_types` for more detail. This function labels note rows.
 
-        This function breaks the data down by reporting unit (utility and year) and
-        determines whether a ``possible_header_note`` = True row is a note based on two
-        criteria:
+        Note rows are determined by row location within a given report, so we must
+        break the data into reporting units (utility and year). Within each utility-year
+        a ``possible_header_note`` = True row is a note based on two criteria:
 
         - Clumps of 2 or more adjecent rows where ``possible_header_or_note`` is True.
         - Instances where the last row in a utility-year group has
@@ -4001,74 +4044,8 @@ class SmallPlantsTableTransformer(Ferc1AbstractTableTransformer):
         and therefore be categorized as a note clump. I haven't built a work around, but
         hopefully there aren't very many of these.
 
-        Params:
-            util_year_group: A groupby object that contains a single year and utility.
-
-        Returns:
-            The same input but with likely note rows containing the string ``note`` in
-            the ``row_type`` column.
-        """
-        # Create mini groups that count pockets of true and false for each
-        # utility and year. See _find_note_clumps docstring.
-        clump_group, clump_count = self._find_note_clumps(util_year_group)
-
-        # Used later to enable exceptions
-        max_df_val = util_year_group.index.max()
-
-        # Create a list of the index values where there is a note clump! This also
-        # includes instances where the last row in a group is a note.
-        note_clump_idx_list = list(
-            clump_count[
-                (clump_count["header_or_note"])
-                & (
-                    (clump_count["rows_per_clump"] > 1)
-                    | (clump_count.tail(1)["rows_per_clump"] == 1)
-                )
-            ].index
-        )
-        # If there are any clumped/end headers:
-        if note_clump_idx_list:
-            for idx in note_clump_idx_list:
-                # If the last row in a clump looks like a header, and the clump is
-                # not the last clump in the utility_year group, then drop the last
-                # row from the note clump index range because it's a header!
-                note_clump_idx_range = clump_group.groups[idx + 1]
-                not_last_clump = clump_group.groups[idx + 1].max() < max_df_val
-                is_good_header = (
-                    util_year_group.loc[
-                        util_year_group.index.isin(clump_group.groups[idx + 1])
-                    ]
-                    .tail(1)["row_type"]
-                    .str.contains("header")
-                    .all()
-                )
-                if not_last_clump & is_good_header:
-                    note_clump_idx_range = [
-                        x
-                        for x in note_clump_idx_range
-                        if x != note_clump_idx_range.max()
-                    ]
-                # Label the note clump as a note
-                util_year_group.loc[
-                    util_year_group.index.isin(note_clump_idx_range), "row_type"
-                ] = "note"
-
-        return util_year_group
-
-    def _label_note_rows(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Wrapper for :func:`_label_note_rows_group`.
-
-        The small plants table has lots of note rows that contain useful information.
-        Unfortunately, the notes are in their own row rather than their own column! This
-        means that useful information pertaining to plant rows is floating around as a
-        junk row with no other information except the note in the ``plant_name_ferc1``
-        field. Luckily, the data are reported just like they would be on paper. I.e.,
-        The headers are at the top, and the notes are at the bottom. See the table in
-        :func:`label_row_types` for more detail. This function labels note rows.
-
-        Note rows are determined by row location within a given report, so we must break
-        the data into reporting units (utility and year) and then apply note-finding
-        methodology defined in :func:`_label_note_rows_group` to each group.
+        The clumps of all the utility-years are found by :func:`_find_note_clumps` in a
+        single pass over the whole table.
 
         Params:
             df: Pre-processed, concatenated XBRL and DBF data that has been run through
@@ -4076,14 +4053,27 @@ class SmallPlantsTableTransformer(Ferc1AbstractTableTransformer):
             column ``possible_header_or_note``.
 
         Returns:
-            The same input DataFrame but with likely note rows containing the string
-            ``note`` in the ``row_type`` column.
+            The same input DataFrame sorted by utility and year, with likely note rows
+            containing the string ``note`` in the ``row_type`` column.
         """
         logger.info(f"{self.table_id.value}: Labeling notes rows")
-
-        util_groups = df.groupby(["utility_id_ferc1", "report_year"])
-
-        return util_groups.apply(lambda x: self._label_note_rows_group(x))
+        df = df.sort_values(["utility_id_ferc1", "report_year"], kind="stable")
+        clumps = self._find_note_clumps(df)
+
+        # Clumps of more than one possible header or note, and possible headers or
+        # notes at the end of a utility-year, are notes:
+        note_clump = df["possible_header_or_note"] & (
+            (clumps["rows_per_clump"] > 1) | clumps["is_last_clump"]
+        )
+        # If the last row in a clump looks like a header (or hasn't been labeled as
+        # anything else), and the clump is not the last clump in the utility-year
+        # group, then the last row isn't part of the note clump because it's a header!
+        is_good_header = df["row_type"].str.contains("header", na=True)
+        header_after_note = (
+            clumps["last_in_clump"] & ~clumps["is_last_clump"] & is_good_header
+        )
+        df.loc[note_clump & ~header_after_note, "row_type"] = "note"
+        return df
 
     def _label_total_rows(self, df: pd.DataFrame) -> pd.DataFrame:
         """Label total rows by adding ``total`` to ``row_type`` column.
@@ -6088,6 +6078,34 @@ FERC1_TFR_CLASSES: Mapping[str, type[Ferc1AbstractTableTransformer]] = {
 }
 
 
+@asset
+def _core_ferc1_xbrl__table_metadata(
+    _core_ferc1_xbrl__metadata_json: dict[str, dict[str, list[dict[str, Any]]]],
+) -> dict[str, dict[str, pd.DataFrame]]:
+    """Process the XBRL metadata and calculation components of every FERC-1 table.
+
+    Processing the metadata of a table takes much longer than transforming some of the
+    tables, and the metadata is used by each table's transform as well as by the
+    :func:`_core_ferc1_xbrl__metadata` and
+    :func:`_core_ferc1_xbrl__calculation_components` assets, so it's done once here.
+
+    Returns:
+        A dictionary keyed by table name, with the processed ``xbrl_metadata`` and
+        ``xbrl_calculations`` of each table, which can be passed to the table's
+        transformer in place of its raw JSON metadata.
+    """
+    table_metadata = {}
+    for table_name, transformer in FERC1_TFR_CLASSES.items():
+        trans = transformer(
+            xbrl_metadata_json=_core_ferc1_xbrl__metadata_json[table_name]
+        )
+        table_metadata[table_name] = {
+            "xbrl_metadata": trans.xbrl_metadata,
+            "xbrl_calculations": trans.xbrl_calculations,
+        }
+    return table_metadata
+
+
 def ferc1_transform_asset_factory(
     table_name: str,
     tfr_class: Ferc1AbstractTableTransformer,
@@ -6100,6 +6118,12 @@ def ferc1_transform_asset_factory(
     This is a convenient way to create assets for tables that only depend on raw dbf,
     raw xbrl instant and duration tables and xbrl metadata.
 
+    The asset is backed by a graph of three ops, so that the DBF and XBRL years of the
+    table are processed concurrently with each other, and with the other tables. The
+    processed DBF and XBRL data are only unified, transformed, reconciled with the XBRL
+    calculations, and given their final schema once both are available. For more
+    information see: https://docs.dagster.io/concepts/assets/graph-backed-assets.
+
     Args:
         table_name: The name of the table to create an asset for.
         tfr_class: A transformer class cooresponding to the table_name.
@@ -6111,68 +6135,98 @@ def ferc1_transform_asset_factory(
     Return:
         An asset for the clean table.
     """
-    ins: Mapping[str, AssetIn] = {}
-
     listify = lambda x: x if isinstance(x, list) else [x]  # noqa: E731
     dbf_tables = listify(TABLE_NAME_MAP_FERC1[table_name]["dbf"])
     xbrl_tables = listify(TABLE_NAME_MAP_FERC1[table_name]["xbrl"])
 
-    ins = {f"raw_dbf__{tn}": AssetIn(f"raw_ferc1_dbf__{tn}") for tn in dbf_tables}
-    ins |= {
+    dbf_ins = {f"raw_dbf__{tn}": AssetIn(f"raw_ferc1_dbf__{tn}") for tn in dbf_tables}
+    xbrl_ins = {
         f"raw_xbrl_instant__{tn}": AssetIn(f"raw_ferc1_xbrl__{tn}_instant")
         for tn in xbrl_tables
     }
-    ins |= {
+    xbrl_ins |= {
         f"raw_xbrl_duration__{tn}": AssetIn(f"raw_ferc1_xbrl__{tn}_duration")
         for tn in xbrl_tables
     }
-    ins["_core_ferc1_xbrl__metadata_json"] = AssetIn("_core_ferc1_xbrl__metadata_json")
+    # The generic transformers process the XBRL metadata differently than the table's
+    # own transformer, so they need the raw JSON metadata.
+    metadata_in = (
+        "_core_ferc1_xbrl__metadata_json"
+        if generic
+        else "_core_ferc1_xbrl__table_metadata"
+    )
+    ins: Mapping[str, AssetIn] = (
+        dbf_ins | xbrl_ins | {metadata_in: AssetIn(metadata_in)}
+    )
 
     table_id = TableIdFerc1(table_name)
 
-    @asset(name=table_name, ins=ins, io_manager_key=io_manager_key)
-    def ferc1_transform_asset(**kwargs: dict[str, pd.DataFrame]) -> pd.DataFrame:
-        """Transform a FERC Form 1 table.
-
-        Args:
-            raw_dbf: raw dbf table.
-            raw_xbrl_instant: raw XBRL instant table.
-            raw_xbrl_duration: raw XBRL duration table.
-            _core_ferc1_xbrl__metadata_json: XBRL metadata json for all tables.
-
-        Returns:
-            transformed FERC Form 1 table.
-        """
-        # TODO: split the key by __, then groupby, then concatenate
-        _core_ferc1_xbrl__metadata_json = kwargs["_core_ferc1_xbrl__metadata_json"]
+    def make_transformer(
+        table_metadata: dict[str, Any] | None = None,
+    ) -> Ferc1AbstractTableTransformer:
+        """Make the table's transformer, with its XBRL metadata if it's needed."""
+        kwargs = {"table_id": table_id} if generic else {}
+        if table_metadata is None:
+            return tfr_class(**kwargs)
         if generic:
-            transformer = tfr_class(
-                xbrl_metadata_json=_core_ferc1_xbrl__metadata_json[table_name],
-                table_id=table_id,
-            )
-        else:
-            transformer = tfr_class(
-                xbrl_metadata_json=_core_ferc1_xbrl__metadata_json[table_name]
-            )
+            return tfr_class(xbrl_metadata_json=table_metadata[table_name], **kwargs)
+        return tfr_class(**table_metadata[table_name])
 
-        raw_dbf = pd.concat(
-            [df for key, df in kwargs.items() if key.startswith("raw_dbf__")]
-        )
+    @op(name=f"{table_name}__process_dbf", ins={key: In() for key in dbf_ins})
+    def process_dbf(**kwargs: pd.DataFrame) -> pd.DataFrame:
+        """Process the raw DBF years of the table."""
+        return make_transformer().process_dbf(pd.concat(kwargs.values()))
+
+    @op(name=f"{table_name}__process_xbrl", ins={key: In() for key in xbrl_ins})
+    def process_xbrl(**kwargs: pd.DataFrame) -> pd.DataFrame:
+        """Process and merge the raw XBRL instant and duration years of the table."""
         raw_xbrl_instant = pd.concat(
             [df for key, df in kwargs.items() if key.startswith("raw_xbrl_instant__")]
         )
         raw_xbrl_duration = pd.concat(
             [df for key, df in kwargs.items() if key.startswith("raw_xbrl_duration__")]
         )
-        df = transformer.transform(
-            raw_dbf=raw_dbf,
-            raw_xbrl_instant=raw_xbrl_instant,
-            raw_xbrl_duration=raw_xbrl_duration,
+        return make_transformer().process_xbrl(raw_xbrl_instant, raw_xbrl_duration)
+
+    @op(name=f"{table_name}__transform", out=Out(io_manager_key=io_manager_key))
+    def transform(
+        processed_dbf: pd.DataFrame,
+        processed_xbrl: pd.DataFrame,
+        table_metadata: dict[str, Any],
+    ) -> pd.DataFrame:
+        """Unify the processed DBF and XBRL data and finish transforming the table."""
+        transformer = make_transformer(table_metadata)
+        df = (
+            transformer.concat_dbf_xbrl(processed_dbf, processed_xbrl)
+            .pipe(transformer.transform_main)
+            .pipe(transformer.transform_end)
         )
         if convert_dtypes:
             df = convert_cols_dtypes(df, data_source="ferc1")
         return df
 
+    @graph_asset(name=table_name, ins=ins)
+    def ferc1_transform_asset(**kwargs: pd.DataFrame) -> pd.DataFrame:
+        """Transform a FERC Form 1 table.
+
+        Args:
+            raw_dbf: raw dbf table.
+            raw_xbrl_instant: raw XBRL instant table.
+            raw_xbrl_duration: raw XBRL duration table.
+            _core_ferc1_xbrl__metadata_json: XBRL metadata json for all tables. Only
+                used by generic transformers.
+            _core_ferc1_xbrl__table_metadata: processed XBRL metadata and calculation
+                components for all tables.
+
+        Returns:
+            transformed FERC Form 1 table.
+        """
+        return transform(
+            processed_dbf=process_dbf(**{key: kwargs[key] for key in dbf_ins}),
+            processed_xbrl=process_xbrl(**{key: kwargs[key] for key in xbrl_ins}),
+            table_metadata=kwargs[metadata_in],
+        )
+
     return ferc1_transform_asset
 
 
@@ -6264,28 +6318,24 @@ def _core_ferc1__table_dimensions(**kwargs) -> pd.DataFrame:
 
 @asset(
     ins={
-        "_core_ferc1_xbrl__metadata_json": AssetIn("_core_ferc1_xbrl__metadata_json"),
+        "_core_ferc1_xbrl__table_metadata": AssetIn("_core_ferc1_xbrl__table_metadata"),
         "_core_ferc1__table_dimensions": AssetIn("_core_ferc1__table_dimensions"),
     },
     io_manager_key=None,  # Change to sqlite_io_manager...
 )
 def _core_ferc1_xbrl__metadata(**kwargs) -> pd.DataFrame:
     """Build a table of all of the tables' XBRL metadata."""
-    _core_ferc1_xbrl__metadata_json = kwargs["_core_ferc1_xbrl__metadata_json"]
+    _core_ferc1_xbrl__table_metadata = kwargs["_core_ferc1_xbrl__table_metadata"]
     _core_ferc1__table_dimensions = kwargs["_core_ferc1__table_dimensions"]
     tbl_metas = []
-    for table_name, trans in FERC1_TFR_CLASSES.items():
-        tbl_meta = (
-            trans(xbrl_metadata_json=_core_ferc1_xbrl__metadata_json[table_name])
-            .xbrl_metadata[
-                [
-                    "xbrl_factoid",
-                    "xbrl_factoid_original",
-                    "is_within_table_calc",
-                ]
+    for table_name in FERC1_TFR_CLASSES:
+        tbl_meta = _core_ferc1_xbrl__table_metadata[table_name]["xbrl_metadata"][
+            [
+                "xbrl_factoid",
+                "xbrl_factoid_original",
+                "is_within_table_calc",
             ]
-            .assign(table_name=table_name)
-        )
+        ].assign(table_name=table_name)
         tbl_metas.append(tbl_meta)
     dimensions = other_dimensions(table_names=list(FERC1_TFR_CLASSES))
     metadata_all = (
@@ -6303,7 +6353,7 @@ def _core_ferc1_xbrl__metadata(**kwargs) -> pd.DataFrame:
 
 @asset(
     ins={
-        "_core_ferc1_xbrl__metadata_json": AssetIn("_core_ferc1_xbrl__metadata_json"),
+        "_core_ferc1_xbrl__table_metadata": AssetIn("_core_ferc1_xbrl__table_metadata"),
         "_core_ferc1__table_dimensions": AssetIn("_core_ferc1__table_dimensions"),
         "_core_ferc1_xbrl__metadata": AssetIn("_core_ferc1_xbrl__metadata"),
     },
@@ -6311,16 +6361,16 @@ def _core_ferc1_xbrl__metadata(**kwargs) -> pd.DataFrame:
 )
 def _core_ferc1_xbrl__calculation_components(**kwargs) -> pd.DataFrame:
     """Create calculation-component table from table-level metadata."""
-    _core_ferc1_xbrl__metadata_json = kwargs["_core_ferc1_xbrl__metadata_json"]
+    _core_ferc1_xbrl__table_metadata = kwargs["_core_ferc1_xbrl__table_metadata"]
     _core_ferc1__table_dimensions = kwargs["_core_ferc1__table_dimensions"]
     _core_ferc1_xbrl__metadata = kwargs["_core_ferc1_xbrl__metadata"]
     # compile all of the calc comp tables.
-    calc_metas = []
-    for table_name, transformer in FERC1_TFR_CLASSES.items():
-        calc_meta = transformer(
-            xbrl_metadata_json=_core_ferc1_xbrl__metadata_json[table_name]
-        ).xbrl_calculations.convert_dtypes()
-        calc_metas.append(calc_meta)
+    calc_metas = [
+        _core_ferc1_xbrl__table_metadata[table_name][
+            "xbrl_calculations"
+        ].convert_dtypes()
+        for table_name in FERC1_TFR_CLASSES
+    ]
     # squish all of the calc comp tables then add in the implicit table dimensions
     dimensions = other_dimensions(table_names=list(FERC1_TFR_CLASSES))
     calc_components = (
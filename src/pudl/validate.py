@@ -11,6 +11,7 @@ What defines a data validation?
 """
 
 import warnings
+import weakref
 
 import numpy as np
 import pandas as pd
@@ -269,6 +270,49 @@ def check_unique_rows(
     return df
 
 
+def weighted_quantiles(
+    data: pd.Series | np.ndarray,
+    weights: pd.Series | np.ndarray,
+    quantiles: list[float],
+    presorted: bool = False,
+) -> np.ndarray:
+    """Calculate several weighted quantiles of a Series or DataFrame column at once.
+
+    The data is only sorted once, no matter how many quantiles are requested. See
+    :func:`weighted_quantile` for details.
+
+    Args:
+        data: A series containing numeric data.
+        weights: Weights to use in scaling the data. Must have the same length as data.
+        quantiles: Numbers between 0 and 1, representing the quantiles at which we want
+            to find the value of the weighted data.
+        presorted: Whether the data has already been sorted in ascending order.
+
+    Returns:
+        The values in the weighted data corresponding to each of the given quantiles.
+        If there are no values in the data, they are all :mod:`numpy.nan`.
+    """
+    quantiles = np.asarray(quantiles, dtype=float)
+    if ((quantiles < 0) | (quantiles > 1)).any():
+        raise ValueError("quantile must have a value between 0 and 1.")
+    if len(data) != len(weights):
+        raise ValueError("data and weights must have the same length")
+    data = pd.Series(data).to_numpy(dtype=float, na_value=np.nan)
+    weights = pd.Series(weights).to_numpy(dtype=float, na_value=np.nan)
+    valid = np.isfinite(data) & np.isfinite(weights)
+    data, weights = data[valid], weights[valid]
+    # This conditional is necessary because sometimes new columns get
+    # added to the EIA data, and so they won't show up in prior years.
+    if len(data) == 0:
+        return np.full(len(quantiles), np.nan)
+    if not presorted:
+        order = np.argsort(data, kind="stable")
+        data, weights = data[order], weights[order]
+    Sn = np.cumsum(weights)  # noqa: N806
+    Pn = (Sn - 0.5 * weights) / Sn[-1]  # noqa: N806
+    return np.interp(quantiles, Pn, data)
+
+
 def weighted_quantile(data: pd.Series, weights: pd.Series, quantile: float) -> float:
     """Calculate the weighted quantile of a Series or DataFrame column.
 
@@ -289,24 +333,56 @@ def weighted_quantile(data: pd.Series, weights: pd.Series, quantile: float) -> f
         The value in the weighted data corresponding to the given quantile. If there are
         no values in the data, return :mod:`numpy.nan`.
     """
-    if (quantile < 0) or (quantile > 1):
-        raise ValueError("quantile must have a value between 0 and 1.")
-    if len(data) != len(weights):
-        raise ValueError("data and weights must have the same length")
-    df = (
-        pd.DataFrame({"data": data, "weights": weights})
-        .replace([np.inf, -np.inf], np.nan)
-        .dropna()
-        .sort_values(by="data")
-    )
-    Sn = df.weights.cumsum()  # noqa: N806
-    # This conditional is necessary because sometimes new columns get
-    # added to the EIA data, and so they won't show up in prior years.
-    if len(Sn) > 0:
-        Pn = (Sn - 0.5 * df.weights) / Sn.iloc[-1]  # noqa: N806
-        return np.interp(quantile, Pn, df.data)
+    return weighted_quantiles(data, weights, [quantile])[0]
+
+
+def grouped_weighted_quantiles(
+    data: pd.Series | np.ndarray,
+    weights: pd.Series | np.ndarray,
+    groups: pd.Series | np.ndarray,
+    quantiles: list[float],
+    presorted: bool = False,
+) -> pd.DataFrame:
+    """Calculate several weighted quantiles of the data within each group.
+
+    All of the data is sorted by group and value in a single pass, and then the
+    requested quantiles are interpolated from each group's slice of the sorted data.
+    If the data has already been sorted, it only needs to be stably sorted by group.
 
-    return np.nan
+    Args:
+        data: A series containing numeric data.
+        weights: Weights to use in scaling the data. Must have the same length as data.
+        groups: Group labels. Must have the same length as data. Records with null
+            group labels are ignored.
+        quantiles: Numbers between 0 and 1, representing the quantiles at which we want
+            to find the value of the weighted data.
+        presorted: Whether the data has already been sorted in ascending order.
+
+    Returns:
+        A dataframe indexed by group, in order of first appearance, with one column for
+        each of the quantiles.
+    """
+    codes, uniques = pd.factorize(groups)
+    data = pd.Series(data).to_numpy(dtype=float, na_value=np.nan)
+    weights = pd.Series(weights).to_numpy(dtype=float, na_value=np.nan)
+    if not len(data) == len(weights) == len(codes):
+        raise ValueError("data, weights and groups must have the same length")
+    order = np.argsort(codes, kind="stable") if presorted else np.lexsort((data, codes))
+    order = order[codes[order] >= 0]
+    group_starts = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+    return pd.DataFrame(
+        [
+            weighted_quantiles(
+                data[order[start:end]],
+                weights[order[start:end]],
+                quantiles,
+                presorted=True,
+            )
+            for start, end in zip(group_starts, group_starts[1:], strict=False)
+        ],
+        index=uniques,
+        columns=quantiles,
+    )
 
 
 def historical_distribution(
@@ -336,19 +412,56 @@ def historical_distribution(
     if weight_col is None or weight_col == "":
         df["ones"] = 1.0
         weight_col = "ones"
-    report_years = df.report_year.unique()
-    dist = []
-    for year in report_years:
-        dist = dist + [
-            weighted_quantile(
-                df[df.report_year == year][data_col],
-                df[df.report_year == year][weight_col],
-                quantile,
-            )
-        ]
+    dist = grouped_weighted_quantiles(
+        df[data_col], df[weight_col], df["report_year"], [quantile]
+    )[quantile]
     # these values can be NaN, if there were no values in that column for some
     # years in the data:
-    return [d for d in dist if not np.isnan(d)]
+    return dist.dropna().to_list()
+
+
+#: Sort orders of the columns of dataframes being validated, keyed by the ID of the
+#: dataframe and the name of the column. Entries are removed when the dataframe is
+#: garbage collected.
+_SORT_ORDERS: dict[int, dict[str, np.ndarray]] = {}
+
+
+def _sort_order(df: pd.DataFrame, col: str) -> np.ndarray:
+    """Get the positions of the rows of a dataframe sorted by one of its columns.
+
+    Validations often check many different quantiles and subsets of the same column, so
+    the sort order is computed once and shared by all of them. If the column has been
+    modified such that the cached order no longer sorts it, it is recomputed.
+    """
+    values = df[col].to_numpy(dtype=float, na_value=np.nan)
+    if id(df) not in _SORT_ORDERS:
+        _SORT_ORDERS[id(df)] = {}
+        weakref.finalize(df, _SORT_ORDERS.pop, id(df), None)
+    order = _SORT_ORDERS[id(df)].get(col)
+    if order is not None and len(order) == len(values):
+        sorted_values = values[order]
+        sorted_values = sorted_values[np.isfinite(sorted_values)]
+        if (sorted_values[1:] >= sorted_values[:-1]).all():
+            return order
+    order = np.argsort(values, kind="stable")
+    _SORT_ORDERS[id(df)][col] = order
+    return order
+
+
+def _sorted_selection(df: pd.DataFrame, data_col: str, query: str = "") -> np.ndarray:
+    """Get the positions of the records matching a query, sorted by a data column."""
+    order = _sort_order(df, data_col)
+    if query != "":
+        selected = df.eval(query).astype("boolean").fillna(False).to_numpy(dtype=bool)
+        order = order[selected[order]]
+    return order
+
+
+def _weights(df: pd.DataFrame, weight_col: str | None) -> np.ndarray:
+    """Get the weights to use for each record, which default to 1."""
+    if weight_col is None or weight_col == "":
+        return np.ones(len(df))
+    return df[weight_col].to_numpy(dtype=float, na_value=np.nan)
 
 
 def vs_bounds(
@@ -380,15 +493,18 @@ def vs_bounds(
             f"for validation entitled {title}"
         )
 
-    if query != "":
-        df = df.copy().query(query)
     if title != "":
         logger.info(title)
-    if weight_col is None or weight_col == "":
-        df["ones"] = 1.0
-        weight_col = "ones"
-    if low_q >= 0 and low_bool:
-        low_test = weighted_quantile(df[data_col], df[weight_col], low_q)
+    check_low = low_q >= 0 and low_bool
+    check_hi = hi_q <= 1 and hi_bool
+    order = _sorted_selection(df, data_col, query=query)
+    low_test, hi_test = weighted_quantiles(
+        df[data_col].to_numpy(dtype=float, na_value=np.nan)[order],
+        _weights(df, weight_col)[order],
+        [low_q if check_low else 0.0, hi_q if check_hi else 1.0],
+        presorted=True,
+    )
+    if check_low:
         logger.info(f"{data_col} ({low_q:.0%}): {low_test:.6} >= {low_bound:.6}")
         if low_test < low_bound:
             raise ValueError(
@@ -396,8 +512,7 @@ def vs_bounds(
                 f"is below lower bound ({low_bound}) "
                 f"in validation entitled {title}"
             )
-    if hi_q <= 1 and hi_bool:
-        hi_test = weighted_quantile(df[data_col], df[weight_col], hi_q)
+    if check_hi:
         logger.info(f"{data_col} ({hi_q:.0%}): {hi_test:.6} <= {hi_bound:.6}")
         if hi_test > hi_bound:
             raise ValueError(
@@ -443,19 +558,52 @@ def vs_historical(  # noqa: C901
     hi_q=0.95,
     title="",
 ):
-    """Validate aggregated distributions against original data."""
-    if query != "":
-        orig_df = orig_df.copy().query(query)
-        test_df = test_df.copy().query(query)
+    """Validate aggregated distributions against original data.
+
+    The historical distribution of each quantile, and the quantiles of the data being
+    tested, are all computed with a single sort of the data.
+    """
     if title != "":
         logger.info(title)
-    if weight_col is None or weight_col == "":
-        orig_df["ones"] = 1.0
-        test_df["ones"] = 1.0
-        weight_col = "ones"
+    # The same quantile may be used for more than one check, but it only needs to be
+    # computed once, and repeated columns would break the lookups below.
+    quantiles = np.unique([q for q in [low_q, mid_q, hi_q] if q]).tolist()
+
+    orig_order = _sorted_selection(orig_df, data_col, query=query)
+    if "report_year" in orig_df.columns:
+        report_years = orig_df["report_year"].to_numpy()[orig_order]
+    else:
+        report_years = pd.to_datetime(
+            orig_df["report_date"].to_numpy()[orig_order]
+        ).year
+    historical_dists = grouped_weighted_quantiles(
+        orig_df[data_col].to_numpy(dtype=float, na_value=np.nan)[orig_order],
+        _weights(orig_df, weight_col)[orig_order],
+        report_years,
+        quantiles,
+        presorted=True,
+    )
+    # these values can be NaN, if there were no values in that column for some
+    # years in the data:
+    hist_ranges = {q: historical_dists[q].dropna().to_list() for q in quantiles}
+
+    test_order = _sorted_selection(test_df, data_col, query=query)
+    test_values = dict(
+        zip(
+            quantiles,
+            weighted_quantiles(
+                test_df[data_col].to_numpy(dtype=float, na_value=np.nan)[test_order],
+                _weights(test_df, weight_col)[test_order],
+                quantiles,
+                presorted=True,
+            ),
+            strict=True,
+        )
+    )
+
     if low_q:
-        low_range = historical_distribution(orig_df, data_col, weight_col, low_q)
-        low_test = weighted_quantile(test_df[data_col], test_df[weight_col], low_q)
+        low_range = hist_ranges[low_q]
+        low_test = test_values[low_q]
         logger.info(f"{data_col} ({low_q:.0%}): {low_test:.6} >= {min(low_range):.6}")
         if low_test < min(low_range):
             raise ValueError(
@@ -464,8 +612,8 @@ def vs_historical(  # noqa: C901
             )
 
     if mid_q:
-        mid_range = historical_distribution(orig_df, data_col, weight_col, mid_q)
-        mid_test = weighted_quantile(test_df[data_col], test_df[weight_col], mid_q)
+        mid_range = hist_ranges[mid_q]
+        mid_test = test_values[mid_q]
         logger.info(
             f"{data_col} ({mid_q:.0%}): {min(mid_range):.6} <= {mid_test:.6} "
             f"<= {max(mid_range):.6}"
@@ -482,8 +630,8 @@ def vs_historical(  # noqa: C901
             )
 
     if hi_q:
-        hi_range = historical_distribution(orig_df, data_col, weight_col, hi_q)
-        hi_test = weighted_quantile(test_df[data_col], test_df[weight_col], hi_q)
+        hi_range = hist_ranges[hi_q]
+        hi_test = test_values[hi_q]
         logger.info(f"{data_col} ({hi_q:.0%}): {hi_test:.6} <= {max(hi_range):.6}.")
         if hi_test > max(hi_range):
             raise ValueError(
@@ -1,5 +1,6 @@
 """Tools for setting up and managing PUDL workspaces."""
 
+import importlib.metadata
 import os
 from pathlib import Path
 from typing import Self
@@ -77,6 +78,16 @@ class PudlPaths(BaseSettings):
         """Return path to locally stored SQLite DB file."""
         return self.output_dir / f"{name}.sqlite"
 
+    @property
+    def timezone_cache_path(self) -> Path:
+        """Path to the cache of timezones looked up from plant coordinates.
+
+        The timezones depend on the boundary data that comes with timezonefinder, so
+        each version of timezonefinder gets its own cache.
+        """
+        version = importlib.metadata.version("timezonefinder")
+        return self.input_dir / f"timezones-timezonefinder-{version}.parquet"
+
     def output_file(self, filename: str) -> Path:
         """Path to file in PUDL output directory."""
         return self.output_dir / filename
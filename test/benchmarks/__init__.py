@@ -0,0 +1 @@
+"""Performance benchmarks of PUDL's data processing hot paths."""
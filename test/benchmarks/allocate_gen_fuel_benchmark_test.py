@@ -0,0 +1,159 @@
+"""Benchmarks of the allocation of net generation and fuel to generators."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pudl.analysis import allocate_gen_fuel
+from pudl.metadata.fields import apply_pudl_dtypes
+
+
+def synthetic_gen_fuel_tables(n_plants: int, seed: int = 0) -> dict[str, pd.DataFrame]:
+    """Make synthetic annual generator, generation and fuel tables.
+
+    Each plant has two coal fired steam generators, each with its own boiler, which
+    report for 8 years. Both generators report net generation, and the plant's fuel
+    consumption is reported by boiler and by energy source, including some oil used to
+    start up the boilers.
+    """
+    rng = np.random.default_rng(seed)
+    keys = pd.MultiIndex.from_product(
+        [
+            pd.date_range("2015-01-01", periods=8, freq="YS"),
+            np.arange(1, n_plants + 1),
+            ["1", "2"],
+        ],
+        names=["report_date", "plant_id_eia", "generator_id"],
+    ).to_frame(index=False)
+    n_gens = len(keys)
+    gens = keys.assign(
+        prime_mover_code="ST",
+        unit_id_pudl=keys.generator_id.astype(int),
+        capacity_mw=rng.uniform(100, 600, n_gens),
+        fuel_type_count=1,
+        operational_status="existing",
+        generator_retirement_date=pd.NaT,
+        energy_source_code_1="SUB",
+        energy_source_code_2="BIT",
+        planned_energy_source_code_1=pd.NA,
+        startup_source_code_1="DFO",
+    )
+    for col in [f"energy_source_code_{n}" for n in range(3, 8)] + [
+        f"startup_source_code_{n}" for n in range(2, 5)
+    ]:
+        gens[col] = pd.NA
+    gen = keys.assign(net_generation_mwh=rng.uniform(1e5, 3e6, n_gens))
+    bga = keys.assign(boiler_id=keys.generator_id)
+    bf = pd.concat(
+        [
+            bga.assign(energy_source_code=esc, fuel_consumed_mmbtu=fuel)
+            for esc, fuel in [
+                ("DFO", rng.uniform(1e4, 2e4, n_gens)),
+                ("SUB", rng.uniform(1e7, 3e7, n_gens)),
+                ("BIT", rng.uniform(1e6, 3e6, n_gens)),
+            ]
+        ]
+    ).assign(prime_mover_code="ST")[
+        [
+            "report_date",
+            "plant_id_eia",
+            "boiler_id",
+            "energy_source_code",
+            "prime_mover_code",
+            "fuel_consumed_mmbtu",
+        ]
+    ]
+    gf = (
+        bf.groupby(["report_date", "plant_id_eia", "energy_source_code"])
+        .fuel_consumed_mmbtu.sum()
+        .reset_index()
+        .assign(prime_mover_code="ST")
+    )
+    gf["fuel_consumed_for_electricity_mmbtu"] = gf.fuel_consumed_mmbtu
+    gf["net_generation_mwh"] = gf.fuel_consumed_mmbtu / 10
+    tables = {"gf": gf, "bf": bf, "gen": gen, "bga": bga, "gens": gens}
+    return {name: apply_pudl_dtypes(df, group="eia") for name, df in tables.items()}
+
+
+@pytest.mark.parametrize("n_plants", [1_000])
+def test_allocate_gen_fuel_by_generator_energy_source(benchmark, n_plants):
+    """Benchmark allocating net generation and fuel consumption to generators."""
+    tables = synthetic_gen_fuel_tables(n_plants)
+    gf, bf, gen, bga, gens = allocate_gen_fuel.select_input_data(**tables)
+    allocated = benchmark.throughput(
+        len(gf),
+        allocate_gen_fuel.allocate_gen_fuel_by_generator_energy_source,
+        gf=gf,
+        bf=bf,
+        gen=gen,
+        bga=bga,
+        gens=gens,
+        freq="YS",
+    )
+    assert np.isclose(
+        allocated.fuel_consumed_mmbtu.sum(), tables["gf"].fuel_consumed_mmbtu.sum()
+    )
+
+
+@pytest.mark.parametrize("n_plants", [5_000])
+def test_allocate_by_gen_esc(benchmark, n_plants):
+    """Benchmark calculating the allocation fractions of associated generators."""
+    tables = synthetic_gen_fuel_tables(n_plants)
+    gf, bf, gen, bga, gens = allocate_gen_fuel.select_input_data(**tables)
+    bf, gens, gen = allocate_gen_fuel.standardize_input_frequency(bf, gens, gen, "YS")
+    gens = allocate_gen_fuel.add_missing_energy_source_codes_to_gens(gens, gf, bf)
+    gen_assoc = allocate_gen_fuel.associate_generator_tables(
+        gens=gens, gf=gf, gen=gen, bf=bf, bga=bga
+    )
+    # Some generators don't report their net generation, so that all three kinds of
+    # generators are allocated.
+    gen_assoc.loc[
+        gen_assoc.generator_id.eq("2") & gen_assoc.plant_id_eia.lt(n_plants // 2),
+        "net_generation_mwh_g_tbl",
+    ] = np.nan
+    gen_assoc.loc[
+        gen_assoc.plant_id_eia.lt(n_plants // 4), "net_generation_mwh_g_tbl"
+    ] = np.nan
+
+    def allocate(gen_assoc: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+        gen_pm_fuel = allocate_gen_fuel.prep_alloction_fraction(gen_assoc)
+        return (
+            allocate_gen_fuel.allocate_gen_fuel_by_gen_esc(gen_pm_fuel),
+            allocate_gen_fuel.allocate_fuel_by_gen_esc(gen_pm_fuel),
+        )
+
+    net_gen_alloc, fuel_alloc = benchmark.throughput(
+        len(gen_assoc), allocate, gen_assoc
+    )
+    assert set(net_gen_alloc.net_gen_alloc_cat) == {"all_gen", "some_gen", "gf_only"}
+    assert len(fuel_alloc) == len(gen_assoc)
+
+
+@pytest.mark.parametrize("n_plants", [5_000])
+def test_distribute_annually_reported_data_to_months(benchmark, n_plants):
+    """Benchmark distributing the annually reported net generation to months."""
+    gen = (
+        synthetic_gen_fuel_tables(n_plants)["gen"]
+        .merge(pd.DataFrame({"month": np.arange(12)}), how="cross")
+        .assign(
+            report_date=lambda x: (
+                x.report_date.to_numpy().astype("datetime64[M]") + x.month.to_numpy()
+            ).astype("datetime64[ns]")
+        )
+    )
+    # every 10th plant only reports its net generation in December
+    gen.loc[gen.plant_id_eia.mod(10).eq(0) & gen.month.ne(11), "net_generation_mwh"] = (
+        np.nan
+    )
+    gen = gen.drop(columns="month").pipe(apply_pudl_dtypes, group="eia")
+
+    gen_monthly = benchmark.throughput(
+        len(gen),
+        allocate_gen_fuel.distribute_annually_reported_data_to_months_if_annual,
+        df=gen,
+        key_columns=["plant_id_eia", "generator_id", "report_date"],
+        data_column_name="net_generation_mwh",
+        freq="MS",
+    )
+    assert len(gen_monthly) == len(gen)
+    assert gen_monthly.net_generation_mwh.notnull().all()
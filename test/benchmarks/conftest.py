@@ -0,0 +1,105 @@
+"""PyTest configuration for the PUDL performance benchmarks.
+
+The benchmarks run offline on synthetic data, and record the wall time and the peak
+memory allocated by each benchmarked function, as well as its throughput when it
+processes a known number of rows. Use ``--benchmark-json`` to save the measurements,
+and ``devtools/compare_benchmarks.py`` to compare them against the baselines stored in
+``test/benchmarks/baselines.json``.
+"""
+
+import json
+import logging
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+logger = logging.getLogger(__name__)
+
+
+def pytest_addoption(parser):
+    """Add an option for saving the benchmark results."""
+    parser.addoption(
+        "--benchmark-json",
+        action="store",
+        default=None,
+        help="Path to a JSON file in which to save the benchmark measurements.",
+    )
+
+
+@pytest.fixture(scope="session")
+def benchmark_results(request) -> list[dict[str, Any]]:
+    """Collect the measurements of all benchmarks, and save them at the end."""
+    results: list[dict[str, Any]] = []
+    yield results
+    json_path = request.config.getoption("--benchmark-json")
+    if json_path:
+        Path(json_path).write_text(json.dumps(results, indent=2))
+        logger.info(f"Saved {len(results)} benchmark measurements to {json_path}")
+
+
+class Benchmark:
+    """Run a function, measuring its wall time and peak memory allocation.
+
+    Tracing memory allocations slows Python down considerably, so the function is run
+    twice: once to measure its wall time and once to measure its peak memory
+    allocation.
+    """
+
+    def __init__(self, name: str, results: list[dict[str, Any]]):
+        """Record measurements under the given name in the list of results."""
+        self.name = name
+        self.results = results
+
+    def __call__(self, func: Callable, *args, **kwargs) -> Any:
+        """Benchmark a function, returning whatever it returns."""
+        return self._measure(None, func, *args, **kwargs)
+
+    def throughput(self, n_rows: int, func: Callable, *args, **kwargs) -> Any:
+        """Benchmark a function that processes ``n_rows`` rows of data.
+
+        In addition to the wall time and peak memory, the number of rows processed per
+        second is recorded.
+        """
+        return self._measure(n_rows, func, *args, **kwargs)
+
+    def _measure(self, n_rows: int | None, func: Callable, *args, **kwargs) -> Any:
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        wall_time = time.perf_counter() - start
+
+        tracemalloc.start()
+        try:
+            func(*args, **kwargs)
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        measurement = {
+            "name": self.name,
+            "wall_time_s": wall_time,
+            "peak_memory_mb": peak_memory / 2**20,
+        }
+        message = (
+            f"{self.name}: {wall_time:.3f} s, "
+            f"{measurement['peak_memory_mb']:.1f} MB peak memory"
+        )
+        if n_rows is not None:
+            measurement |= {"rows": n_rows, "rows_per_s": n_rows / wall_time}
+            message += f", {measurement['rows_per_s']:,.0f} rows/s"
+        logger.info(message)
+        self.results.append(measurement)
+        return result
+
+
+@pytest.fixture
+def benchmark(request, benchmark_results) -> Benchmark:
+    """Measure the performance of functions called within a benchmark test.
+
+    Call the fixture with the function to benchmark and its arguments, or use
+    :meth:`Benchmark.throughput` to also record the rate at which rows are processed.
+    Either way it returns whatever the benchmarked function returns.
+    """
+    return Benchmark(request.node.name, benchmark_results)
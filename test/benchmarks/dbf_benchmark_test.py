@@ -0,0 +1,122 @@
+"""Benchmarks of parsing the FERC FoxPro (DBF) databases."""
+
+import io
+import struct
+import zipfile
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from pudl.extract.dbf import FercDbfArchive, FercFieldParser
+
+FUEL_FIELDS = [
+    # (long name, DBF name, DBF type, width, decimal places)
+    ("respondent_id", "RESPONDENT", "N", 5, 0),
+    ("report_year", "REPORT_YEA", "N", 4, 0),
+    ("spplmnt_num", "SPPLMNT_NU", "N", 3, 0),
+    ("row_number", "ROW_NUMBER", "N", 3, 0),
+    ("row_seq", "ROW_SEQ", "N", 3, 0),
+    ("row_prvlg", "ROW_PRVLG", "C", 1, 0),
+    ("plant_name", "PLANT_NAME", "C", 35, 0),
+    ("fuel", "FUEL", "C", 15, 0),
+    ("fuel_unit", "FUEL_UNIT", "C", 15, 0),
+    ("fuel_quantity", "FUEL_QUANT", "N", 16, 2),
+    ("fuel_avg_heat", "FUEL_AVG_H", "N", 16, 3),
+    ("fuel_cost_delvd", "FUEL_COST_", "N", 16, 3),
+    ("fuel_generaton", "FUEL_GENER", "N", 16, 3),
+]
+
+
+def dbf_bytes(fields: list[tuple[str, str, int, int]], records: list[list]) -> bytes:
+    """Encode records as a minimal dBase III table with the given fields.
+
+    Args:
+        fields: the name, type, width and number of decimal places of each field.
+        records: rows of values, already formatted as strings.
+    """
+    header_length = 32 + 32 * len(fields) + 1
+    record_length = 1 + sum(width for _, _, width, _ in fields)
+    out = io.BytesIO()
+    out.write(
+        struct.pack(
+            "<BBBBIHH20x", 3, 120, 1, 1, len(records), header_length, record_length
+        )
+    )
+    for name, kind, width, decimals in fields:
+        out.write(
+            struct.pack("<11sc4xBB14x", name.encode(), kind.encode(), width, decimals)
+        )
+    out.write(b"\r")
+    for record in records:
+        out.write(b" ")
+        for value, (_, kind, width, _) in zip(record, fields, strict=True):
+            text = value.rjust(width) if kind == "N" else value.ljust(width)
+            out.write(text.encode("latin1")[:width])
+    out.write(b"\x1a")
+    return out.getvalue()
+
+
+def synthetic_dbf_archive(n_rows: int, seed: int = 0) -> FercDbfArchive:
+    """Make a synthetic FERC Form 1 DBF archive containing only the fuel table.
+
+    The archive contains the DBC file describing the database schema, and one DBF file
+    with ``n_rows`` records, some of which contain the bad numeric values found in the
+    FERC data.
+    """
+    rng = np.random.default_rng(seed)
+    dbc_fields = [
+        ("OBJECTID", "N", 10, 0),
+        ("PARENTID", "N", 10, 0),
+        ("OBJECTNAME", "C", 128, 0),
+        ("OBJECTTYPE", "C", 10, 0),
+    ]
+    dbc_records = [["1", "0", "f1_fuel", "Table"]] + [
+        [str(i + 2), "1", long_name, "Field"]
+        for i, (long_name, *_) in enumerate(FUEL_FIELDS)
+    ]
+    quantities = rng.uniform(0, 1e6, (n_rows, 4))
+    bad_values = rng.choice(["", ".", "000123.45", "*"], n_rows)
+    records = [
+        [
+            str(row % 200 + 1),
+            "2019",
+            "0",
+            str(row % 15 + 1),
+            str(row % 7 + 1),
+            "",
+            f"Plant {row % 1000}",
+            ["coal", "gas", "oil", "nuclear"][row % 4],
+            ["ton", "mcf", "bbl", "mmbtu"][row % 4],
+            bad_values[row] if row % 20 == 0 else f"{quantities[row, 0]:.2f}",
+            f"{quantities[row, 1]:.3f}",
+            f"{quantities[row, 2]:.3f}",
+            f"{quantities[row, 3]:.3f}",
+        ]
+        for row in range(n_rows)
+    ]
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, mode="w") as zf:
+        zf.writestr(
+            "FORMSADMIN/FORM1/working/F1_PUB.DBC", dbf_bytes(dbc_fields, dbc_records)
+        )
+        zf.writestr(
+            "FORMSADMIN/FORM1/working/F1_31.DBF",
+            dbf_bytes([field[1:] for field in FUEL_FIELDS], records),
+        )
+    return FercDbfArchive(
+        zipfile.ZipFile(archive),
+        dbc_path=Path("FORMSADMIN/FORM1/working/F1_PUB.DBC"),
+        table_file_map={"f1_fuel": "F1_31.DBF"},
+        partition={"year": 2019},
+        field_parser=FercFieldParser,
+    )
+
+
+@pytest.mark.parametrize("n_rows", [20_000])
+def test_dbf_load_table(benchmark, n_rows):
+    """Benchmark parsing a FERC Form 1 DBF table into a dataframe."""
+    archive = synthetic_dbf_archive(n_rows)
+    df = benchmark.throughput(n_rows, archive.load_table, "f1_fuel")
+    assert df.shape == (n_rows, len(FUEL_FIELDS))
+    assert list(df.columns) == [long_name for long_name, *_ in FUEL_FIELDS]
@@ -0,0 +1,71 @@
+"""Benchmarks of the EIA entity harvesting."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pudl.metadata.resources import ENTITIES
+from pudl.settings import EiaSettings
+from pudl.transform.eia import EiaEntity, harvest_entity_tables
+
+
+def synthetic_utility_tables(
+    n_utilities: int, seed: int = 0
+) -> dict[str, pd.DataFrame]:
+    """Make two synthetic annual tables reporting the attributes of EIA utilities.
+
+    Every utility reports all of its harvested attributes in both tables for 10 years,
+    and 2% of the reported values disagree with the others.
+    """
+    rng = np.random.default_rng(seed)
+    years = pd.date_range("2013-01-01", periods=10, freq="YS")
+    entity = ENTITIES["utilities"]
+    utility_ids = np.repeat(np.arange(1, n_utilities + 1), len(years))
+    n_rows = len(utility_ids)
+
+    def table() -> pd.DataFrame:
+        df = pd.DataFrame(
+            {"utility_id_eia": utility_ids, "report_date": np.tile(years, n_utilities)}
+        )
+        for col in entity["static_cols"] + entity["annual_cols"]:
+            noise = rng.uniform(size=n_rows) < 0.02
+            if col.startswith("plants_reported"):
+                values = np.where(noise, utility_ids % 2 == 0, utility_ids % 2 == 1)
+            elif col in ("zip_code", "zip_code_4"):
+                width = 5 if col == "zip_code" else 4
+                values = [
+                    f"{uid + bad:0{width}d}"[-width:]
+                    for uid, bad in zip(utility_ids, noise, strict=True)
+                ]
+            elif col == "state":
+                values = np.where(noise, "CO", "TX")
+            elif col == "data_maturity":
+                values = "final"
+            else:
+                values = [
+                    f"{col} {uid}{' alt' if bad else ''}"
+                    for uid, bad in zip(utility_ids, noise, strict=True)
+                ]
+            df[col] = values
+        return df
+
+    return {
+        "core_eia860__scd_utilities": table(),
+        "core_eia861__yearly_utility_data_misc": table(),
+    }
+
+
+@pytest.mark.parametrize("n_utilities", [2_000])
+def test_harvest_entity_tables(benchmark, n_utilities):
+    """Benchmark harvesting the utility entity tables."""
+    clean_dfs = synthetic_utility_tables(n_utilities)
+    n_rows = sum(len(df) for df in clean_dfs.values())
+    entity_df, annual_df, _ = benchmark.throughput(
+        n_rows,
+        harvest_entity_tables,
+        EiaEntity.UTILITIES,
+        clean_dfs,
+        eia_settings=EiaSettings(),
+    )
+    assert len(entity_df) == n_utilities
+    assert len(annual_df) == n_utilities * 10
@@ -0,0 +1,118 @@
+"""Benchmarks of the EPA CEMS hourly emissions transformation."""
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+import pudl.output.epacems
+import pudl.transform.epacems
+from pudl.extract.epacems import API_DTYPE_DICT, API_RENAME_DICT
+from pudl.metadata.classes import Resource
+
+
+def synthetic_epacems(
+    n_rows: int, seed: int = 0
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """Make a quarter of synthetic raw CEMS data, and the tables used to transform it.
+
+    Each emissions unit reports every hour of the first quarter of 2022, so the number
+    of rows is rounded to a whole number of units. Half of the unit IDs have leading
+    zeroes, and 5% of the plants have a different EIA plant ID in the crosswalk.
+
+    Returns:
+        The raw CEMS data, the EPA-EIA crosswalk and the EIA plants entity table.
+    """
+    rng = np.random.default_rng(seed)
+    hours = pd.date_range("2022-01-01", "2022-03-31 23:00", freq="h")
+    n_units = max(1, n_rows // len(hours))
+    n_plants = max(1, n_units // 3)
+    unit_plants = rng.integers(1, n_plants + 1, n_units)
+    unit_ids = np.array([f"{i % 5}{i}" for i in range(n_units)], dtype=object)
+    n_rows = n_units * len(hours)
+    dtypes = {API_RENAME_DICT[col]: dtype for col, dtype in API_DTYPE_DICT.items()}
+    raw = pd.DataFrame(
+        {
+            "state": rng.choice(["CO", "TX", "NY", "CA"], n_units)[
+                np.repeat(np.arange(n_units), len(hours))
+            ],
+            "plant_id_epa": np.repeat(unit_plants, len(hours)),
+            "emissions_unit_id_epa": np.repeat(unit_ids, len(hours)),
+            "op_date": np.tile(hours.normalize().strftime("%Y-%m-%d"), n_units),
+            "op_hour": np.tile(hours.hour, n_units),
+            "operating_time_hours": rng.uniform(0, 1, n_rows),
+            "gross_load_mw": rng.uniform(0, 2100, n_rows),
+            "steam_load_1000_lbs": rng.uniform(0, 100, n_rows),
+            "so2_mass_lbs": rng.uniform(0, 1000, n_rows),
+            "so2_mass_measurement_code": rng.choice(["Measured", "Calculated"], n_rows),
+            "nox_mass_lbs": rng.uniform(0, 1000, n_rows),
+            "nox_mass_measurement_code": rng.choice(["Measured", "Calculated"], n_rows),
+            "co2_mass_tons": rng.uniform(0, 1000, n_rows),
+            "co2_mass_measurement_code": rng.choice(["Measured", "Calculated"], n_rows),
+            "heat_content_mmbtu": rng.uniform(0, 10000, n_rows),
+        }
+    )
+    raw = raw.astype({col: dtypes[col] for col in raw.columns}).assign(year=2022)
+    plant_ids_eia = np.where(
+        rng.uniform(size=n_plants) < 0.05,
+        np.arange(1, n_plants + 1) + 100_000,
+        np.arange(1, n_plants + 1),
+    )
+    crosswalk = pd.DataFrame(
+        {
+            "plant_id_epa": unit_plants,
+            "emissions_unit_id_epa": [unit_id.lstrip("0") for unit_id in unit_ids],
+            "plant_id_eia": plant_ids_eia[unit_plants - 1],
+        }
+    )
+    plants = pd.DataFrame(
+        {
+            "plant_id_eia": np.concatenate(
+                [np.arange(1, n_plants + 1), np.arange(1, n_plants + 1) + 100_000]
+            ),
+            "timezone": rng.choice(
+                ["America/Denver", "America/Chicago", "America/New_York"],
+                2 * n_plants,
+            ),
+        }
+    )
+    return raw, crosswalk, plants
+
+
+@pytest.mark.parametrize("n_rows", [1_000_000])
+def test_epacems_transform(benchmark, n_rows):
+    """Benchmark transforming a million rows of raw CEMS data."""
+    raw, crosswalk, plants = synthetic_epacems(n_rows)
+    cems = benchmark.throughput(
+        len(raw), pudl.transform.epacems.transform, raw, crosswalk, plants
+    )
+    assert len(cems) == len(raw)
+    assert cems.operating_datetime_utc.notna().all()
+
+
+@pytest.mark.parametrize("n_rows", [1_000_000])
+def test_read_epacems_plants(benchmark, tmp_path, n_rows):
+    """Benchmark reading a few plants from a million rows of CEMS data."""
+    raw, crosswalk, plants = synthetic_epacems(n_rows)
+    cems = pudl.transform.epacems.transform(raw, crosswalk, plants)
+    schema = Resource.from_id("core_epacems__hourly_emissions").to_pyarrow()
+    path = tmp_path / "core_epacems__hourly_emissions.parquet"
+    # Write sorted row groups of about 20,000 rows, like the consolidated outputs
+    pq.write_table(
+        pa.Table.from_pandas(
+            cems.sort_values(["state", "plant_id_eia", "operating_datetime_utc"]),
+            schema=schema,
+            preserve_index=False,
+        ),
+        path,
+        row_group_size=20_000,
+    )
+    pudl.output.epacems.write_row_group_index(path)
+
+    plant_ids = cems.plant_id_eia.drop_duplicates().sample(3, random_state=0)
+    subset = benchmark(
+        pudl.output.epacems.read_epacems, plant_ids=plant_ids, epacems_path=path
+    )
+    assert set(subset.plant_id_eia) == set(plant_ids)
+    assert len(subset) == cems.plant_id_eia.isin(plant_ids).sum()
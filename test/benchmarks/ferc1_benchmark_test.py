@@ -0,0 +1,136 @@
+"""Benchmarks of the generic FERC Form 1 table transformations."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pudl.transform.classes import InvalidRows, correct_units, drop_invalid_rows
+from pudl.transform.ferc1 import (
+    Ferc1AbstractTableTransformer,
+    SmallPlantsTableTransformer,
+    TableIdFerc1,
+)
+
+COLUMN_TRANSFORM_STEPS = [
+    "normalize_strings",
+    "categorize_strings",
+    "convert_units",
+    "strip_non_numeric_values",
+    "nullify_outliers",
+    "replace_with_na",
+]
+
+
+class SteamPlantsTransformer(Ferc1AbstractTableTransformer):
+    """Transform steam plants with their own parameters, without XBRL metadata."""
+
+    table_id = TableIdFerc1.STEAM_PLANTS
+
+
+class SteamPlantsFuelTransformer(Ferc1AbstractTableTransformer):
+    """Transform steam plant fuels with their own parameters, without XBRL metadata."""
+
+    table_id = TableIdFerc1.STEAM_PLANTS_FUEL
+
+
+def synthetic_steam_plants(
+    transformer: Ferc1AbstractTableTransformer, n_rows: int, seed: int = 0
+) -> pd.DataFrame:
+    """Make a wide table of steam plants with all the columns that get transformed.
+
+    Categorized columns contain values from their categories, the other string columns
+    contain messy strings, and the remaining columns contain random numbers.
+    """
+    rng = np.random.default_rng(seed)
+    params = transformer.params
+    df = pd.DataFrame({f"other_{i}": rng.uniform(size=n_rows) for i in range(40)})
+    for col in params.normalize_strings:
+        df[col] = rng.choice(["Big  Plant ", "plänt #2", "UNIT 3"], n_rows)
+    for col, categories in params.categorize_strings.items():
+        values = sorted(set().union(*categories.categories.values()))
+        df[col] = rng.choice(values, n_rows)
+    for col in params.convert_units:
+        df[col] = rng.uniform(0, 1e6, n_rows)
+    for col in params.nullify_outliers:
+        df[col] = rng.integers(1800, 2100, n_rows)
+    for col in params.strip_non_numeric_values:
+        df[col] = pd.Series(rng.integers(1, 999, n_rows)).astype(str) + " mw"
+    return df
+
+
+@pytest.mark.parametrize("n_rows", [200_000])
+def test_ferc1_transform_columns(benchmark, n_rows):
+    """Benchmark the compiled column transforms of the steam plants table."""
+    transformer = SteamPlantsTransformer()
+    df = synthetic_steam_plants(transformer, n_rows)
+    transformed = benchmark.throughput(
+        n_rows, transformer.transform_columns, df, steps=COLUMN_TRANSFORM_STEPS
+    )
+    assert len(transformed) == n_rows
+    assert "net_generation_mwh" in transformed
+
+
+@pytest.mark.parametrize("n_rows", [1_000_000])
+def test_drop_invalid_rows(benchmark, n_rows):
+    """Benchmark dropping rows with only missing, zero or empty values."""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            f"value_{i}": np.where(rng.uniform(size=n_rows) < 0.7, np.nan, 1.0)
+            for i in range(8)
+        }
+    ).assign(
+        name=pd.Series(rng.choice(["", "plant", None], n_rows), dtype="string"),
+        note=rng.choice(["", "none", "note"], n_rows).astype(object),
+    )
+    params = InvalidRows(
+        invalid_values=[0, "0", pd.NA, np.nan, "", "none"],
+        required_valid_cols=list(df.columns),
+    )
+    valid = benchmark.throughput(n_rows, drop_invalid_rows, df, params)
+    assert 0 < len(valid) < n_rows
+
+
+@pytest.mark.parametrize("n_rows", [1_000_000])
+def test_correct_units(benchmark, n_rows):
+    """Benchmark the unit corrections of the steam plants fuel table."""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "fuel_type_code_pudl": pd.Series(
+                rng.choice(["coal", "gas", "oil", "nuclear", None], n_rows),
+                dtype="string",
+            ),
+            "fuel_mmbtu_per_unit": np.exp(rng.uniform(-12, 12, n_rows)),
+            "fuel_cost_per_mmbtu": np.exp(rng.uniform(-12, 12, n_rows)),
+        }
+    )
+    transformer = SteamPlantsFuelTransformer()
+    corrected = benchmark.throughput(
+        n_rows, correct_units, df, transformer.params.correct_units
+    )
+    assert (
+        corrected.fuel_mmbtu_per_unit.isna().sum() > df.fuel_mmbtu_per_unit.isna().sum()
+    )
+
+
+@pytest.mark.parametrize("n_rows", [100_000])
+def test_label_small_plants_row_types(benchmark, n_rows):
+    """Benchmark labeling the header, note and total rows of small plants."""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "utility_id_ferc1": rng.integers(1, 200, n_rows),
+            "report_year": rng.integers(1994, 2023, n_rows),
+            "plant_name_ferc1": rng.choice(
+                ["hydro:", "keuka", "total plants", "(a) project #2738"], n_rows
+            ),
+            "net_generation_mwh": np.where(rng.uniform(size=n_rows) < 0.4, np.nan, 1.0),
+        }
+    )
+    transformer = SmallPlantsTableTransformer()
+    # The row types are labeled in place, so each run needs its own copy:
+    labeled = benchmark.throughput(
+        n_rows, lambda: transformer.label_row_types(df.copy())
+    )
+    assert set(labeled.row_type.dropna()) == {"header", "note", "total"}
@@ -0,0 +1,101 @@
+"""Benchmarks of general purpose helper functions."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import pudl
+
+
+@pytest.mark.parametrize("n_boilers", [50_000])
+def test_groupby_agg_sum_na(benchmark, n_boilers):
+    """Benchmark summing monthly boiler fuel consumption by year, propagating NAs."""
+    rng = np.random.default_rng(0)
+    bf = pd.MultiIndex.from_product(
+        [
+            np.arange(n_boilers),
+            pd.date_range("2015-01-01", periods=24, freq="MS"),
+        ],
+        names=["boiler_id", "report_date"],
+    ).to_frame(index=False)
+    for col in ["fuel_consumed_mmbtu", "fuel_consumed_units", "total_ash_content"]:
+        bf[col] = rng.lognormal(10, 2, len(bf))
+        bf.loc[rng.random(len(bf)) < 0.01, col] = np.nan
+    bf["data_maturity"] = "final"
+    gb = bf.set_index(pd.DatetimeIndex(bf.report_date)).groupby(
+        ["boiler_id", pd.Grouper(freq="YS")], observed=True
+    )
+
+    bf_yearly = benchmark.throughput(
+        len(bf),
+        pudl.helpers.groupby_agg,
+        gb,
+        {
+            "fuel_consumed_mmbtu": pudl.helpers.sum_na,
+            "fuel_consumed_units": pudl.helpers.sum_na,
+            "total_ash_content": pudl.helpers.sum_na,
+            "data_maturity": "first",
+        },
+    )
+    assert len(bf_yearly) == 2 * n_boilers
+
+
+def _annual_generators(n_gens: int, n_years: int) -> pd.DataFrame:
+    """Make a table of generators reported annually, like the EIA-860 generators."""
+    rng = np.random.default_rng(0)
+    gens = pd.MultiIndex.from_product(
+        [
+            np.arange(n_gens),
+            pd.date_range("2015-01-01", periods=n_years, freq="YS"),
+        ],
+        names=["generator_id", "report_date"],
+    ).to_frame(index=False)
+    gens["plant_id_eia"] = gens.generator_id // 4
+    gens["generator_id"] = (gens.generator_id % 4).astype(str)
+    gens["capacity_mw"] = rng.lognormal(3, 1, len(gens))
+    return gens
+
+
+@pytest.mark.parametrize("n_gens", [20_000])
+def test_date_merge(benchmark, n_gens):
+    """Benchmark merging annual generator attributes onto monthly generation."""
+    gens = _annual_generators(n_gens, n_years=6)
+    gen = (
+        gens[["plant_id_eia", "generator_id"]]
+        .drop_duplicates()
+        .merge(
+            pd.Series(
+                pd.date_range("2015-01-01", periods=72, freq="MS"), name="report_date"
+            ),
+            how="cross",
+        )
+    )
+    gen["net_generation_mwh"] = 1.0
+
+    out = benchmark.throughput(
+        len(gen),
+        pudl.helpers.date_merge,
+        left=gen,
+        right=gens,
+        on=["plant_id_eia", "generator_id"],
+        date_on=["year"],
+        how="left",
+    )
+    assert len(out) == len(gen)
+    assert out.capacity_mw.notna().all()
+
+
+@pytest.mark.parametrize("n_gens", [20_000])
+def test_expand_timeseries(benchmark, n_gens):
+    """Benchmark filling in monthly records for annually reported generators."""
+    gens = _annual_generators(n_gens, n_years=6)
+
+    out = benchmark.throughput(
+        len(gens),
+        pudl.helpers.expand_timeseries,
+        gens,
+        key_cols=["plant_id_eia", "generator_id"],
+        freq="MS",
+        fill_through_freq="year",
+    )
+    assert len(out) == 12 * len(gens)
@@ -0,0 +1,72 @@
+"""Benchmarks of writing and reading PUDL tables with the IO managers."""
+
+import numpy as np
+import pandas as pd
+import pytest
+import sqlalchemy as sa
+from dagster import AssetKey, build_input_context, build_output_context
+
+from pudl.io_managers import PudlParquetIOManager, PudlSQLiteIOManager
+from pudl.metadata.classes import Package
+
+TABLE_NAME = "core_eia923__monthly_generation"
+
+
+def synthetic_generation(n_rows: int, seed: int = 0) -> pd.DataFrame:
+    """Make a synthetic monthly generator net generation table.
+
+    Each generator reports net generation for 120 consecutive months, so the number of
+    rows is rounded to a whole number of generators.
+    """
+    rng = np.random.default_rng(seed)
+    months = pd.date_range("2013-01-01", periods=120, freq="MS")
+    n_gens = max(1, n_rows // len(months))
+    return pd.DataFrame(
+        {
+            "plant_id_eia": np.repeat(np.arange(n_gens) // 4 + 1, len(months)),
+            "generator_id": np.repeat(
+                (np.arange(n_gens) % 4).astype(str).astype(object), len(months)
+            ),
+            "report_date": np.tile(months, n_gens),
+            "net_generation_mwh": rng.uniform(-10, 1e5, n_gens * len(months)),
+            "data_maturity": "final",
+        }
+    )
+
+
+@pytest.fixture
+def parquet_io_manager(tmp_path, monkeypatch) -> PudlParquetIOManager:
+    """A Parquet IO manager which writes to a temporary directory."""
+    monkeypatch.setenv("PUDL_OUTPUT", str(tmp_path))
+    return PudlParquetIOManager()
+
+
+@pytest.fixture
+def sqlite_io_manager(tmp_path) -> PudlSQLiteIOManager:
+    """A SQLite IO manager with a temporary database containing only one table."""
+    package = Package.from_resource_ids((TABLE_NAME,), resolve_foreign_keys=True)
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'pudl.sqlite'}")
+    package.to_sql().create_all(engine)
+    return PudlSQLiteIOManager(base_dir=tmp_path, db_name="pudl", package=package)
+
+
+@pytest.mark.parametrize("io_manager", ["parquet_io_manager", "sqlite_io_manager"])
+@pytest.mark.parametrize("n_rows", [100_000])
+def test_io_manager_write(benchmark, request, io_manager, n_rows):
+    """Benchmark writing a table with an IO manager."""
+    manager = request.getfixturevalue(io_manager)
+    df = synthetic_generation(n_rows)
+    context = build_output_context(asset_key=AssetKey(TABLE_NAME))
+    benchmark.throughput(len(df), manager.handle_output, context, df)
+
+
+@pytest.mark.parametrize("io_manager", ["parquet_io_manager", "sqlite_io_manager"])
+@pytest.mark.parametrize("n_rows", [100_000])
+def test_io_manager_read(benchmark, request, io_manager, n_rows):
+    """Benchmark reading a table with an IO manager."""
+    manager = request.getfixturevalue(io_manager)
+    df = synthetic_generation(n_rows)
+    manager.handle_output(build_output_context(asset_key=AssetKey(TABLE_NAME)), df)
+    context = build_input_context(asset_key=AssetKey(TABLE_NAME))
+    read_df = benchmark.throughput(len(df), manager.load_input, context)
+    assert len(read_df) == len(df)
@@ -0,0 +1,64 @@
+"""Benchmarks of applying the PUDL metadata to dataframes."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pudl.metadata.classes import Encoder
+from pudl.metadata.fields import apply_pudl_dtypes
+
+
+def synthetic_generation_fuel(n_rows: int, seed: int = 0) -> pd.DataFrame:
+    """Make a synthetic monthly generation fuel table without any PUDL dtypes.
+
+    The columns have the types they would have right after being read from a
+    spreadsheet: numbers as floats, and everything else as python objects.
+    """
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "plant_id_eia": rng.integers(1, 20_000, n_rows).astype(float),
+            "report_date": rng.choice(
+                pd.date_range("2001-01-01", "2022-12-01", freq="MS").astype(str),
+                n_rows,
+            ).astype(object),
+            "prime_mover_code": rng.choice(["ST", "CT", "GT", "PV"], n_rows).astype(
+                object
+            ),
+            "energy_source_code": rng.choice(
+                ["NG", "BIT", "SUB", "SUN"], n_rows
+            ).astype(object),
+            "fuel_type_code_pudl": rng.choice(["gas", "coal", "solar"], n_rows).astype(
+                object
+            ),
+            "fuel_consumed_units": rng.uniform(0, 1e6, n_rows),
+            "fuel_mmbtu_per_unit": rng.uniform(0, 30, n_rows),
+            "fuel_consumed_mmbtu": rng.uniform(0, 1e7, n_rows),
+            "net_generation_mwh": rng.uniform(-10, 1e6, n_rows),
+            "data_maturity": rng.choice(["final", "provisional"], n_rows).astype(
+                object
+            ),
+        }
+    )
+
+
+@pytest.mark.parametrize("n_rows", [500_000])
+def test_apply_pudl_dtypes(benchmark, n_rows):
+    """Benchmark applying the PUDL dtypes to a freshly extracted EIA table."""
+    df = synthetic_generation_fuel(n_rows)
+    typed = benchmark.throughput(n_rows, apply_pudl_dtypes, df, group="eia")
+    assert typed.plant_id_eia.dtype == "Int64"
+    assert pd.api.types.is_datetime64_any_dtype(typed.report_date)
+
+
+@pytest.mark.parametrize("n_rows", [1_000_000])
+def test_encoder_encode(benchmark, n_rows):
+    """Benchmark standardizing a column of energy source codes, with some bad ones."""
+    encoder = Encoder.from_code_id("core_eia__codes_energy_sources")
+    codes = list(encoder.df["code"]) + list(encoder.code_fixes) + [None]
+    col = pd.Series(
+        np.random.default_rng(0).choice(np.array(codes, dtype=object), n_rows),
+        name="energy_source_code",
+    )
+    encoded = benchmark.throughput(n_rows, encoder.encode, col, dtype="string")
+    assert set(encoded.dropna()).issubset(encoder.df["code"])
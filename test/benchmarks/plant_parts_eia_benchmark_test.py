@@ -0,0 +1,109 @@
+"""Benchmarks of the EIA plant parts list construction."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import pudl.helpers
+from pudl.analysis.plant_parts_eia import MakeMegaGenTbl, MakePlantParts
+
+
+def synthetic_generators(
+    n_plants: int, seed: int = 0
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Make a synthetic annual generators table and the ownership of its generators.
+
+    Each plant has between 1 and 7 generators reporting for 4 years, and 20% of the
+    generators have two owners.
+    """
+    rng = np.random.default_rng(seed)
+    acct_map = pudl.helpers.get_eia_ferc_acct_map()
+    gens_per_plant = rng.integers(1, 8, n_plants)
+    plant_ids = np.repeat(np.arange(1, n_plants + 1), gens_per_plant)
+    n_gens = len(plant_ids)
+    techs = acct_map.sample(n_gens, replace=True, random_state=seed)
+    gens = pd.DataFrame(
+        {
+            "plant_id_eia": plant_ids,
+            "generator_id": np.concatenate([np.arange(n) for n in gens_per_plant]),
+            "plant_name_eia": [f"plant {plant_id}" for plant_id in plant_ids],
+            "utility_id_eia": plant_ids % 50 + 1000,
+            "unit_id_pudl": pd.array(rng.integers(1, 3, n_gens), dtype="Int64"),
+            "technology_description": techs.technology_description.to_numpy(),
+            "prime_mover_code": techs.prime_mover_code.to_numpy(),
+            "energy_source_code_1": rng.choice(["NG", "BIT", "SUN", "WND"], n_gens),
+            "fuel_type_code_pudl": rng.choice(["gas", "coal", "solar"], n_gens),
+            "generator_operating_date": pd.to_datetime(
+                rng.choice(["1970-06-01", "1985-01-01", "2015-01-01"], n_gens)
+            ),
+            "planned_generator_retirement_date": pd.to_datetime(
+                rng.choice(["2030-01-01", None], n_gens)
+            ),
+        }
+    ).astype({"generator_id": str})
+    gens = gens.merge(
+        pd.DataFrame(
+            {"report_date": pd.date_range("2018-01-01", "2021-01-01", freq="YS")}
+        ),
+        how="cross",
+    )
+    n_records = len(gens)
+    gens = gens.assign(
+        operational_status=rng.choice(
+            ["existing", "retired", "proposed"], n_records, p=[0.8, 0.1, 0.1]
+        ),
+        generator_retirement_date=pd.to_datetime(
+            rng.choice(["2019-06-01", None, None, None], n_records)
+        ),
+        capacity_mw=rng.uniform(1, 500, n_records),
+        net_generation_mwh=rng.uniform(0, 1e6, n_records),
+        total_fuel_cost=rng.uniform(0, 1e6, n_records),
+        total_mmbtu=rng.uniform(0, 1e7, n_records),
+        fuel_cost_per_mwh=rng.uniform(0, 50, n_records),
+        fuel_cost_per_mmbtu=rng.uniform(0, 5, n_records),
+        unit_heat_rate_mmbtu_per_mwh=rng.uniform(5, 15, n_records),
+    )
+    multi_owned = gens.sample(frac=0.2, random_state=seed)
+    own = pd.concat(
+        [
+            multi_owned.assign(
+                owner_utility_id_eia=multi_owned.utility_id_eia, fraction_owned=0.6
+            ),
+            multi_owned.assign(
+                owner_utility_id_eia=multi_owned.utility_id_eia + 1,
+                fraction_owned=0.4,
+            ),
+        ]
+    )[
+        [
+            "plant_id_eia",
+            "generator_id",
+            "report_date",
+            "utility_id_eia",
+            "owner_utility_id_eia",
+            "fraction_owned",
+        ]
+    ]
+    return gens, own
+
+
+@pytest.mark.parametrize("n_plants", [200])
+def test_make_plant_parts(benchmark, n_plants):
+    """Benchmark building the plant parts list (``out_eia__yearly_plant_parts``)."""
+    gens, own = synthetic_generators(n_plants)
+    gens_mega = MakeMegaGenTbl().execute(gens, own)
+    plants = gens[["plant_id_eia"]].drop_duplicates().assign(plant_id_pudl=1)
+    utils = pd.DataFrame(
+        {
+            "utility_id_eia": np.arange(1000, 1051),
+            "utility_id_pudl": np.arange(51),
+            "utility_name_eia": "utility",
+        }
+    )
+    plant_parts = benchmark(
+        MakePlantParts().execute,
+        gens_mega=gens_mega,
+        plants_eia860=plants,
+        utils_eia860=utils,
+    )
+    assert not plant_parts.empty
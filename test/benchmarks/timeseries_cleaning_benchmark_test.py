@@ -0,0 +1,51 @@
+"""Benchmarks of flagging anomalies in hourly timeseries."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pudl.analysis.timeseries_cleaning import Timeseries
+
+
+def synthetic_hourly_demand(n_series: int, seed: int = 0) -> pd.DataFrame:
+    """Make a year of synthetic hourly electricity demand for several areas.
+
+    Demand follows daily and seasonal cycles with some noise. About 0.1% of the values
+    are replaced with the kinds of anomalies flagged by :meth:`Timeseries.flag_ruggles`:
+    zeroes, huge outliers and runs of identical values.
+    """
+    rng = np.random.default_rng(seed)
+    hours = pd.date_range("2020-01-01", periods=8760, freq="h")
+    t = np.arange(len(hours))[:, None]
+    scale = rng.uniform(100, 10_000, n_series)
+    demand = scale * (
+        1
+        + 0.3 * np.sin(2 * np.pi * t / 24)
+        + 0.2 * np.sin(2 * np.pi * t / 8760)
+        + rng.normal(0, 0.02, (len(hours), n_series))
+    )
+    anomalies = rng.uniform(size=demand.shape) < 0.001
+    demand[anomalies] = (
+        rng.choice([0, 100], anomalies.sum())
+        * np.broadcast_to(scale, demand.shape)[anomalies]
+    )
+    demand[1000:1004] = demand[1000]
+    return pd.DataFrame(demand, index=hours)
+
+
+def flag_ruggles(x: pd.DataFrame) -> Timeseries:
+    """Flag all the anomalies in a timeseries using the Ruggles method."""
+    ts = Timeseries(x)
+    ts.flag_ruggles()
+    return ts
+
+
+@pytest.mark.parametrize("n_series", [20])
+def test_flag_ruggles(benchmark, n_series):
+    """Benchmark flagging anomalies in a year of hourly demand."""
+    demand = synthetic_hourly_demand(n_series)
+    ts = benchmark.throughput(demand.size, flag_ruggles, demand)
+    flags = ts.summarize_flags()
+    assert {"NEGATIVE_OR_ZERO", "IDENTICAL_RUN", "GLOBAL_OUTLIER"}.issubset(
+        flags["flag"]
+    )
@@ -303,6 +303,10 @@ def pudl_io_manager(
                         "config": pudl_datastore_config,
                     },
                 },
+                # Look up every timezone, rather than relying on the local cache.
+                "ops": {
+                    "harvested_plants_eia": {"config": {"cache_timezones": False}},
+                },
             },
         )
     # Grab a connection to the freshly populated PUDL DB, and hand it off.
@@ -0,0 +1,29 @@
+"""Tests for the cross year record linkage utilities."""
+
+import numpy as np
+import pandas as pd
+from sklearn.metrics import pairwise_distances
+
+from pudl.analysis.record_linkage.link_cross_year import (
+    DistanceGraph,
+    PenalizeReportYearDistanceConfig,
+)
+
+
+def test_distance_graph_matches_dense_distances():
+    """The sparse graph holds every close pair of records from different years."""
+    rng = np.random.default_rng(0)
+    features = rng.random((50, 3))
+    df = pd.DataFrame({"report_year": rng.integers(2000, 2005, size=50)})
+    config = PenalizeReportYearDistanceConfig(radius=0.3, block_size=7)
+    distance_graph = DistanceGraph(features, df, config)
+
+    dense = pairwise_distances(features)
+    same_year = df.report_year.to_numpy()[:, None] == df.report_year.to_numpy()
+    dense[same_year] = config.distance_penalty
+    np.fill_diagonal(dense, 0)
+
+    expected = np.where((dense <= config.radius) & ~same_year, dense, 0)
+    np.testing.assert_allclose(distance_graph.graph.toarray(), expected)
+    inds = np.array([3, 10, 42, 7])
+    np.testing.assert_allclose(distance_graph.pairwise(inds), dense[np.ix_(inds, inds)])
@@ -0,0 +1,40 @@
+"""Tests for the company name cleaner."""
+
+import numpy as np
+import pandas as pd
+
+from pudl.analysis.record_linkage.name_cleaner import CompanyNameCleaner
+
+
+def test_get_clean_series_matches_get_clean_data():
+    """Cleaning the unique names gives the same result as cleaning every name."""
+    names = pd.Series(
+        [
+            "The Big Power Co.",
+            "Fox Lake (Unit 1)",
+            None,
+            "The Big Power Co.",
+            "Smith & Jones L.L.C.",
+            np.nan,
+            "Fox Lake (Unit 1)",
+        ],
+        index=[5, 4, 3, 2, 1, 0, 6],
+        name="utility_name",
+    )
+    cleaner = CompanyNameCleaner(legal_term_location=2)
+    clean_names = cleaner.get_clean_series(names)
+    pd.testing.assert_series_equal(
+        clean_names,
+        pd.Series(
+            [cleaner.get_clean_data(name) for name in names],
+            index=names.index,
+            name="utility_name",
+        ),
+    )
+    assert clean_names.dropna().tolist() == [
+        "big power company",
+        "fox lake unit",
+        "big power company",
+        "smith and jones l l c",
+        "fox lake unit",
+    ]
@@ -668,3 +668,29 @@ def test_one_to_many():
         .set_index("record_id_eia")
     )
     pd.testing.assert_frame_equal(one_to_many_df, plant_gen_one_to_many_expected)
+
+
+def test_get_consistent_attributes():
+    """Attributes are only kept when all the generators in a group report them."""
+    gens = pd.DataFrame(
+        {
+            "plant_id_eia": [1, 1, 1, 2, 2, 3],
+            "unit_id_pudl": pd.array([1, 1, 2, 1, 1, None], dtype="Int64"),
+            "prime_mover_code": ["ST", "ST", "GT", "CT", "CA", "ST"],
+            "fuel_type_code_pudl": ["coal", None, "gas", "gas", "gas", "coal"],
+        }
+    )
+    out = pudl.analysis.plant_parts_eia.get_consistent_attributes(
+        gens,
+        base_cols=["plant_id_eia", "unit_id_pudl"],
+        attribute_cols=["prime_mover_code", "fuel_type_code_pudl"],
+    )
+    expected = pd.DataFrame(
+        {
+            "plant_id_eia": [1, 1, 2],
+            "unit_id_pudl": pd.array([1, 2, 1], dtype="Int64"),
+            "prime_mover_code": ["ST", "GT", None],
+            "fuel_type_code_pudl": [None, "gas", "gas"],
+        }
+    )
+    pd.testing.assert_frame_equal(out, expected)
@@ -0,0 +1,97 @@
+"""Unit tests for the opt-in profiling of PUDL assets."""
+
+import pandas as pd
+import pytest
+from click.testing import CliRunner
+from dagster import Definitions, asset, define_asset_job, fs_io_manager
+
+from pudl.etl import profiling
+
+
+@asset(op_tags={"memory-use": "high"})
+def upstream_table() -> pd.DataFrame:
+    return pd.DataFrame({"a": range(10)})
+
+
+@asset
+def downstream_table(upstream_table: pd.DataFrame) -> pd.DataFrame:
+    return upstream_table.assign(b=upstream_table.a * 2).head(5)
+
+
+def _execute_job(tmp_path, enabled: bool):
+    defs = Definitions(
+        assets=[upstream_table, downstream_table],
+        resources={
+            "io_manager": profiling.profiled_io_manager(fs_io_manager),
+            "asset_profiler": profiling.AssetProfiler(
+                enabled=enabled, path=str(tmp_path / "profiles.sqlite")
+            ),
+        },
+        jobs=[define_asset_job("job", hooks={profiling.asset_profiling_hook})],
+    )
+    result = defs.get_job_def("job").execute_in_process(
+        run_config={
+            "resources": {"io_manager": {"config": {"base_dir": str(tmp_path)}}}
+        }
+    )
+    assert result.success
+    return result
+
+
+def test_profiling_disabled(tmp_path):
+    """Nothing is recorded unless profiling is enabled."""
+    _execute_job(tmp_path, enabled=False)
+    assert not (tmp_path / "profiles.sqlite").exists()
+
+
+def test_profiling_records_steps_and_io(tmp_path):
+    """Every step, output and input is profiled, and summarized per step."""
+    result = _execute_job(tmp_path, enabled=True)
+    profiles = profiling.ProfileStore(tmp_path / "profiles.sqlite").read()
+    assert (profiles.run_id == result.run_id).all()
+    assert sorted(
+        zip(profiles.step_key, profiles.asset, profiles.event, strict=True)
+    ) == [
+        ("downstream_table", "downstream_table", "handle_output"),
+        ("downstream_table", "downstream_table", "step"),
+        ("downstream_table", "upstream_table", "load_input"),
+        ("upstream_table", "upstream_table", "handle_output"),
+        ("upstream_table", "upstream_table", "step"),
+    ]
+
+    summary = profiling.summarize_profiles(profiles)
+    assert summary.loc["upstream_table", "output_rows"] == 10
+    assert summary.loc["downstream_table", "input_rows"] == 10
+    assert summary.loc["downstream_table", "output_rows"] == 5
+    assert pd.isna(summary.loc["upstream_table", "input_rows"])
+    assert (summary[["wall_time_s", "cpu_time_s", "peak_rss_mb"]] > 0).all().all()
+    assert profiling.suggest_high_memory_steps(summary, threshold_mb=0) == [
+        "downstream_table",
+        "upstream_table",
+    ]
+    assert profiling.suggest_high_memory_steps(summary, threshold_mb=1e9) == []
+
+    estimates_gb = profiling.estimate_memory_use_gb(profiles)
+    assert set(estimates_gb) == {None, "high"}
+    assert all(estimate_gb > 0 for estimate_gb in estimates_gb.values())
+
+
+@pytest.mark.parametrize("sort_by", ["wall_time_s", "peak_rss_mb"])
+def test_pudl_profile_report(tmp_path, sort_by):
+    """The report ranks the steps of the most recently profiled run."""
+    _execute_job(tmp_path, enabled=True)
+    result = CliRunner().invoke(
+        profiling.pudl_profile_report,
+        [
+            "--profile-path",
+            str(tmp_path / "profiles.sqlite"),
+            "--sort-by",
+            sort_by,
+            "--memory-threshold-mb",
+            "1",
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    assert "upstream_table" in result.output
+    assert "downstream_table" in result.output
+    assert "memory-use: high" in result.output
@@ -24,27 +24,29 @@ def test_file_bytes() -> bytes:
     return test_file
 
 
-@pytest.fixture()
-def elec_txt_dataframe(test_file_bytes) -> pd.DataFrame:
-    """Simulate raw pd.read_json('ELEC.txt')."""
-    buffer = BytesIO(test_file_bytes)
-    df = pd.read_json(buffer, lines=True)
-    return df
+def test__is_fuel_receipts_costs_series(test_file_bytes):
+    """Filter for only the desired data series."""
+    lines = [line for line in test_file_bytes.splitlines() if line.strip()]
+    actual = [bulk._is_fuel_receipts_costs_series(line) for line in lines]
+    # line 0 should be filtered because it is not COST_BTU or RECEIPTS_BTU
+    assert actual == [False, True, True, True, True]
 
 
-def test__filter_for_fuel_receipts_costs_series(elec_txt_dataframe):
-    """Filter for only the desired data series."""
-    input_ = elec_txt_dataframe
-    expected = input_.iloc[
-        1:, :
-    ]  # row 0 should be filtered because it is not COST_BTU or RECEIPTS_BTU
-    actual = bulk._filter_for_fuel_receipts_costs_series(input_)
-    pd.testing.assert_frame_equal(actual, expected)
+def test__parse_periods():
+    """Annual, quarterly and monthly periods are converted to their first day."""
+    actual = bulk._parse_periods(pd.Series(["2020", "2020Q2", "2020Q4", "202004"]))
+    expected = pd.Series(
+        pd.to_datetime(["2020-01-01", "2020-04-01", "2020-10-01", "2020-04-01"])
+    )
+    pd.testing.assert_series_equal(actual, expected)
+    with pytest.raises(ValueError):
+        bulk._parse_periods(pd.Series(["2020", "2020Q5"]))
 
 
-def test__parse_data_column(elec_txt_dataframe):
-    """Convert a pd.Series of python lists to a dataframe."""
-    input_ = elec_txt_dataframe.iloc[[2, 4], :]  # only annual series for easier testing
+def test__read_fuel_receipts_costs_series(test_file_bytes):
+    """Stream the desired series into metadata and a tidy timeseries."""
+    # only annual series for easier testing
+    lines = [test_file_bytes.splitlines()[i] for i in [3, 5]]
     expected = pd.DataFrame(
         {
             "series_id": [
@@ -67,12 +69,14 @@ def test__parse_data_column(elec_txt_dataframe):
             ],
         },
     ).convert_dtypes()
-    expected.loc[:, "series_id"] = expected.loc[:, "series_id"].astype(
-        "category", copy=False
-    )
 
-    actual = bulk._parse_data_column(input_)
+    metadata, actual = bulk._read_fuel_receipts_costs_series(iter(lines))
     pd.testing.assert_frame_equal(actual, expected)
+    assert [series["series_id"] for series in metadata] == [
+        "ELEC.COST_BTU.NG-US-2.A",
+        "ELEC.RECEIPTS_BTU.NG-US-2.A",
+    ]
+    assert all("data" not in series for series in metadata)
 
 
 def test__extract(test_file_bytes):
@@ -1,5 +1,11 @@
 """Tests for xbrl extraction module."""
 
+import json
+import sqlite3
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing
+from pathlib import Path
+
 import pytest
 from dagster import ResourceDefinition, build_op_context
 
@@ -132,6 +138,7 @@ def test_xbrl2sqlite(settings, forms, mocker, tmp_path):
             sql_path=PudlPaths().output_dir / f"ferc{form.value}_xbrl.sqlite",
             batch_size=20,
             workers=10,
+            year_workers=None,
         )
 
 
@@ -197,10 +204,27 @@ def test_xbrl2sqlite_db_exists_yes_clobber(mocker, tmp_path):
     assert not ferc1_sqlite_path.exists()
 
 
-def test_convert_form(mocker):
-    """Test convert_form method is properly calling extractor."""
-    extractor_mock = mocker.MagicMock()
+def _fake_run_main(sql_path, form_number, metadata_path, datapackage_path, **kwargs):
+    """Write a tiny SQLite DB and descriptors like the XBRL extractor would."""
+    year = kwargs["instance_path"].split("_")[1]
+    with closing(sqlite3.connect(sql_path)) as conn:
+        conn.execute("CREATE TABLE filings (year INTEGER, form INTEGER)")
+        conn.execute("INSERT INTO filings VALUES (?, ?)", (int(year), form_number))
+        conn.commit()
+    Path(metadata_path).write_text(json.dumps({"year": year}))
+    Path(datapackage_path).write_text(
+        json.dumps({"resources": [{"name": "filings", "path": str(sql_path)}]})
+    )
+
+
+@pytest.mark.parametrize("year_workers", [1, None])
+def test_convert_form(mocker, tmp_path, year_workers):
+    """Test convert_form method is properly calling extractor and merging years."""
+    extractor_mock = mocker.MagicMock(side_effect=_fake_run_main)
     mocker.patch("pudl.extract.xbrl.run_main", new=extractor_mock)
+    if year_workers is None:
+        # Mocks can't be shared with worker processes, so run them in this one.
+        mocker.patch("pudl.extract.xbrl.ProcessPoolExecutor", new=_InProcessExecutor)
 
     # Create fake datastore class for testing
     class FakeDatastore:
@@ -218,42 +242,116 @@ def test_convert_form(mocker):
         years=[2020, 2021],
     )
 
-    output_path = PudlPaths().pudl_output
+    output_path = tmp_path
 
     # Test convert_form for every form number
     for form in XbrlFormNumber:
+        sql_path = output_path / f"ferc{form.value}_xbrl.sqlite"
         convert_form(
             settings,
             form,
             FakeDatastore(),
             output_path=output_path,
-            sql_path=output_path / f"ferc{form.value}_xbrl.sqlite",
+            sql_path=sql_path,
             batch_size=10,
             workers=5,
+            year_workers=year_workers,
         )
 
-        # Verify extractor is called correctly
-        expected_calls = []
-        for year in settings.years:
-            expected_calls.append(
-                mocker.call(
-                    instance_path=f"filings_{year}_{form.value}",
-                    sql_path=output_path / f"ferc{form.value}_xbrl.sqlite",
-                    clobber=False,
-                    taxonomy=f"raw_archive_{year}_{form.value}",
-                    entry_point=f"taxonomy_entry_point_{year}_{form.value}",
-                    form_number=form.value,
-                    metadata_path=str(
-                        output_path / f"ferc{form.value}_xbrl_taxonomy_metadata.json"
-                    ),
-                    datapackage_path=str(
-                        output_path / f"ferc{form.value}_xbrl_datapackage.json"
-                    ),
-                    workers=5,
-                    batch_size=10,
-                    loglevel="INFO",
-                    logfile=None,
-                )
+        # Verify extractor is called correctly, with a separate DB for each year
+        assert extractor_mock.call_count == len(settings.years)
+        for year, call in zip(
+            settings.years, extractor_mock.call_args_list, strict=True
+        ):
+            kwargs = call.kwargs
+            assert kwargs.pop("sql_path").name == f"ferc{form.value}_xbrl_{year}.sqlite"
+            assert kwargs.pop("metadata_path") != str(
+                output_path / f"ferc{form.value}_xbrl_taxonomy_metadata.json"
             )
-        assert extractor_mock.mock_calls == expected_calls
+            kwargs.pop("datapackage_path")
+            assert kwargs == {
+                "instance_path": f"filings_{year}_{form.value}",
+                "clobber": False,
+                "taxonomy": f"raw_archive_{year}_{form.value}",
+                "entry_point": f"taxonomy_entry_point_{year}_{form.value}",
+                "form_number": form.value,
+                "workers": 5,
+                "batch_size": 10,
+                "loglevel": "INFO",
+                "logfile": None,
+            }
         extractor_mock.reset_mock()
+
+        # The years are merged into a single DB, in order
+        with closing(sqlite3.connect(sql_path)) as conn:
+            rows = conn.execute("SELECT * FROM filings").fetchall()
+        assert rows == [(year, form.value) for year in settings.years]
+        metadata = json.loads(
+            (output_path / f"ferc{form.value}_xbrl_taxonomy_metadata.json").read_text()
+        )
+        assert metadata == {"year": "2021"}
+        datapackage = json.loads(
+            (output_path / f"ferc{form.value}_xbrl_datapackage.json").read_text()
+        )
+        assert datapackage == {
+            "resources": [{"name": "filings", "path": str(sql_path)}]
+        }
+    assert list(output_path.glob("tmp*")) == []
+
+
+def test_convert_form_limits_years_in_memory(mocker, tmp_path):
+    """The archives of a year are only fetched when a process is free to convert it."""
+    in_memory, max_in_memory = set(), []
+
+    def run_main(**kwargs):
+        _fake_run_main(**kwargs)
+        in_memory.remove(kwargs["instance_path"])
+
+    mocker.patch("pudl.extract.xbrl.run_main", new=run_main)
+    # Mocks can't be shared with worker processes, so run them in threads instead.
+    mocker.patch("pudl.extract.xbrl.ProcessPoolExecutor", new=ThreadPoolExecutor)
+
+    class FakeDatastore:
+        def get_taxonomy(self, year, form: XbrlFormNumber):
+            return f"raw_archive_{year}", f"taxonomy_entry_point_{year}"
+
+        def get_filings(self, year, form: XbrlFormNumber):
+            in_memory.add(f"filings_{year}")
+            max_in_memory.append(len(in_memory))
+            return f"filings_{year}"
+
+    years = list(range(2019, 2024))
+    sql_path = tmp_path / "ferc1_xbrl.sqlite"
+    convert_form(
+        FercGenericXbrlToSqliteSettings(
+            taxonomy="https://www.fake.taxonomy.url", years=years
+        ),
+        XbrlFormNumber.FORM1,
+        FakeDatastore(),
+        output_path=tmp_path,
+        sql_path=sql_path,
+        year_workers=2,
+    )
+    assert len(max_in_memory) == len(years)
+    assert max(max_in_memory) <= 2
+    with closing(sqlite3.connect(sql_path)) as conn:
+        rows = conn.execute("SELECT * FROM filings").fetchall()
+    assert rows == [(year, 1) for year in years]
+
+
+class _InProcessExecutor:
+    """Stand-in for a ProcessPoolExecutor that runs everything immediately."""
+
+    def __init__(self, max_workers=None):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def submit(self, fn, **kwargs):
+        future = Future()
+        future.set_result(fn(**kwargs))
+        return future
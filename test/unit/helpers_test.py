@@ -18,11 +18,18 @@ from pudl.helpers import (
     date_merge,
     dedupe_and_drop_nas,
     diff_wide_tables,
+    distribute_annually_reported_data_to_months,
     expand_timeseries,
     fix_eia_na,
     flatten_list,
+    get_dagster_execution_config,
+    get_memory_budget_concurrency_limits,
+    groupby_agg,
+    max_na,
+    min_na,
     remove_leading_zeros_from_numeric_strings,
     standardize_percentages_ratio,
+    sum_na,
     zero_pad_numeric_string,
 )
 from pudl.output.sql.helpers import sql_asset_factory
@@ -281,6 +288,28 @@ def test_same_temporal_gran():
     assert_frame_equal(out, out_expected)
 
 
+def test_date_merge_keeps_key_0_column():
+    """A column named like the keys pandas adds to merges is kept in the output."""
+    out_expected = (
+        MONTHLY_GEN_FUEL.assign(key_0="a")
+        .merge(
+            MONTHLY_OTHER,
+            how="left",
+            on=["report_date", "plant_id_eia"],
+        )
+        .astype({"report_date": "datetime64[ns]"})
+    )
+
+    out = date_merge(
+        left=MONTHLY_GEN_FUEL.assign(key_0="a"),
+        right=MONTHLY_OTHER.copy(),
+        on=["plant_id_eia"],
+        date_on=["year", "month"],
+        how="left",
+    )
+    assert_frame_equal(out, out_expected)
+
+
 def test_end_of_report_period():
     """Test merging tables repeated at the end of the report period."""
     eoy_plants_util = ANNUAL_PLANTS_UTIL.copy()
@@ -419,6 +448,77 @@ def test_timeseries_fillin_through_month(test_dir):
     assert_frame_equal(expected_out, out)
 
 
+@pytest.mark.parametrize(
+    "freq,fill_through_freq",
+    [("MS", "year"), ("MS", "month"), ("QS", "year"), ("YS", "year"), ("D", "month")],
+)
+def test_expand_timeseries_matches_resampling(freq, fill_through_freq):
+    """Filling in timeseries directly gives the same result as resampling."""
+    rng = np.random.default_rng(0)
+    input_df = (
+        pd.DataFrame(
+            {
+                "report_date": pd.to_datetime("2018-01-01")
+                + pd.to_timedelta(rng.integers(0, 1000, 200), unit="D"),
+                "plant_id_eia": rng.integers(0, 10, 200),
+                "generator_id": rng.choice(["1", "2", "GT3"], 200),
+                "operational_status": rng.choice(["existing", "retired"], 200),
+                "capacity_mw": rng.random(200),
+            }
+        )
+        .drop_duplicates(subset=["report_date", "plant_id_eia", "generator_id"])
+        .pipe(apply_pudl_dtypes, group="eia")
+    )
+    input_df.loc[:9, "plant_id_eia"] = pd.NA
+    kwargs = {
+        "key_cols": ["plant_id_eia", "generator_id"],
+        "date_col": "report_date",
+        "freq": freq,
+        "fill_through_freq": fill_through_freq,
+    }
+    assert_frame_equal(
+        expand_timeseries(input_df, **kwargs),
+        pudl.helpers._expand_timeseries_by_resampling(input_df, **kwargs),
+    )
+
+
+def test_distribute_annually_reported_data_to_months():
+    """Annual records are spread over their year, replacing their plant-year."""
+    months = pd.date_range("2020-01-01", periods=12, freq="MS")
+    monthly = np.arange(1.0, 13.0)
+    # generator 1 at plant 1 reports monthly, generator 2 only in December, and
+    # generator 3 reports nothing. Plant 2 reports monthly, but only once, in June.
+    # All of plant 1's records are replaced by generator 2's distributed annual record.
+    input_df = pd.DataFrame(
+        {
+            "plant_id_eia": [1] * 36 + [2] * 12,
+            "generator_id": ["1"] * 12 + ["2"] * 12 + ["3"] * 12 + ["1"] * 12,
+            "report_date": np.tile(months, 4),
+            "net_generation_mwh": np.concatenate(
+                [
+                    monthly,
+                    [np.nan] * 11 + [120.0],
+                    [0.0] * 12,
+                    [0.0] * 5 + [6.0] + [np.nan] * 6,
+                ]
+            ),
+        }
+    ).pipe(apply_pudl_dtypes, group="eia")
+    out = distribute_annually_reported_data_to_months(
+        input_df,
+        key_cols=["plant_id_eia", "generator_id", "report_date"],
+        data_col="net_generation_mwh",
+    )
+    expected = pd.concat(
+        [
+            input_df.iloc[36:],
+            input_df.iloc[12:24].assign(net_generation_mwh=10.0),
+        ],
+        ignore_index=True,
+    )
+    assert_frame_equal(out, expected)
+
+
 def test_convert_to_date():
     """Test automated cleanup of EIA date columns."""
     in_df = pd.DataFrame.from_records(
@@ -787,3 +887,117 @@ def test_standardize_percentages_ratio():
         standardized = standardize_percentages_ratio(
             over_100_df, mixed_cols=["mixed_col"], years_to_standardize=[1995, 1996]
         )
+
+
+def _worst_case_memory_gb(max_concurrent, limits, estimates_gb):
+    """Memory use if the hungriest steps fill every slot they're allowed to."""
+    memory_gb = 0.0
+    free_slots = max_concurrent
+    for limit in sorted(
+        limits, key=lambda lim: estimates_gb[lim["value"]], reverse=True
+    ):
+        steps = min(limit["limit"], free_slots)
+        memory_gb += steps * estimates_gb[limit["value"]]
+        free_slots -= steps
+    return memory_gb + free_slots * estimates_gb[None]
+
+
+@pytest.mark.parametrize(
+    "memory_budget_gb,estimates_gb,max_workers,expected_concurrent,expected_limits",
+    [
+        (64, {None: 1.0, "high": 8.0}, 16, 16, {"high": 6}),
+        (64, {None: 1.0, "high": 8.0}, 100, 57, {"high": 1}),
+        (8, {None: 1.0, "high": 8.0}, 16, 1, {"high": 1}),
+        (32, {None: 2.0, "high": 8.0, "medium": 4.0}, 8, 8, {"high": 2, "medium": 2}),
+        (1024, {None: 1.0, "high": 8.0}, 4, 4, {"high": 4}),
+        (16, {None: 2.0, "low": 1.0}, 4, 4, {"low": 4}),
+    ],
+)
+def test_get_memory_budget_concurrency_limits(
+    memory_budget_gb, estimates_gb, max_workers, expected_concurrent, expected_limits
+):
+    """Concurrency limits keep the worst case memory use within the budget."""
+    max_concurrent, limits = get_memory_budget_concurrency_limits(
+        memory_budget_gb=memory_budget_gb,
+        memory_use_estimates_gb=estimates_gb,
+        max_workers=max_workers,
+    )
+    assert max_concurrent == expected_concurrent
+    assert {lim["value"]: lim["limit"] for lim in limits} == expected_limits
+    assert all(lim["key"] == "memory-use" for lim in limits)
+    assert _worst_case_memory_gb(max_concurrent, limits, estimates_gb) <= (
+        memory_budget_gb
+    )
+
+
+def test_get_memory_budget_concurrency_limits_too_small():
+    """A budget too small to run the hungriest step is an error."""
+    with pytest.raises(ValueError, match="too small"):
+        get_memory_budget_concurrency_limits(
+            memory_budget_gb=6, memory_use_estimates_gb={None: 1.0, "high": 8.0}
+        )
+
+
+def test_get_dagster_execution_config_memory_budget():
+    """A memory budget replaces the memory-use limits but keeps other limits."""
+    config = get_dagster_execution_config(
+        num_workers=16,
+        tag_concurrency_limits=[
+            {"key": "memory-use", "value": "high", "limit": 4},
+            {"key": "datasource", "value": "epacems", "limit": 2},
+        ],
+        memory_budget_gb=64,
+        memory_use_estimates_gb={None: 1.0, "high": 8.0},
+    )
+    assert config["execution"]["config"]["multiprocess"] == {
+        "max_concurrent": 16,
+        "tag_concurrency_limits": [
+            {"key": "datasource", "value": "epacems", "limit": 2},
+            {"key": "memory-use", "value": "high", "limit": 6},
+        ],
+    }
+
+
+@pytest.mark.parametrize(
+    "groupby_kwargs",
+    [
+        {"by": ["plant_id_eia", pd.Grouper(freq="YS")], "observed": True},
+        {"by": ["plant_id_eia", "fuel_type"], "dropna": False, "sort": False},
+        {"by": ["fuel_type"], "observed": False},
+    ],
+)
+def test_groupby_agg(groupby_kwargs):
+    """NA-propagating aggregations are bit-for-bit identical to :meth:`GroupBy.agg`."""
+    rng = np.random.default_rng(0)
+    n = 5_000
+    df = pd.DataFrame(
+        {
+            "report_date": pd.Timestamp("2015-01-01")
+            + pd.to_timedelta(rng.integers(0, 3_000, n), unit="D"),
+            "plant_id_eia": rng.integers(0, 50, n),
+            "fuel_type": pd.Categorical(
+                rng.choice(["coal", "gas", None], n), categories=["coal", "gas", "oil"]
+            ),
+            "fuel_mmbtu": rng.lognormal(3, 4, n),
+            "fuel_units": pd.array(rng.normal(size=n), dtype="Float64"),
+            "n_boilers": rng.integers(1, 10, n),
+            "data_maturity": rng.choice(["final", "provisional"], n),
+        }
+    )
+    df.loc[rng.random(n) < 0.02, ["fuel_mmbtu", "fuel_units"]] = np.nan
+    agg = {
+        "fuel_mmbtu": sum_na,
+        "data_maturity": "first",
+        "fuel_units": sum_na,
+        "n_boilers": sum_na,
+    }
+    min_max_agg = {"fuel_mmbtu": min_na, "n_boilers": max_na}
+    gb = df.set_index(pd.DatetimeIndex(df.report_date)).groupby(**groupby_kwargs)
+    for agg_dict in [agg, min_max_agg]:
+        expected = gb.agg(agg_dict)
+        result = groupby_agg(gb, agg_dict)
+        assert_frame_equal(result, expected, check_exact=True)
+        assert (
+            result.fuel_mmbtu.to_numpy().view("int64")
+            == expected.fuel_mmbtu.to_numpy().view("int64")
+        ).all()
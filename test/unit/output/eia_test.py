@@ -0,0 +1,70 @@
+"""Test helper functions associated with the denormalized EIA outputs."""
+
+import pandas as pd
+
+from pudl.output.eia import assign_unit_ids
+
+# plant_id_eia, generator_id, report_date, prime_mover_code, fuel_type_code_pudl,
+# unit_id_pudl, bga_source, expected unit_id_pudl, expected bga_source
+GENERATORS = [
+    (1, "G1", "2019", "ST", "coal", None, None, 1, "bfill_units"),
+    (1, "G1", "2020", "ST", "coal", 1, "eia860_org", 1, "eia860_org"),
+    (1, "G1", "2021", "ST", "coal", None, None, 1, "ffill_units"),
+    (1, "G2", "2020", "CT", "gas", None, None, 2, "one_ct_one_ca_inferred"),
+    (1, "G3", "2020", "CA", "gas", None, None, 2, "one_ct_one_ca_inferred"),
+    (1, "G2", "2021", "CT", "gas", None, None, 2, "orphan_ct"),
+    (1, "G5", "2021", "IC", "oil", None, None, 4, "single_ic"),
+    (1, "G4", "2020", "GT", "gas", None, None, 3, "single_gt"),
+    (1, "G6", "2020", "ST", "nuclear", None, None, 5, "nuclear_st"),
+    (1, "G7", "2020", "ST", "coal", None, None, 6, "coal_st"),
+    (1, "G8", "2021", "ST", "coal", None, None, 6, "coal_st"),
+    (1, "G9", "2020", "ST", "gas", None, None, None, "inconsistent_gas_st"),
+    (1, "G9", "2021", "ST", "coal", None, None, None, "inconsistent_coal_st"),
+    (1, "G10", "2020", "WT", "wind", None, None, None, None),
+    (2, "G1", "2020", "CA", "gas", None, None, 1, "orphan_ca"),
+    (2, "G2", "2020", "GT", "gas", None, None, 2, "single_gt"),
+    (2, "G3", "2020", "GT", "gas", None, None, 3, "single_gt"),
+]
+
+
+def test_assign_unit_ids():
+    """Each rule assigns new unit IDs in priority order without overlapping."""
+    gens = pd.DataFrame(
+        GENERATORS,
+        columns=[
+            "plant_id_eia",
+            "generator_id",
+            "report_date",
+            "prime_mover_code",
+            "fuel_type_code_pudl",
+            "unit_id_pudl",
+            "bga_source",
+            "expected_unit_id_pudl",
+            "expected_bga_source",
+        ],
+    ).astype(
+        {
+            "report_date": "datetime64[ns]",
+            "prime_mover_code": "string",
+            "fuel_type_code_pudl": "string",
+            "unit_id_pudl": "Int64",
+            "bga_source": "string",
+            "expected_unit_id_pudl": "Int64",
+            "expected_bga_source": "string",
+        }
+    )
+    result = assign_unit_ids(gens)
+
+    # The rows are sorted by generator, and only the unit columns are changed:
+    gens_idx = ["plant_id_eia", "generator_id", "report_date"]
+    expected = gens.set_index(gens_idx).sort_index().reset_index()
+    pd.testing.assert_frame_equal(
+        result.drop(columns=["unit_id_pudl", "bga_source"]),
+        expected.drop(columns=["unit_id_pudl", "bga_source"]),
+    )
+    pd.testing.assert_series_equal(
+        result.unit_id_pudl, expected.expected_unit_id_pudl, check_names=False
+    )
+    pd.testing.assert_series_equal(
+        result.bga_source, expected.expected_bga_source, check_names=False
+    )
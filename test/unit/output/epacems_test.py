@@ -1,10 +1,22 @@
 """Test helper functions associated with the EPA CEMS outputs."""
 
 import logging
+import os
 
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 
-from pudl.output.epacems import year_state_filter
+from pudl.metadata.classes import Resource
+from pudl.metadata.fields import apply_pudl_dtypes
+from pudl.output.epacems import (
+    make_row_group_index,
+    read_epacems,
+    row_group_index_path,
+    write_row_group_index,
+    year_state_filter,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -23,3 +35,146 @@ def test_year_state_filter(years, states, expected_filter):
     assert (  # nosec: B101
         year_state_filter(years=years, states=states) == expected_filter
     )
+
+
+@pytest.fixture
+def epacems_parquet(tmp_path) -> tuple[pd.DataFrame, str]:
+    """Write a small EPA CEMS Parquet file with one row group per year and state."""
+    path = tmp_path / "core_epacems__hourly_emissions.parquet"
+    return _write_epacems(path, plants={"CO": [1, 2], "TX": [3, 4]}), path
+
+
+def _write_epacems(
+    path, plants: dict[str, list[int]], units: tuple[str, ...] = ("1",)
+) -> pd.DataFrame:
+    """Write EPA CEMS data for each unit of each plant, by year and state."""
+    hours = pd.date_range("2020-12-31", "2021-01-01 23:00", freq="h")
+    cems = pd.concat(
+        pd.DataFrame(
+            {
+                "plant_id_eia": plant_id,
+                "plant_id_epa": plant_id,
+                "emissions_unit_id_epa": unit_id,
+                "operating_datetime_utc": hours,
+                "year": hours.year,
+                "state": state,
+                "gross_load_mw": range(len(hours)),
+            }
+        )
+        for state, plant_ids in plants.items()
+        for plant_id in plant_ids
+        for unit_id in units
+    ).sort_values(["year", "state"], kind="stable", ignore_index=True)
+    schema = Resource.from_id("core_epacems__hourly_emissions").to_pyarrow()
+    with pq.ParquetWriter(path, schema=schema) as writer:
+        for _, year_state in cems.groupby(["year", "state"]):
+            writer.write_table(
+                pa.Table.from_pandas(
+                    year_state.reindex(columns=schema.names).pipe(
+                        apply_pudl_dtypes, group="epacems"
+                    ),
+                    schema=schema,
+                    preserve_index=False,
+                )
+            )
+    return cems
+
+
+def test_row_group_index(epacems_parquet):
+    """The index records the range of plants, times, years and states of row groups."""
+    _, path = epacems_parquet
+    index = make_row_group_index(path)
+    assert index.row_group.tolist() == [0, 1, 2, 3]
+    assert index.num_rows.tolist() == [48, 48, 48, 48]
+    assert index.plant_id_eia_min.tolist() == [1, 3, 1, 3]
+    assert index.plant_id_eia_max.tolist() == [2, 4, 2, 4]
+    assert index.state_min.tolist() == ["CO", "TX", "CO", "TX"]
+    assert index.year_max.tolist() == [2020, 2020, 2021, 2021]
+    assert (index.operating_datetime_utc_min.dt.year == index.year_min).all()
+
+    index_path = write_row_group_index(path)
+    assert index_path == row_group_index_path(path)
+    pd.testing.assert_frame_equal(pd.read_parquet(index_path), index)
+
+
+@pytest.mark.parametrize("write_index", [True, False])
+@pytest.mark.parametrize(
+    "kwargs,query",
+    [
+        ({}, "index == index"),
+        ({"plant_ids": [2, 3]}, "plant_id_eia in [2, 3]"),
+        ({"plant_ids": [5]}, "plant_id_eia == 5"),
+        ({"states": ["tx"], "years": [2021]}, "state == 'TX' and year == 2021"),
+        (
+            {"start_datetime": "2020-12-31 22:00", "end_datetime": "2021-01-01 01:00"},
+            "'2020-12-31 22:00' <= operating_datetime_utc <= '2021-01-01 01:00'",
+        ),
+        (
+            {"plant_ids": [1], "start_datetime": pd.Timestamp("2021-01-01", tz="EST")},
+            "plant_id_eia == 1 and operating_datetime_utc >= '2021-01-01 05:00'",
+        ),
+    ],
+)
+def test_read_epacems(epacems_parquet, write_index, kwargs, query):
+    """Only the requested records are read, whether or not there's an index."""
+    cems, path = epacems_parquet
+    if write_index:
+        write_row_group_index(path)
+    columns = ["plant_id_eia", "operating_datetime_utc", "gross_load_mw"]
+    actual = read_epacems(epacems_path=path, columns=columns, **kwargs)
+    expected = cems.query(query)[columns].reset_index(drop=True)
+    pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+
+
+@pytest.mark.parametrize(
+    "plants,touch_index",
+    [
+        # The same row groups, with different plants in them:
+        ({"CO": [11, 12], "TX": [13, 14]}, False),
+        # Different row groups, even if the index looks newer than the data:
+        ({"CO": [11], "NM": [12], "TX": [13, 14]}, False),
+        ({"CO": [11], "NM": [12], "TX": [13, 14]}, True),
+    ],
+)
+def test_read_epacems_stale_index(epacems_parquet, plants, touch_index):
+    """An index that doesn't describe the rewritten Parquet file isn't used."""
+    _, path = epacems_parquet
+    index_path = write_row_group_index(path)
+    cems = _write_epacems(path, plants=plants)
+    if touch_index:
+        mtime_ns = path.stat().st_mtime_ns + 1_000_000_000
+        os.utime(index_path, ns=(mtime_ns, mtime_ns))
+    columns = ["plant_id_eia", "operating_datetime_utc", "gross_load_mw"]
+    actual = read_epacems(epacems_path=path, columns=columns, plant_ids=[11, 13])
+    expected = cems.query("plant_id_eia in [11, 13]")[columns].reset_index(drop=True)
+    pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+
+
+def test_read_epacems_unit(tmp_path):
+    """A single unit of a plant can be selected."""
+    path = tmp_path / "core_epacems__hourly_emissions.parquet"
+    cems = _write_epacems(path, plants={"CO": [1, 2]}, units=("1", "2A"))
+    write_row_group_index(path)
+    columns = ["plant_id_eia", "emissions_unit_id_epa", "gross_load_mw"]
+    actual = read_epacems(
+        epacems_path=path, columns=columns, plant_ids=[2], unit_ids=["2A"]
+    )
+    expected = cems.query("plant_id_eia == 2 and emissions_unit_id_epa == '2A'")[
+        columns
+    ].reset_index(drop=True)
+    assert len(expected) == 48
+    pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+
+
+def test_read_epacems_index_older_than_data(epacems_parquet, mocker):
+    """An index that matches the Parquet file is used, even if it looks older."""
+    _, path = epacems_parquet
+    index_path = write_row_group_index(path)
+    mtime_ns = path.stat().st_mtime_ns - 1_000_000_000
+    os.utime(index_path, ns=(mtime_ns, mtime_ns))
+    make_index = mocker.patch(
+        "pudl.output.epacems.make_row_group_index", side_effect=make_row_group_index
+    )
+    actual = read_epacems(epacems_path=path, plant_ids=[1], columns=["plant_id_eia"])
+    assert (actual.plant_id_eia == 1).all()
+    make_index.assert_not_called()
@@ -365,6 +365,36 @@ class TestTagPropagation(TestForestSetup):
         ]:
             assert annotated_tags[post_yes_node]["in_rate_base"] == "yes"
 
+    def test_leafy_meta_weights_and_tags(self):
+        """Leaves inherit their root, the product of path weights, and tags."""
+        edges = [
+            (self.parent, self.child1),
+            (self.parent, self.child2),
+            (self.child1, self.grand_child11),
+            (self.child1, self.grand_child12),
+        ]
+        exploded_calcs = self._exploded_calcs_from_edges(edges).assign(
+            weight=[1, -1, -1, 2]
+        )
+        tags = pd.DataFrame([self.parent, self.grand_child12]).assign(
+            in_rate_base=["yes", "no"]
+        )
+        forest = XbrlCalculationForestFerc1(
+            exploded_calcs=exploded_calcs, seeds=[self.parent], tags=tags
+        )
+        leafy_meta = forest.leafy_meta.set_index("xbrl_factoid")
+        assert (leafy_meta.xbrl_factoid_root == self.parent.xbrl_factoid).all()
+        assert leafy_meta.weight.to_dict() == {
+            "reported_1_2": -1.0,
+            "reported_1_1_1": -1.0,
+            "reported_1_1_2": 2.0,
+        }
+        assert leafy_meta.tags_in_rate_base.to_dict() == {
+            "reported_1_2": "yes",
+            "reported_1_1_1": "yes",
+            "reported_1_1_2": "no",
+        }
+
 
 def test_get_core_ferc1_asset_description():
     valid_core_ferc1_asset_name = "core_ferc1__yearly_income_statements_sched114"
@@ -23,6 +23,7 @@ import pudl.logging_helpers
 from pudl.transform.classes import (
     AbstractTableTransformer,
     InvalidRows,
+    ReplaceWithNa,
     SpotFixes,
     StringCategories,
     StringNormalization,
@@ -37,9 +38,11 @@ from pudl.transform.classes import (
     correct_units,
     drop_invalid_rows,
     enforce_snake_case,
+    invalid_value_mask,
     multicol_transform_factory,
     normalize_strings,
     nullify_outliers,
+    replace_with_na,
     spot_fix_values,
     strip_non_numeric_values,
 )
@@ -872,6 +875,8 @@ def test_correct_units(corrections, expectation):
             corrected_df[data_col],
             check_names=False,
         )
+        # Applying all of the corrections together gives the same result:
+        assert_frame_equal(correct_units(scrambled_df, unit_corrections), corrected_df)
 
 
 @pytest.mark.parametrize(
@@ -914,6 +919,62 @@ def test_drop_invalid_rows(df, expected, params):
     assert_frame_equal(actual, expected)
 
 
+@pytest.mark.parametrize(
+    "col,invalid_values,expected",
+    [
+        # Every kind of missing value is invalid if any kind of NA is invalid
+        (pd.Series([0.0, 1.0, np.nan]), [pd.NA], [False, False, True]),
+        (pd.Series([0, 1, None], dtype="Int64"), [np.nan], [False, False, True]),
+        (pd.Series([0.5, None], dtype="Float64"), [None], [False, True]),
+        (pd.Series(["", "a", None], dtype="string"), [np.nan], [False, False, True]),
+        (
+            pd.Series(["", "a", None], dtype="string[pyarrow]"),
+            [None, ""],
+            [True, False, True],
+        ),
+        (
+            pd.Series(["", "a", None, np.nan, pd.NA], dtype=object),
+            [pd.NA],
+            [False, False, True, True, True],
+        ),
+        (pd.Series(["", "a", None], dtype="category"), [pd.NA], [False, False, True]),
+        (pd.Series(pd.to_datetime(["2020-01-01", None])), [pd.NaT], [False, True]),
+        (
+            pd.Series([True, False, None], dtype="boolean"),
+            [pd.NA],
+            [False, False, True],
+        ),
+        # ...and otherwise missing values are valid
+        (pd.Series([0.0, 1.0, np.nan]), [0], [True, False, False]),
+        (pd.Series(["", "a", None], dtype="string"), [""], [True, False, False]),
+        (pd.Series(["", "a", None], dtype="category"), [""], [True, False, False]),
+        # Numbers and strings only match columns of the same kind
+        (pd.Series([0, 1, 2]), ["0", 1], [False, True, False]),
+        (pd.Series(["0", "1"], dtype="string"), [0, "1"], [False, True]),
+        (pd.Series(["0", "1"], dtype="category"), [0, "1"], [False, True]),
+        (pd.Series(["0", 0, 1.0], dtype=object), [0, "1"], [False, True, False]),
+    ],
+)
+def test_invalid_value_mask(col, invalid_values, expected):
+    """Invalid values, including all kinds of NA, are found in all kinds of columns."""
+    df = pd.DataFrame({"col": col, "other": 0.5})
+    mask = invalid_value_mask(df, invalid_values)
+    assert mask[:, 0].tolist() == expected
+    assert not mask[:, 1].any()
+
+
+@pytest.mark.parametrize("dtype", [object, "string", "string[pyarrow]", "category"])
+def test_replace_with_na(dtype):
+    """Specified values are replaced with NA, and missing values stay missing."""
+    col = pd.Series(["", "a", None, "none", "b"], dtype=dtype)
+    actual = replace_with_na(col, ReplaceWithNa(replace_with_na=["", "none"]))
+    assert actual.dtype == col.dtype
+    assert actual.isna().tolist() == [True, False, True, True, False]
+    assert actual.dropna().tolist() == ["a", "b"]
+    # Columns without any of the values are returned as they are:
+    assert replace_with_na(col, ReplaceWithNa(replace_with_na=["c"])) is col
+
+
 @pytest.mark.parametrize(
     "df,expected,params,errors",
     [
@@ -1200,3 +1261,51 @@ def test_null_strip_non_numeric_values():
     out_col = strip_non_numeric_values(col)
     if not out_col.isnull().all():
         raise AssertionError("strip_non_numeric_values not nulling non-int values")
+
+
+def test_transform_columns():
+    """Compiled column transforms give the same results as applying each step."""
+    params = TableTransformParams.from_dict(
+        {
+            "normalize_strings": {"raw": FERC1_STRING_NORM},
+            "categorize_strings": {"raw": ANIMAL_CATS},
+            "convert_units": {"capacity_kw": KW_TO_MW},
+            "strip_non_numeric_values": {"year": {"strip_non_numeric_values": True}},
+            # Applies to the capacity column after it's renamed
+            "nullify_outliers": {"capacity_mw": VALID_CAPACITY_MW},
+            "replace_with_na": {"norm": {"replace_with_na": ["", "lion"]}},
+        }
+    )
+    steps = [
+        "normalize_strings",
+        "categorize_strings",
+        "convert_units",
+        "strip_non_numeric_values",
+        "nullify_outliers",
+        "replace_with_na",
+    ]
+    # Other tests can add columns to STRING_DATA, so select the original ones
+    df = STRING_DATA[["raw", "norm", "cat"]].assign(
+        capacity_kw=np.linspace(0, 1e7, len(STRING_DATA)),
+        year=[f"{1990 + i}?" for i in range(len(STRING_DATA))],
+        untouched=range(len(STRING_DATA)),
+    )
+    original = df.copy()
+
+    compiled = TableTransformer(params=params).transform_columns(df, steps=steps)
+    stepwise = TableTransformer(
+        params=params, compile_column_transforms=False
+    ).transform_columns(df, steps=steps)
+    assert_frame_equal(compiled, stepwise, check_like=True)
+    # Transformed columns stay in place, unless they're renamed:
+    assert list(compiled.columns) == [
+        "raw",
+        "norm",
+        "cat",
+        "year",
+        "untouched",
+        "capacity_mw",
+    ]
+    # The input is unchanged, and the columns which aren't transformed aren't copied:
+    assert_frame_equal(df, original)
+    assert np.shares_memory(compiled.untouched.to_numpy(), df.untouched.to_numpy())
@@ -0,0 +1,186 @@
+"""Unit tests for the pudl.transform.eia module."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import pudl.transform.eia as eia
+from pudl.metadata.fields import get_pudl_dtypes
+from pudl.workspace.setup import PudlPaths
+
+PLANT_LOCATIONS = pd.DataFrame(
+    {
+        "latitude": [40.7128, 34.0522, 40.7128, None, 95.0, 39.7392],
+        "longitude": [-74.006, -118.2437, -74.006, None, -100.0, -104.9903],
+        "state": ["NY", "CA", "NY", "TX", "CO", None],
+    },
+    index=[10, 11, 12, 13, 14, 15],
+)
+
+
+def test_find_timezones_matches_find_timezone():
+    """The batch timezone lookup gives the same result as the row-by-row one."""
+    expected = PLANT_LOCATIONS.apply(
+        lambda row: eia.find_timezone(
+            lng=row["longitude"], lat=row["latitude"], state=row["state"], strict=False
+        ),
+        axis=1,
+    )
+    actual = eia.find_timezones(PLANT_LOCATIONS)
+    pd.testing.assert_series_equal(expected, actual, check_names=False)
+    assert actual.tolist() == [
+        "America/New_York",
+        "America/Los_Angeles",
+        "America/New_York",
+        "America/Chicago",
+        "America/Denver",
+        "America/Denver",
+    ]
+
+
+def test_find_timezones_uses_cache(tmp_path, mocker):
+    """Coordinates that have already been resolved are read from the cache."""
+    cache_path = tmp_path / "timezones.parquet"
+    first = eia.find_timezones(PLANT_LOCATIONS, cache_path=cache_path)
+    assert len(pd.read_parquet(cache_path)) == 3
+
+    spy = mocker.spy(eia, "find_timezone")
+    second = eia.find_timezones(PLANT_LOCATIONS, cache_path=cache_path)
+    spy.assert_not_called()
+    pd.testing.assert_series_equal(first, second)
+    # The cache is moved into place, leaving no temporary files behind.
+    assert list(tmp_path.iterdir()) == [cache_path]
+
+
+def test_timezone_cache_path_is_versioned(mocker):
+    """Each version of timezonefinder gets its own timezone cache."""
+    mocker.patch("importlib.metadata.version", return_value="1.2.3")
+    assert PudlPaths().timezone_cache_path.name == (
+        "timezones-timezonefinder-1.2.3.parquet"
+    )
+
+
+def _baseline_occurrence_consistency(
+    entity_idx: list[str],
+    compiled_df: pd.DataFrame,
+    col: str,
+    cols_to_consit: list[str],
+    strictness: float = 0.7,
+) -> pd.DataFrame:
+    """The original, one column at a time, implementation of occurrence_consistency."""
+    col_df = compiled_df[entity_idx + ["report_date", col]].copy()
+    if get_pudl_dtypes(group="eia")[col] == "string":
+        nan_str_mask = (col_df[col] == "nan").fillna(False)
+        col_df.loc[nan_str_mask, col] = pd.NA
+    col_df = col_df.dropna()
+
+    if len(col_df) == 0:
+        col_df[f"{col}_is_consistent"] = pd.NA
+        col_df[f"{col}_consistent_rate"] = pd.NA
+        col_df["entity_occurences"] = pd.NA
+        return col_df
+    occur = (
+        col_df.assign(entity_occurences=1)
+        .groupby(by=cols_to_consit, observed=True)[["entity_occurences"]]
+        .count()
+        .reset_index()
+    )
+    col_df = col_df.merge(occur, on=cols_to_consit)
+    consist_df = (
+        col_df.assign(record_occurences=1)
+        .groupby(by=cols_to_consit + [col], observed=True)[["record_occurences"]]
+        .count()
+        .reset_index()
+    )
+    col_df = col_df.merge(consist_df, how="outer")
+    col_df[f"{col}_consistent_rate"] = (
+        col_df["record_occurences"] / col_df["entity_occurences"]
+    )
+    col_df[f"{col}_is_consistent"] = col_df[f"{col}_consistent_rate"] > strictness
+    return col_df.sort_values(f"{col}_consistent_rate")
+
+
+def test_occurrence_consistency_by_column():
+    """All columns are checked for consistency in one pass, ordered by their rate."""
+    compiled_df = pd.DataFrame(
+        {
+            "plant_id_eia": [1, 1, 1, 2, 2, 3],
+            "report_date": pd.to_datetime(["2020-01-01"] * 3 + ["2021-01-01"] * 3),
+            "plant_name_eia": pd.array(["a", "a", "b", "c", "nan", None], "string"),
+            "capacity_mw": [1.0, 2.0, 1.0, None, 5.0, 5.0],
+        }
+    )
+    col_dfs = eia.occurrence_consistency_by_column(
+        ["plant_id_eia"],
+        compiled_df,
+        cols_to_consit={
+            "plant_name_eia": ["plant_id_eia"],
+            "capacity_mw": ["plant_id_eia", "report_date"],
+        },
+        strictness={"plant_name_eia": 0.7, "capacity_mw": 0.5},
+    )
+    names = col_dfs["plant_name_eia"]
+    assert names.plant_name_eia.tolist() == ["b", "a", "a", "c"]
+    assert names.entity_occurences.tolist() == [3, 3, 3, 1]
+    assert names.plant_name_eia_is_consistent.tolist() == [False, False, False, True]
+    capacity = col_dfs["capacity_mw"]
+    assert capacity.capacity_mw.tolist() == [2.0, 1.0, 1.0, 5.0, 5.0]
+    assert capacity.capacity_mw_is_consistent.tolist() == [
+        False,
+        True,
+        True,
+        True,
+        True,
+    ]
+    pd.testing.assert_frame_equal(
+        names,
+        _baseline_occurrence_consistency(
+            ["plant_id_eia"], compiled_df, "plant_name_eia", ["plant_id_eia"], 0.7
+        ),
+    )
+    pd.testing.assert_frame_equal(
+        capacity,
+        _baseline_occurrence_consistency(
+            ["plant_id_eia"],
+            compiled_df,
+            "capacity_mw",
+            ["plant_id_eia", "report_date"],
+            0.5,
+        ),
+    )
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_occurrence_consistency_by_column_matches_baseline(seed):
+    """Consistency of many columns at once matches the original column by column."""
+    rng = np.random.default_rng(seed)
+    n = 500
+    compiled_df = pd.DataFrame(
+        {
+            "plant_id_eia": rng.integers(1, 40, n),
+            "report_date": pd.to_datetime(rng.choice(["2020-01-01", "2021-01-01"], n)),
+            "plant_name_eia": pd.array(
+                rng.choice(["a", "b", "nan", None], n), "string"
+            ),
+            "state": pd.array(rng.choice(["CO", "TX", None], n), "string"),
+            "capacity_mw": rng.choice([1.0, 2.0, 3.0, np.nan], n),
+        }
+    )
+    cols_to_consit = {
+        "plant_name_eia": ["plant_id_eia"],
+        "state": ["plant_id_eia"],
+        "capacity_mw": ["plant_id_eia", "report_date"],
+    }
+    col_dfs = eia.occurrence_consistency_by_column(
+        ["plant_id_eia"],
+        compiled_df,
+        cols_to_consit=cols_to_consit,
+        strictness=dict.fromkeys(cols_to_consit, 0.7),
+    )
+    for col, consit in cols_to_consit.items():
+        pd.testing.assert_frame_equal(
+            col_dfs[col],
+            _baseline_occurrence_consistency(
+                ["plant_id_eia"], compiled_df, col, consit
+            ),
+        )
@@ -6,20 +6,24 @@ from io import StringIO
 import numpy as np
 import pandas as pd
 import pytest
+from dagster import asset, materialize
 
 import pudl.logging_helpers
+from pudl.extract.ferc1 import TABLE_NAME_MAP_FERC1
 from pudl.output.ferc1 import NodeId, XbrlCalculationForestFerc1
 from pudl.settings import Ferc1Settings
 from pudl.transform.ferc1 import (
     AddColumnsWithUniformValues,
     AddColumnWithUniformValue,
     DropDuplicateRowsDbf,
+    EnergySourcesTableTransformer,
     Ferc1AbstractTableTransformer,
     Ferc1TableTransformParams,
     GroupMetricChecks,
     GroupMetricTolerances,
     MetricTolerances,
     ReconcileTableCalculations,
+    SmallPlantsTableTransformer,
     TableIdFerc1,
     UnstackBalancesToReportYearInstantXbrl,
     WideToTidy,
@@ -27,10 +31,12 @@ from pudl.transform.ferc1 import (
     assign_parent_dimensions,
     calculate_values_from_components,
     drop_duplicate_rows_dbf,
+    ferc1_transform_asset_factory,
     fill_dbf_to_xbrl_map,
     infer_intra_factoid_totals,
     make_xbrl_factoid_dimensions_explicit,
     read_dbf_to_xbrl_map,
+    read_xbrl_calculation_fixes,
     reconcile_one_type_of_table_calculations,
     unexpected_total_components,
     unstack_balances_to_report_year_instant_xbrl,
@@ -1231,3 +1237,158 @@ table_1,factoid_1,electric,total,total,table_1,factoid_1,electric,future,general
         )
     )
     assert unexpected_total_components(no_extra_components, dimensions).empty
+
+
+def test_label_row_types():
+    """Headers, totals and notes are labeled within each utility-year."""
+    df = pd.read_csv(
+        StringIO(
+            """
+utility_id_ferc1,report_year,plant_name_ferc1,net_generation_mwh,expected_row_type
+2,2019,wind plants,3.0,
+1,2020,hydro:,,header
+1,2020,keuka,10.0,
+1,2020,(c) remark,,note
+1,2020,total hydro,,note
+1,2020,rainbow,7.0,
+2,2019,(d) remark,,note
+1,2020,total plants,20.0,total
+1,2020,(a) project #2738,,note
+1,2020,steam,,header
+1,2020,cadyville,5.0,
+1,2020,(b) remark,,note
+2,2019,(e) remark,,note
+"""
+        )
+    )
+
+    df_out = SmallPlantsTableTransformer().label_row_types(df.copy())
+    df_expected = df.sort_values(["utility_id_ferc1", "report_year"], kind="stable")
+    pd.testing.assert_series_equal(
+        df_out.row_type, df_expected.expected_row_type, check_names=False
+    )
+    pd.testing.assert_series_equal(
+        df_out.is_total, df_expected.expected_row_type.eq("total"), check_names=False
+    )
+
+
+def _xbrl_fact(name: str, calculations: list[str]) -> dict:
+    return {
+        "name": name,
+        "balance": "debit",
+        "references": {"account": "101", "form_location": []},
+        "calculations": [
+            {"name": calc, "weight": 1.0, "source_tables": []} for calc in calculations
+        ],
+    }
+
+
+def test_processed_xbrl_metadata():
+    """Processed XBRL metadata can be passed to a transformer in place of the JSON."""
+    xbrl_metadata_json = {
+        "instant": [],
+        "duration": [
+            _xbrl_fact("net_generation", ["steam_generation"]),
+            _xbrl_fact("steam_generation", []),
+        ],
+    }
+    from_json = EnergySourcesTableTransformer(xbrl_metadata_json=xbrl_metadata_json)
+    processed = EnergySourcesTableTransformer(
+        xbrl_metadata=from_json.xbrl_metadata,
+        xbrl_calculations=from_json.xbrl_calculations,
+    )
+    assert not from_json.xbrl_metadata.empty
+    assert not from_json.xbrl_calculations.empty
+    pd.testing.assert_frame_equal(processed.xbrl_metadata, from_json.xbrl_metadata)
+    pd.testing.assert_frame_equal(
+        processed.xbrl_calculations, from_json.xbrl_calculations
+    )
+
+
+class _StubSteamPlantsFuelTransformer(Ferc1AbstractTableTransformer):
+    """Label the rows with the stage of the transform that saw them."""
+
+    table_id = TableIdFerc1.STEAM_PLANTS_FUEL
+
+    def process_dbf(self, raw_dbf):
+        return raw_dbf.assign(source="dbf")
+
+    def process_xbrl(self, raw_xbrl_instant, raw_xbrl_duration):
+        return raw_xbrl_duration.assign(source="xbrl")
+
+    def select_dbf_rows_by_category(self, processed_dbf, processed_xbrl, params=None):
+        return processed_dbf
+
+    def transform_main(self, df):
+        return df.assign(n_xbrl_metadata=len(self.xbrl_metadata))
+
+    def transform_end(self, df):
+        return df
+
+
+def test_ferc1_transform_asset_factory():
+    """The DBF and XBRL data are processed separately, then unified and transformed."""
+    table_name = TableIdFerc1.STEAM_PLANTS_FUEL.value
+    dbf_table = TABLE_NAME_MAP_FERC1[table_name]["dbf"]
+    xbrl_table = TABLE_NAME_MAP_FERC1[table_name]["xbrl"]
+
+    def raw_asset(name: str, value: int):
+        @asset(name=name)
+        def raw() -> pd.DataFrame:
+            return pd.DataFrame({"value": [value]})
+
+        return raw
+
+    raw_assets = [
+        raw_asset(f"raw_ferc1_dbf__{dbf_table}", 1),
+        raw_asset(f"raw_ferc1_xbrl__{xbrl_table}_instant", 2),
+        raw_asset(f"raw_ferc1_xbrl__{xbrl_table}_duration", 3),
+    ]
+
+    @asset
+    def _core_ferc1_xbrl__table_metadata():
+        return {
+            table_name: {
+                "xbrl_metadata": pd.DataFrame({"xbrl_factoid": ["a", "b"]}),
+                "xbrl_calculations": None,
+            }
+        }
+
+    transform_asset = ferc1_transform_asset_factory(
+        table_name,
+        _StubSteamPlantsFuelTransformer,
+        io_manager_key=None,
+        convert_dtypes=False,
+    )
+    # Only the final transform depends on the processed DBF and XBRL data:
+    dependencies = {
+        node.name: {dep.node for dep in deps.values()}
+        for node, deps in transform_asset.node_def.dependencies.items()
+    }
+    process_dbf, process_xbrl = (
+        f"{table_name}__process_dbf",
+        f"{table_name}__process_xbrl",
+    )
+    assert dependencies == {
+        process_dbf: set(),
+        process_xbrl: set(),
+        f"{table_name}__transform": {process_dbf, process_xbrl},
+    }
+
+    result = materialize(
+        raw_assets + [_core_ferc1_xbrl__table_metadata, transform_asset]
+    )
+    pd.testing.assert_frame_equal(
+        result.output_for_node(table_name),
+        pd.DataFrame(
+            {"value": [1, 3], "source": ["dbf", "xbrl"], "n_xbrl_metadata": [2, 2]}
+        ),
+    )
+
+
+def test_read_xbrl_calculation_fixes():
+    """The calculation fixes are read once, but each caller gets its own copy."""
+    calc_fixes = read_xbrl_calculation_fixes()
+    expected = calc_fixes.copy()
+    calc_fixes.loc[:, "weight"] = 0.0
+    pd.testing.assert_frame_equal(read_xbrl_calculation_fixes(), expected)
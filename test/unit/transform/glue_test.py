@@ -94,3 +94,28 @@ plant_id_eia,plant_id_epa,unit_id_pudl,emissions_unit_id_epa,generator_id,subpla
         actual.set_index(crosswalk_index),
         check_like=True,
     )
+
+
+def test_make_subplant_ids():
+    """Connected units and generators share a subplant_id within each plant.
+
+    Duplicate rows are a single edge of the graph, and every missing generator is a
+    distinct node, so it doesn't connect units to each other.
+    """
+    crosswalk = pd.DataFrame(
+        {
+            "plant_id_eia": [1, 1, 1, 1, 1, 2, 2, 2],
+            "emissions_unit_id_epa": ["A", "A", "B", "C", "A", "X", "X", "Y"],
+            "generator_id": ["G1", "G2", "G2", None, "G1", None, "G1", None],
+        }
+    )
+    expected = pd.DataFrame(
+        {
+            "plant_id_eia": [1, 1, 1, 1, 2, 2, 2],
+            "emissions_unit_id_epa": ["A", "A", "B", "C", "X", "X", "Y"],
+            "generator_id": ["G1", "G2", "G2", None, None, "G1", None],
+            "subplant_id": [0, 0, 0, 1, 0, 0, 1],
+        }
+    )
+    actual = glue_assets.make_subplant_ids(crosswalk)
+    pd.testing.assert_frame_equal(actual[expected.columns], expected, check_dtype=False)
@@ -0,0 +1,109 @@
+"""Unit tests for the weighted quantile functions in :mod:`pudl.validate`."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pudl import validate
+
+
+@pytest.fixture
+def weighted_df() -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    df = pd.DataFrame(
+        {
+            "report_year": rng.integers(2020, 2024, 1000),
+            "data": rng.normal(size=1000),
+            "weight": rng.random(1000),
+        }
+    )
+    df.loc[::97, "data"] = np.nan
+    df.loc[::89, "data"] = np.inf
+    return df
+
+
+def _baseline_weighted_quantile(data, weights, quantile: float) -> float:
+    """The original, one quantile at a time, implementation of weighted_quantile."""
+    df = (
+        pd.DataFrame({"data": data, "weights": weights})
+        .replace([np.inf, -np.inf], np.nan)
+        .dropna()
+        .sort_values(by="data")
+    )
+    Sn = df.weights.cumsum()  # noqa: N806
+    if len(Sn) > 0:
+        Pn = (Sn - 0.5 * df.weights) / Sn.iloc[-1]  # noqa: N806
+        return np.interp(quantile, Pn, df.data)
+    return np.nan
+
+
+def test_weighted_quantiles_hand_computed():
+    """Each value sits at the midpoint of its share of the cumulative weight."""
+    # Cumulative weights of 1, 3, 3 and 6 put the values at 1/12, 4/12, 6/12 and 9/12
+    data = pd.Series([4.0, 1.0, 3.0, 2.0])
+    weights = pd.Series([3.0, 1.0, 0.0, 2.0])
+    np.testing.assert_allclose(
+        validate.weighted_quantiles(data, weights, [0.0, 1 / 12, 0.25, 0.5, 1.0]),
+        [1.0, 1.0, 5 / 3, 3.0, 4.0],
+    )
+    assert validate.weighted_quantile(data, weights, 0.5) == 3.0
+    assert np.isnan(validate.weighted_quantile(pd.Series([np.nan]), [1.0], 0.5))
+    with pytest.raises(ValueError):
+        validate.weighted_quantiles(data, weights, [1.1])
+
+
+@pytest.mark.parametrize("ties_and_zero_weights", [False, True])
+def test_weighted_quantiles_match_baseline(weighted_df, ties_and_zero_weights):
+    """Computing many quantiles at once gives the same result as the original."""
+    if ties_and_zero_weights:
+        weighted_df["data"] = weighted_df.data.round(1)
+        weighted_df.loc[::3, "weight"] = 0.0
+    quantiles = [0.0, 0.05, 0.5, 0.95, 1.0]
+    expected = [
+        _baseline_weighted_quantile(weighted_df.data, weighted_df.weight, q)
+        for q in quantiles
+    ]
+    np.testing.assert_allclose(
+        validate.weighted_quantiles(weighted_df.data, weighted_df.weight, quantiles),
+        expected,
+        rtol=1e-12,
+    )
+
+
+def test_grouped_weighted_quantiles(weighted_df):
+    """Grouped quantiles match the quantiles of each group computed separately."""
+    quantiles = [0.1, 0.9]
+    actual = validate.grouped_weighted_quantiles(
+        weighted_df.data, weighted_df.weight, weighted_df.report_year, quantiles
+    )
+    assert actual.index.to_list() == list(weighted_df.report_year.unique())
+    for year, group in weighted_df.groupby("report_year"):
+        np.testing.assert_array_equal(
+            actual.loc[year].to_numpy(),
+            validate.weighted_quantiles(group.data, group.weight, quantiles),
+        )
+
+
+def test_sort_order_is_recomputed_after_modification(weighted_df):
+    """A cached sort order that no longer sorts the column is not reused."""
+    order = validate._sort_order(weighted_df, "data")
+    assert validate._sort_order(weighted_df, "data") is order
+    weighted_df["data"] = -weighted_df["data"]
+    new_order = validate._sort_order(weighted_df, "data")
+    assert new_order is not order
+    sorted_data = weighted_df.data.to_numpy()[new_order]
+    sorted_data = sorted_data[np.isfinite(sorted_data)]
+    assert (np.diff(sorted_data) >= 0).all()
+
+
+def test_vs_historical_with_repeated_quantile(weighted_df):
+    """The same quantile can be used for more than one of the checks."""
+    validate.vs_historical(
+        weighted_df,
+        weighted_df,
+        "data",
+        "weight",
+        low_q=0.5,
+        mid_q=0.5,
+        hi_q=0.95,
+    )